@@ -0,0 +1,244 @@
+"""Batch generation of many filtered sales reports through one compiled graph."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+from uuid import UUID, uuid4
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .db_init import initialize_database
+from .graph import app as report_app
+from .reporting import format_markdown_table
+from .state import ReportState
+
+DEFAULT_MAX_CONCURRENCY = 4
+SPEC_KEYS = ("name", "start_date", "end_date", "last_days", "region", "top_n_products", "top_n_sellers")
+
+
+@dataclass(slots=True)
+class ReportSpec:
+    """One report of a batch: its output name plus the optional graph inputs."""
+
+    name: str
+    start_date: str | None = None
+    end_date: str | None = None
+    region: str | None = None
+    top_n_products: int | None = None
+    top_n_sellers: int | None = None
+
+    def to_state(self) -> ReportState:
+        """Return the graph input for this report (unset filters are omitted)."""
+        inputs = {
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "region": self.region,
+            "top_n_products": self.top_n_products,
+            "top_n_sellers": self.top_n_sellers,
+        }
+        return ReportState(**{key: value for key, value in inputs.items() if value})
+
+    @property
+    def filename(self) -> str:
+        """File name of the report: ``name`` reduced to ASCII letters, digits and dashes."""
+        ascii_name = unicodedata.normalize("NFKD", self.name).encode("ascii", "ignore").decode("ascii")
+        return (re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-") or "relatorio") + ".md"
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Outcome of one report of a batch."""
+
+    name: str
+    latency_seconds: float
+    path: Path | None = None
+    processed_records: int | None = None
+    cache_hit: bool | None = None
+    error: str | None = None
+
+
+def _as_iso_date(value: object, field_name: str, spec_name: str) -> str | None:
+    if value in (None, ""):
+        return None
+    try:
+        return date.fromisoformat(str(value)).isoformat()
+    except ValueError as exc:
+        raise ValueError(f"Relatório {spec_name!r}: {field_name} deve estar no formato AAAA-MM-DD.") from exc
+
+
+def _as_positive_int(value: object, field_name: str, spec_name: str) -> int | None:
+    if value in (None, ""):
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ValueError(f"Relatório {spec_name!r}: {field_name} deve ser um inteiro positivo.")
+    return value
+
+
+def parse_report_specs(entries: Iterable[Mapping[str, Any]], *, today: date | None = None) -> list[ReportSpec]:
+    """Validate batch entries (keys in :data:`SPEC_KEYS`) and return their specs.
+
+    ``last_days`` replaces ``start_date``/``end_date`` with the last N days up to
+    ``today``, so one spec file can be reused by every hourly run.
+    """
+    today = today or date.today()
+    specs: list[ReportSpec] = []
+    for position, entry in enumerate(entries, start=1):
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"Relatório {position}: cada item deve ser um objeto JSON.")
+        name = str(entry.get("name") or "").strip()
+        if not name:
+            raise ValueError(f"Relatório {position}: informe o campo 'name'.")
+        unknown = sorted(set(entry) - set(SPEC_KEYS))
+        if unknown:
+            raise ValueError(f"Relatório {name!r}: campos desconhecidos: {', '.join(unknown)}.")
+        spec = ReportSpec(
+            name=name,
+            start_date=_as_iso_date(entry.get("start_date"), "start_date", name),
+            end_date=_as_iso_date(entry.get("end_date"), "end_date", name),
+            region=str(entry["region"]) if entry.get("region") else None,
+            top_n_products=_as_positive_int(entry.get("top_n_products"), "top_n_products", name),
+            top_n_sellers=_as_positive_int(entry.get("top_n_sellers"), "top_n_sellers", name),
+        )
+        last_days = _as_positive_int(entry.get("last_days"), "last_days", name)
+        if last_days is not None:
+            spec.start_date = (today - timedelta(days=last_days - 1)).isoformat()
+            spec.end_date = today.isoformat()
+        specs.append(spec)
+    filenames = [spec.filename for spec in specs]
+    duplicates = sorted({filename for filename in filenames if filenames.count(filename) > 1})
+    if duplicates:
+        raise ValueError(f"Relatórios com o mesmo arquivo de saída: {', '.join(duplicates)}.")
+    return specs
+
+
+def load_report_specs(path: str | Path, *, today: date | None = None) -> list[ReportSpec]:
+    """Read a JSON list of report specs (see :func:`parse_report_specs`)."""
+    try:
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{path}: JSON inválido ({exc}).") from exc
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: o arquivo deve conter uma lista de relatórios.")
+    return parse_report_specs(entries, today=today)
+
+
+class _JobTimer(BaseCallbackHandler):
+    """Measure each top-level graph run of a batch by its ``run_id``."""
+
+    def __init__(self) -> None:
+        self.started: dict[UUID, float] = {}
+        self.finished: dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def on_chain_start(self, serialized, inputs, *, run_id: UUID, parent_run_id: UUID | None = None, **kwargs):
+        if parent_run_id is None:
+            with self._lock:
+                self.started[run_id] = time.perf_counter()
+
+    def on_chain_end(self, outputs, *, run_id: UUID, parent_run_id: UUID | None = None, **kwargs):
+        if parent_run_id is None:
+            with self._lock:
+                self.finished[run_id] = time.perf_counter()
+
+    on_chain_error = on_chain_end
+
+    def latency(self, run_id: UUID) -> float:
+        with self._lock:
+            started, finished = self.started.get(run_id), self.finished.get(run_id)
+        return finished - started if started is not None and finished is not None else 0.0
+
+
+@dataclass(slots=True)
+class BatchReport:
+    """All results of a batch plus its wall-clock duration."""
+
+    results: list[BatchResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[BatchResult]:
+        return [result for result in self.results if result.error is not None]
+
+
+def run_batch(
+    specs: Sequence[ReportSpec],
+    output_dir: str | Path,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    app=None,
+) -> BatchReport:
+    """Generate every report of ``specs`` with ``app.batch`` and write them to ``output_dir``.
+
+    At most ``max_concurrency`` graph runs are in flight. The database is initialized
+    once and all jobs share the process-wide connection pools and insight cache; a
+    failing job is reported in its :class:`BatchResult` without stopping the others.
+    """
+    app = app or report_app
+    initialize_database()
+    destination = Path(output_dir)
+    destination.mkdir(parents=True, exist_ok=True)
+    timer = _JobTimer()
+    run_ids = [uuid4() for _ in specs]
+    configs = [
+        {"run_id": run_id, "run_name": spec.name, "callbacks": [timer], "max_concurrency": max_concurrency}
+        for spec, run_id in zip(specs, run_ids)
+    ]
+    started = time.perf_counter()
+    outputs = app.batch([spec.to_state() for spec in specs], configs, return_exceptions=True)
+    report = BatchReport(elapsed_seconds=time.perf_counter() - started)
+    for spec, run_id, output in zip(specs, run_ids, outputs):
+        result = BatchResult(name=spec.name, latency_seconds=timer.latency(run_id))
+        if isinstance(output, Exception):
+            result.error = f"{type(output).__name__}: {output}"
+        else:
+            metadata = output.get("metadata", {})
+            result.path = destination / spec.filename
+            result.path.write_text(output["report_markdown"] + "\n", encoding="utf-8")
+            result.processed_records = output.get("processed_records")
+            result.cache_hit = metadata.get("cache_hit")
+        report.results.append(result)
+    return report
+
+
+def format_batch_summary(report: BatchReport) -> str:
+    """Return the per-job latency table printed after a batch."""
+    rows = [
+        (
+            result.name,
+            f"{result.latency_seconds:.2f} s",
+            {True: "sim", False: "não"}.get(result.cache_hit, "-"),
+            str(result.path) if result.path else f"erro: {result.error}",
+        )
+        for result in report.results
+    ]
+    latencies = sorted(result.latency_seconds for result in report.results)
+    median = latencies[len(latencies) // 2] if latencies else 0.0
+    return "\n".join(
+        [
+            format_markdown_table(("Relatório", "Latência", "Cache", "Arquivo"), rows),
+            "",
+            f"- Relatórios: {len(report.results)} ({len(report.failed)} com erro)",
+            f"- Latência p50/máx: {median:.2f} s / {max(latencies, default=0.0):.2f} s",
+            f"- Tempo total do lote: {report.elapsed_seconds:.2f} s",
+        ]
+    )
+
+
+__all__ = [
+    "BatchReport",
+    "BatchResult",
+    "DEFAULT_MAX_CONCURRENCY",
+    "ReportSpec",
+    "format_batch_summary",
+    "load_report_specs",
+    "parse_report_specs",
+    "run_batch",
+]
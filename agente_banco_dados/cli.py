@@ -2,13 +2,232 @@
 
 from __future__ import annotations
 
-from agente_banco_dados.db_init import initialize_database
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+from agente_banco_dados.batch import DEFAULT_MAX_CONCURRENCY, format_batch_summary, load_report_specs, run_batch
+from agente_banco_dados.config import TOP_N_PRODUCTS, TOP_N_SELLERS
+from agente_banco_dados.db_init import close_pools, get_pool, initialize_database, refresh_sales_totals
 from agente_banco_dados.graph import app
+from agente_banco_dados.ingest import DEFAULT_CHUNK_SIZE, IngestionReport, ingest_sales_csv
+from agente_banco_dados.reporting import write_markdown_report
+from agente_banco_dados.synthetic import populate_synthetic
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Prepare the SQLite dataset and print the generated Markdown report."""
 
+    args = _parse_args(argv)
+    try:
+        if args.importar_vendas is not None:
+            _run_ingestion(args.importar_vendas, chunk_size=args.tamanho_lote)
+        elif args.gerar_vendas is not None:
+            _run_synthetic(args)
+        elif args.atualizar_totais:
+            _run_totals_refresh()
+        elif args.relatorios is not None:
+            _run_batch(args.relatorios, args.saida, max_concurrency=args.concorrencia)
+        elif args.exportar is not None:
+            _run_export(args.exportar, _report_inputs(args))
+        else:
+            _run_report(_report_inputs(args))
+    finally:
+        close_pools()
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Relatório de vendas a partir do banco SQLite local.")
+    parser.add_argument(
+        "--importar-vendas",
+        type=Path,
+        metavar="CSV",
+        help=(
+            "Importa vendas de um CSV (colunas order_code, sku, seller_code, sale_date, "
+            "quantity, unit_price) em vez de gerar o relatório."
+        ),
+    )
+    parser.add_argument(
+        "--gerar-vendas",
+        type=int,
+        metavar="N",
+        help="Gera N vendas sintéticas determinísticas (popularidade Zipf) em vez de gerar o relatório.",
+    )
+    parser.add_argument("--produtos", type=int, default=1_000, help="Produtos sintéticos (padrão 1000).")
+    parser.add_argument("--vendedores", type=int, default=100, help="Vendedores sintéticos (padrão 100).")
+    parser.add_argument("--semente", type=int, default=42, help="Semente dos dados sintéticos (padrão 42).")
+    parser.add_argument(
+        "--atualizar-totais",
+        action="store_true",
+        help="Recalcula as tabelas product_totals e seller_totals a partir de sales.",
+    )
+    parser.add_argument("--inicio", metavar="AAAA-MM-DD", help="Data inicial (inclusiva) do relatório.")
+    parser.add_argument("--fim", metavar="AAAA-MM-DD", help="Data final (inclusiva) do relatório.")
+    parser.add_argument(
+        "--ultimos-dias",
+        type=int,
+        metavar="N",
+        help="Relatório dos últimos N dias até hoje (substitui --inicio e --fim).",
+    )
+    parser.add_argument("--regiao", help="Restringe o relatório aos vendedores desta região.")
+    parser.add_argument(
+        "--top-produtos",
+        type=int,
+        metavar="N",
+        help=f"Quantidade de produtos no ranking (padrão {TOP_N_PRODUCTS}).",
+    )
+    parser.add_argument(
+        "--top-vendedores",
+        type=int,
+        metavar="N",
+        help=f"Quantidade de vendedores no ranking (padrão {TOP_N_SELLERS}).",
+    )
+    parser.add_argument(
+        "--exportar",
+        type=Path,
+        metavar="ARQUIVO",
+        help="Grava as tabelas do relatório em ARQUIVO linha a linha, sem chamar o LLM.",
+    )
+    parser.add_argument(
+        "--relatorios",
+        type=Path,
+        metavar="JSON",
+        help=(
+            "Gera em lote os relatórios de uma lista JSON (campos name, start_date, end_date, "
+            "last_days, region, top_n_products, top_n_sellers), um arquivo por relatório."
+        ),
+    )
+    parser.add_argument(
+        "--saida",
+        type=Path,
+        default=Path("relatorios"),
+        metavar="DIRETORIO",
+        help="Diretório dos relatórios gerados em lote (padrão ./relatorios).",
+    )
+    parser.add_argument(
+        "--concorrencia",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        metavar="N",
+        help=f"Relatórios gerados em paralelo no modo em lote (padrão {DEFAULT_MAX_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--tamanho-lote",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="LINHAS",
+        help=f"Linhas por transação na importação (padrão {DEFAULT_CHUNK_SIZE}).",
+    )
+    args = parser.parse_args(argv)
+    if args.tamanho_lote <= 0:
+        parser.error("--tamanho-lote deve ser maior que zero.")
+    if args.concorrencia <= 0:
+        parser.error("--concorrencia deve ser maior que zero.")
+    if args.importar_vendas is not None and args.gerar_vendas is not None:
+        parser.error("use --importar-vendas ou --gerar-vendas, não ambos.")
+    if args.ultimos_dias is not None and args.ultimos_dias <= 0:
+        parser.error("--ultimos-dias deve ser maior que zero.")
+    for option in ("top_produtos", "top_vendedores"):
+        if getattr(args, option) is not None and getattr(args, option) <= 0:
+            parser.error(f"--{option.replace('_', '-')} deve ser maior que zero.")
+    for option in ("inicio", "fim"):
+        value = getattr(args, option)
+        try:
+            if value is not None:
+                date.fromisoformat(value)
+        except ValueError:
+            parser.error(f"--{option} deve estar no formato AAAA-MM-DD.")
+    if min(args.produtos, args.vendedores) <= 0 or (args.gerar_vendas is not None and args.gerar_vendas < 0):
+        parser.error("--gerar-vendas, --produtos e --vendedores devem ser positivos.")
+    return args
+
+
+def _print_progress(rows: int, elapsed: float) -> None:
+    rate = rows / elapsed if elapsed else 0.0
+    print(f"- {rows} linhas ({rate:,.0f} linhas/s)", flush=True)
+
+
+def _run_ingestion(path: Path, *, chunk_size: int) -> None:
+    initialize_database()
+    print(f"Importando vendas de {path}...")
+    _print_load_summary(ingest_sales_csv(path, chunk_size=chunk_size, progress=_print_progress))
+
+
+def _run_synthetic(args: argparse.Namespace) -> None:
+    initialize_database()
+    print(
+        f"Gerando {args.gerar_vendas} vendas sintéticas "
+        f"({args.produtos} produtos, {args.vendedores} vendedores, semente {args.semente})..."
+    )
+    report = populate_synthetic(
+        products=args.produtos,
+        sellers=args.vendedores,
+        sales=args.gerar_vendas,
+        seed=args.semente,
+        chunk_size=args.tamanho_lote,
+        progress=_print_progress,
+    )
+    _print_load_summary(report)
+
+
+def _run_totals_refresh() -> None:
+    initialize_database()
+    with get_pool().connection() as connection:
+        refresh_sales_totals(connection)
+        products, sellers = connection.execute(
+            "SELECT (SELECT COUNT(*) FROM product_totals), (SELECT COUNT(*) FROM seller_totals)"
+        ).fetchone()
+    print(f"Totais atualizados: {products} produtos e {sellers} vendedores.")
+
+
+def _print_load_summary(report: IngestionReport) -> None:
+    print("\nResumo da importação:")
+    print(f"- Linhas lidas: {report.rows_read}")
+    print(f"- Vendas inseridas: {report.rows_inserted}")
+    print(f"- Linhas ignoradas (códigos desconhecidos ou valores inválidos): {report.rows_skipped}")
+    print(f"- Linhas ignoradas (order_code já existente): {report.rows_duplicate}")
+    print(f"- Tempo total: {report.elapsed_seconds:.2f} s ({report.rows_per_second:,.0f} linhas/s)")
+
+
+def _report_inputs(args: argparse.Namespace) -> dict[str, str | int]:
+    inputs = {
+        "start_date": args.inicio,
+        "end_date": args.fim,
+        "region": args.regiao,
+        "top_n_products": args.top_produtos,
+        "top_n_sellers": args.top_vendedores,
+    }
+    if args.ultimos_dias is not None:
+        today = date.today()
+        inputs["start_date"] = (today - timedelta(days=args.ultimos_dias - 1)).isoformat()
+        inputs["end_date"] = today.isoformat()
+    return {key: value for key, value in inputs.items() if value}
+
+
+def _run_batch(specs_path: Path, output_dir: Path, *, max_concurrency: int) -> None:
+    specs = load_report_specs(specs_path)
+    print(f"Gerando {len(specs)} relatórios em {output_dir} (até {max_concurrency} em paralelo)...")
+    report = run_batch(specs, output_dir, max_concurrency=max_concurrency)
+    print(format_batch_summary(report))
+    if report.failed:
+        raise SystemExit(1)
+
+
+def _run_export(path: Path, inputs: dict[str, str | int]) -> None:
+    initialize_database()
+    with path.open("w", encoding="utf-8") as sink:
+        written = write_markdown_report(
+            sink,
+            top_products=inputs.get("top_n_products", TOP_N_PRODUCTS),
+            top_sellers=inputs.get("top_n_sellers", TOP_N_SELLERS),
+            start_date=inputs.get("start_date"),
+            end_date=inputs.get("end_date"),
+            region=inputs.get("region"),
+        )
+    print(f"Relatório exportado para {path}: {written['products']} produtos e {written['sellers']} vendedores.")
+
+
+def _run_report(inputs: dict[str, str | int] | None = None) -> None:
     counts = initialize_database()
     print(
         "Database ready with "
@@ -17,7 +236,7 @@ def main() -> None:
         f"{counts['sales']} sales records."
     )
     print("Relatório gerado exclusivamente a partir do banco SQLite local.")
-    result = app.invoke({})
+    result = app.invoke(inputs or {})
     print(result["report_markdown"])
 
     metadata = result.get("metadata", {})
@@ -25,6 +244,8 @@ def main() -> None:
     latency = metadata.get("llm_latency_seconds", result.get("llm_latency_seconds"))
     data_source = metadata.get("data_source")
     print("\nResumo da execução:")
+    if metadata.get("period"):
+        print(f"- Período: {metadata['period']}")
     if processed is not None:
         print(f"- Registros processados: {processed}")
     if latency is not None:
@@ -0,0 +1,311 @@
+"""Columnar NumPy engine ranking products and sellers from cached copies of ``sales``.
+
+The ``sales`` rows are read in large chunks into one array per column, saved as
+``.npy`` files and memory-mapped by later reports. The files live in a directory named
+after a fingerprint of the table (schema version, row counter, highest ``sale_id`` and
+update counter), so any insert, delete or update makes the next report rebuild them.
+Group-by totals come from :func:`numpy.bincount` and are returned with the same
+``ProductSummary``/``SellerSummary`` contract as the SQL queries of
+:mod:`agente_banco_dados.reporting`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from .config import COLUMNAR_CACHE_DIR, TOP_N_PRODUCTS, TOP_N_SELLERS
+from .db_init import ConnectionPool, get_pool
+from .state import ProductSummary, SellerSummary
+
+FETCH_CHUNK_SIZE = 100_000
+EPOCH = date(1970, 1, 1)
+# Sales whose date SQLite cannot parse get this day, before any period filter.
+UNKNOWN_DAY = np.iinfo(np.int32).min
+
+COLUMN_DTYPES: dict[str, type[np.generic]] = {
+    "product_id": np.int64,
+    "seller_id": np.int64,
+    "sale_day": np.int32,
+    "quantity": np.int64,
+    "revenue": np.float64,
+}
+
+FETCH_SALES_SQL = f"""
+    SELECT
+        product_id,
+        seller_id,
+        COALESCE(CAST(julianday(sale_date) - julianday('1970-01-01') AS INTEGER), {UNKNOWN_DAY}) AS sale_day,
+        quantity,
+        quantity * unit_price AS revenue
+    FROM sales
+"""
+
+FINGERPRINT_SQL = """
+    SELECT
+        (SELECT user_version FROM pragma_user_version) AS schema_version,
+        (SELECT row_count FROM table_stats WHERE table_name = 'sales') AS row_count,
+        (SELECT MAX(sale_id) FROM sales) AS last_sale_id,
+        (SELECT version FROM table_versions WHERE table_name = 'sales') AS version
+"""
+
+_STAGING_PREFIX = ".staging-"
+# Other processes may still be loading an older snapshot: only directories this much
+# older than the one just published are removed.
+STALE_CACHE_GRACE_SECONDS = 60.0
+_BUILD_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class SalesColumns:
+    """Memory-mapped ``sales`` columns, one entry per sale in ``sale_id`` order."""
+
+    product_id: np.ndarray
+    seller_id: np.ndarray
+    sale_day: np.ndarray
+    quantity: np.ndarray
+    revenue: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.product_id)
+
+
+def default_cache_dir(database: Path) -> Path:
+    """Return the column cache directory for ``database`` (``AGENT_COLUMNAR_CACHE_DIR`` wins)."""
+    return COLUMNAR_CACHE_DIR or database.with_name(f"{database.name}.columnar")
+
+
+def sales_fingerprint(connection: sqlite3.Connection) -> str:
+    """Return a short hash that changes whenever rows of ``sales`` are inserted, deleted or updated."""
+    row = connection.execute(FINGERPRINT_SQL).fetchone()
+    return hashlib.sha256(repr(tuple(row)).encode("utf-8")).hexdigest()[:16]
+
+
+def fetch_sales_columns(connection: sqlite3.Connection, chunk_size: int = FETCH_CHUNK_SIZE) -> dict[str, np.ndarray]:
+    """Read ``sales`` with ``fetchmany`` into one array per column of :data:`COLUMN_DTYPES`.
+
+    Each column is preallocated with its own dtype and filled chunk by chunk, so ids and
+    quantities never pass through ``float64``. Call it inside a transaction: the row
+    count and the rows must come from the same snapshot.
+    """
+    count = connection.execute("SELECT COUNT(*) FROM sales").fetchone()[0]
+    columns = {name: np.empty(count, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+    cursor = connection.cursor()
+    cursor.row_factory = None
+    cursor.execute(FETCH_SALES_SQL)
+    filled = 0
+    while rows := cursor.fetchmany(chunk_size):
+        end = filled + len(rows)
+        if end > count:
+            raise RuntimeError("A tabela sales mudou durante a leitura colunar.")
+        for position, (name, values) in enumerate(columns.items()):
+            values[filled:end] = np.fromiter((row[position] for row in rows), dtype=values.dtype, count=len(rows))
+        filled = end
+    if filled != count:
+        raise RuntimeError("A tabela sales mudou durante a leitura colunar.")
+    return columns
+
+
+def _publish(connection: sqlite3.Connection, cache_dir: Path, directory: Path) -> None:
+    """Write the column files to a staging directory, then rename it into place."""
+    columns = fetch_sales_columns(connection)
+    # Staged only once the rows are in memory, so a slow read never looks abandoned.
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=_STAGING_PREFIX, dir=cache_dir))
+    try:
+        for name, values in columns.items():
+            np.save(staging / f"{name}.npy", values)
+        try:
+            os.replace(staging, directory)
+        except OSError:
+            if not directory.is_dir():  # another process publishing the same data is fine
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    _remove_stale(cache_dir, directory)
+
+
+def _remove_stale(cache_dir: Path, published: Path) -> None:
+    """Remove cache (and abandoned staging) directories older than ``published`` by the grace period."""
+    try:
+        cutoff = published.stat().st_mtime - STALE_CACHE_GRACE_SECONDS
+    except FileNotFoundError:
+        return
+    for stale in cache_dir.iterdir():
+        try:
+            if stale != published and stale.stat().st_mtime < cutoff:
+                shutil.rmtree(stale, ignore_errors=True)
+        except FileNotFoundError:
+            continue
+
+
+def _current_directory(connection: sqlite3.Connection, cache_dir: Path) -> Path:
+    """Return the directory matching the current fingerprint, publishing it if missing.
+
+    The fingerprint and the rows are read in one transaction, so the files always
+    match the fingerprint that names their directory.
+    """
+    began = not connection.in_transaction
+    if began:
+        connection.execute("BEGIN")
+    try:
+        directory = cache_dir / sales_fingerprint(connection)
+        with _BUILD_LOCK:
+            if not directory.is_dir():
+                _publish(connection, cache_dir, directory)
+    finally:
+        if began:
+            connection.rollback()
+    return directory
+
+
+def _open_columns(directory: Path) -> SalesColumns:
+    return SalesColumns(**{name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in COLUMN_DTYPES})
+
+
+def load_sales_columns(connection: sqlite3.Connection, cache_dir: Path, *, attempts: int = 3) -> SalesColumns:
+    """Return the ``sales`` columns, rebuilding the cache under ``cache_dir`` when stale.
+
+    A directory that disappears between publishing and loading (removed by another
+    process) is rebuilt, up to ``attempts`` tries in total.
+    """
+    for _ in range(attempts - 1):
+        directory = _current_directory(connection, cache_dir)
+        try:
+            return _open_columns(directory)
+        except FileNotFoundError:
+            shutil.rmtree(directory, ignore_errors=True)
+    return _open_columns(_current_directory(connection, cache_dir))
+
+
+def _sale_mask(
+    columns: SalesColumns,
+    start_date: date | None,
+    end_date: date | None,
+    sellers_in_region: np.ndarray | None,
+) -> np.ndarray | None:
+    """Boolean mask of the sales matching the filters (``None`` when unfiltered)."""
+    mask = None
+    if start_date is not None:
+        mask = columns.sale_day >= (start_date - EPOCH).days
+    if end_date is not None:
+        upper = columns.sale_day <= (end_date - EPOCH).days
+        mask = upper if mask is None else mask & upper
+    if sellers_in_region is not None:
+        in_region = sellers_in_region[columns.seller_id]
+        mask = in_region if mask is None else mask & in_region
+    return mask
+
+
+def _group_totals(
+    keys: np.ndarray,
+    columns: SalesColumns,
+    mask: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the keys with sales and the per-key quantity and revenue sums."""
+    quantity, revenue = columns.quantity, columns.revenue
+    if mask is not None:
+        keys, quantity, revenue = keys[mask], quantity[mask], revenue[mask]
+    present = np.flatnonzero(np.bincount(keys))
+    return present, np.bincount(keys, weights=quantity), np.bincount(keys, weights=revenue)
+
+
+def _rank(ids: np.ndarray, primary: np.ndarray, secondary: np.ndarray, limit: int) -> list[int]:
+    """Order ``ids`` by ``primary`` then ``secondary`` descending (ties by id) and keep ``limit``."""
+    order = np.lexsort((ids, -secondary[ids], -primary[ids]))
+    return ids[order[: max(limit, 0)]].tolist()
+
+
+def _region_mask(rows: list[sqlite3.Row], region: str | None, columns: SalesColumns) -> np.ndarray | None:
+    """Lookup table ``seller_id -> seller is in region`` (``None`` without a region filter)."""
+    if not region:
+        return None
+    size = max([row["seller_id"] for row in rows] + [int(columns.seller_id.max()) if len(columns) else 0]) + 1
+    in_region = np.zeros(size, dtype=bool)
+    in_region[[row["seller_id"] for row in rows if row["region"] == region]] = True
+    return in_region
+
+
+def _load(pool: ConnectionPool | None, cache_dir: Path | None, products: bool):
+    pool = pool or get_pool(read_only=True)
+    with pool.connection() as connection:
+        columns = load_sales_columns(connection, cache_dir or default_cache_dir(pool.path))
+        sellers = connection.execute("SELECT seller_id, name, region FROM sellers").fetchall()
+        names = (
+            {row["product_id"]: row["name"] for row in connection.execute("SELECT product_id, name FROM products")}
+            if products
+            else {}
+        )
+    return columns, sellers, names
+
+
+def top_products(
+    limit: int = TOP_N_PRODUCTS,
+    *,
+    pool: ConnectionPool | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    region: str | None = None,
+    cache_dir: Path | None = None,
+) -> list[ProductSummary]:
+    """Return the top products by quantity (then revenue), like ``query_top_products``.
+
+    The region filter uses each seller's current region, like the rollups.
+    """
+    columns, sellers, names = _load(pool, cache_dir, products=True)
+    mask = _sale_mask(columns, start_date, end_date, _region_mask(sellers, region, columns))
+    present, quantities, revenues = _group_totals(columns.product_id, columns, mask)
+    return [
+        ProductSummary(
+            product_name=names[product_id],
+            total_quantity=int(quantities[product_id]),
+            total_revenue=round(float(revenues[product_id]), 2),
+        )
+        for product_id in _rank(present, quantities, revenues, limit)
+    ]
+
+
+def top_sellers(
+    limit: int = TOP_N_SELLERS,
+    *,
+    pool: ConnectionPool | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    region: str | None = None,
+    cache_dir: Path | None = None,
+) -> list[SellerSummary]:
+    """Return the top sellers by revenue (then quantity), like ``query_top_sellers``."""
+    columns, sellers, _ = _load(pool, cache_dir, products=False)
+    mask = _sale_mask(columns, start_date, end_date, _region_mask(sellers, region, columns))
+    present, quantities, revenues = _group_totals(columns.seller_id, columns, mask)
+    by_id = {row["seller_id"]: row for row in sellers}
+    return [
+        SellerSummary(
+            seller_name=by_id[seller_id]["name"],
+            region=by_id[seller_id]["region"] or "Sem região",
+            total_quantity=int(quantities[seller_id]),
+            total_revenue=round(float(revenues[seller_id]), 2),
+        )
+        for seller_id in _rank(present, revenues, quantities, limit)
+    ]
+
+
+__all__ = [
+    "COLUMN_DTYPES",
+    "SalesColumns",
+    "default_cache_dir",
+    "fetch_sales_columns",
+    "load_sales_columns",
+    "sales_fingerprint",
+    "top_products",
+    "top_sellers",
+]
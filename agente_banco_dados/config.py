@@ -14,7 +14,7 @@ load_dotenv()
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
-DB_PATH = DATA_DIR / "sales.db"
+DB_PATH = Path(os.getenv("AGENT_DB_PATH") or DATA_DIR / "sales.db")
 
 MIN_SEED_PRODUCTS = 5
 MIN_SEED_SELLERS = 3
@@ -23,6 +23,23 @@ MIN_SEED_SALES = 20
 TOP_N_PRODUCTS = 3
 TOP_N_SELLERS = 3
 
+DB_POOL_SIZE = max(1, int(os.getenv("AGENT_DB_POOL_SIZE", "4")))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("AGENT_DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_TUNING_PROFILE = os.getenv("AGENT_DB_TUNING", "").strip().lower()
+
+# Cached LLM insights live in their own SQLite file next to the sales database; TTL 0 disables.
+INSIGHT_CACHE_PATH = Path(os.getenv("AGENT_INSIGHT_CACHE_PATH") or DB_PATH.with_name("insight_cache.db"))
+INSIGHT_CACHE_TTL_SECONDS = float(os.getenv("AGENT_INSIGHT_CACHE_TTL_SECONDS", str(24 * 60 * 60)))
+
+# "sales" aggregates the raw table on every report; "totals" reads the trigger-maintained tables;
+# "columnar" aggregates cached NumPy copies of ``sales`` (see ``columnar.py``).
+REPORT_SOURCES = ("sales", "totals", "columnar")
+REPORT_SOURCE = os.getenv("AGENT_REPORT_SOURCE", "sales").strip().lower() or "sales"
+
+# Directory holding the ``.npy`` column files of the "columnar" source; empty means
+# ``<database>.columnar`` next to the database file in use.
+COLUMNAR_CACHE_DIR = Path(os.getenv("AGENT_COLUMNAR_CACHE_DIR")) if os.getenv("AGENT_COLUMNAR_CACHE_DIR") else None
+
 DEFAULT_MODEL_ID = "gemini-2.5-flash"
 
 
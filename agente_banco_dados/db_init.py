@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import atexit
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
-from .config import DATA_DIR, DB_PATH, MIN_SEED_PRODUCTS, MIN_SEED_SELLERS, MIN_SEED_SALES
+from .config import (
+    DATA_DIR,
+    DB_PATH,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_TUNING_PROFILE,
+    MIN_SEED_PRODUCTS,
+    MIN_SEED_SELLERS,
+    MIN_SEED_SALES,
+)
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS products (
@@ -37,6 +50,258 @@ CREATE TABLE IF NOT EXISTS sales (
 );
 """
 
+SALES_INDEXES: dict[str, str] = {
+    "idx_sales_product_cover": "CREATE INDEX IF NOT EXISTS idx_sales_product_cover "
+    "ON sales(product_id, quantity, unit_price)",
+    "idx_sales_seller_cover": "CREATE INDEX IF NOT EXISTS idx_sales_seller_cover "
+    "ON sales(seller_id, quantity, unit_price)",
+    "idx_sales_sale_date": "CREATE INDEX IF NOT EXISTS idx_sales_sale_date ON sales(sale_date)",
+}
+
+# Materialized per-product and per-seller totals, ranked by indexes matching the report ORDER BY.
+TOTALS_SQL = """
+CREATE TABLE IF NOT EXISTS product_totals (
+    product_id INTEGER PRIMARY KEY REFERENCES products(product_id),
+    total_quantity INTEGER NOT NULL,
+    total_revenue REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS seller_totals (
+    seller_id INTEGER PRIMARY KEY REFERENCES sellers(seller_id),
+    total_quantity INTEGER NOT NULL,
+    total_revenue REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_product_totals_rank
+    ON product_totals(total_quantity DESC, total_revenue DESC);
+CREATE INDEX IF NOT EXISTS idx_seller_totals_rank
+    ON seller_totals(total_revenue DESC, total_quantity DESC);
+"""
+
+_ADD_TOTALS = """
+    INSERT INTO product_totals (product_id, total_quantity, total_revenue)
+    VALUES (NEW.product_id, NEW.quantity, NEW.quantity * NEW.unit_price)
+    ON CONFLICT(product_id) DO UPDATE SET
+        total_quantity = total_quantity + excluded.total_quantity,
+        total_revenue = total_revenue + excluded.total_revenue;
+    INSERT INTO seller_totals (seller_id, total_quantity, total_revenue)
+    VALUES (NEW.seller_id, NEW.quantity, NEW.quantity * NEW.unit_price)
+    ON CONFLICT(seller_id) DO UPDATE SET
+        total_quantity = total_quantity + excluded.total_quantity,
+        total_revenue = total_revenue + excluded.total_revenue;
+"""
+
+_SUBTRACT_TOTALS = """
+    UPDATE product_totals
+    SET total_quantity = total_quantity - OLD.quantity,
+        total_revenue = total_revenue - OLD.quantity * OLD.unit_price
+    WHERE product_id = OLD.product_id;
+    DELETE FROM product_totals WHERE product_id = OLD.product_id AND total_quantity <= 0;
+    UPDATE seller_totals
+    SET total_quantity = total_quantity - OLD.quantity,
+        total_revenue = total_revenue - OLD.quantity * OLD.unit_price
+    WHERE seller_id = OLD.seller_id;
+    DELETE FROM seller_totals WHERE seller_id = OLD.seller_id AND total_quantity <= 0;
+"""
+
+# Triggers keeping the totals current on every write to ``sales`` (bulk loads drop them
+# and call :func:`refresh_sales_totals` once instead).
+TOTALS_TRIGGERS: dict[str, str] = {
+    "trg_sales_totals_insert": "CREATE TRIGGER IF NOT EXISTS trg_sales_totals_insert "
+    f"AFTER INSERT ON sales BEGIN {_ADD_TOTALS} END",
+    "trg_sales_totals_delete": "CREATE TRIGGER IF NOT EXISTS trg_sales_totals_delete "
+    f"AFTER DELETE ON sales BEGIN {_SUBTRACT_TOTALS} END",
+    "trg_sales_totals_update": "CREATE TRIGGER IF NOT EXISTS trg_sales_totals_update "
+    "AFTER UPDATE OF product_id, seller_id, quantity, unit_price ON sales "
+    f"BEGIN {_SUBTRACT_TOTALS} {_ADD_TOTALS} END",
+}
+
+REFRESH_TOTALS_SQL = """
+DELETE FROM product_totals;
+DELETE FROM seller_totals;
+INSERT INTO product_totals (product_id, total_quantity, total_revenue)
+SELECT product_id, SUM(quantity), SUM(quantity * unit_price) FROM sales GROUP BY product_id;
+INSERT INTO seller_totals (seller_id, total_quantity, total_revenue)
+SELECT seller_id, SUM(quantity), SUM(quantity * unit_price) FROM sales GROUP BY seller_id;
+"""
+
+# Daily and monthly rollups backing date-range and region filtered reports. Key columns
+# map to SQL expressions over a ``sales`` row (``{row}`` is ``NEW``, ``OLD`` or ``s``);
+# the product rollups are keyed by the seller's current region (``''`` when unset) and
+# are re-keyed by :data:`REGION_TRIGGERS` when a seller moves.
+_SALE_REGION = "COALESCE((SELECT region FROM sellers WHERE seller_id = {row}.seller_id), '')"
+ROLLUPS: dict[str, dict[str, str]] = {
+    "daily_product_sales": {
+        "day": "substr({row}.sale_date, 1, 10)",
+        "region": _SALE_REGION,
+        "product_id": "{row}.product_id",
+    },
+    "monthly_product_sales": {
+        "month": "substr({row}.sale_date, 1, 7)",
+        "region": _SALE_REGION,
+        "product_id": "{row}.product_id",
+    },
+    "daily_seller_sales": {"day": "substr({row}.sale_date, 1, 10)", "seller_id": "{row}.seller_id"},
+    "monthly_seller_sales": {"month": "substr({row}.sale_date, 1, 7)", "seller_id": "{row}.seller_id"},
+}
+
+
+def _rollup_table_sql(table: str, keys: dict[str, str]) -> str:
+    columns = "".join(f"    {key} {'INTEGER' if key.endswith('_id') else 'TEXT'} NOT NULL,\n" for key in keys)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table} (\n{columns}"
+        "    total_quantity INTEGER NOT NULL,\n"
+        "    total_revenue REAL NOT NULL,\n"
+        f"    PRIMARY KEY ({', '.join(keys)})\n) WITHOUT ROWID;\n"
+    )
+
+
+def _rollup_add_sql(table: str, keys: dict[str, str]) -> str:
+    values = ", ".join(expression.format(row="NEW") for expression in keys.values())
+    return (
+        f"INSERT INTO {table} ({', '.join(keys)}, total_quantity, total_revenue) "
+        f"VALUES ({values}, NEW.quantity, NEW.quantity * NEW.unit_price) "
+        f"ON CONFLICT({', '.join(keys)}) DO UPDATE SET "
+        "total_quantity = total_quantity + excluded.total_quantity, "
+        "total_revenue = total_revenue + excluded.total_revenue;"
+    )
+
+
+def _rollup_subtract_sql(table: str, keys: dict[str, str]) -> str:
+    match = " AND ".join(f"{key} = {expression.format(row='OLD')}" for key, expression in keys.items())
+    return (
+        f"UPDATE {table} SET total_quantity = total_quantity - OLD.quantity, "
+        f"total_revenue = total_revenue - OLD.quantity * OLD.unit_price WHERE {match}; "
+        f"DELETE FROM {table} WHERE {match} AND total_quantity <= 0;"
+    )
+
+
+def _rollup_refresh_sql(table: str, keys: dict[str, str]) -> str:
+    # A join resolves the region once per row instead of the triggers' scalar subquery.
+    expressions = ", ".join(
+        "COALESCE(se.region, '')" if expression == _SALE_REGION else expression.format(row="s")
+        for expression in keys.values()
+    )
+    return (
+        f"DELETE FROM {table};\n"
+        f"INSERT INTO {table} ({', '.join(keys)}, total_quantity, total_revenue)\n"
+        f"SELECT {expressions}, SUM(s.quantity), SUM(s.quantity * s.unit_price) FROM sales s "
+        f"LEFT JOIN sellers se ON se.seller_id = s.seller_id GROUP BY {expressions};\n"
+    )
+
+
+ROLLUPS_SQL = "".join(_rollup_table_sql(table, keys) for table, keys in ROLLUPS.items())
+_ADD_ROLLUPS = " ".join(_rollup_add_sql(table, keys) for table, keys in ROLLUPS.items())
+_SUBTRACT_ROLLUPS = " ".join(_rollup_subtract_sql(table, keys) for table, keys in ROLLUPS.items())
+ROLLUP_TRIGGERS: dict[str, str] = {
+    "trg_sales_rollups_insert": "CREATE TRIGGER IF NOT EXISTS trg_sales_rollups_insert "
+    f"AFTER INSERT ON sales BEGIN {_ADD_ROLLUPS} END",
+    "trg_sales_rollups_delete": "CREATE TRIGGER IF NOT EXISTS trg_sales_rollups_delete "
+    f"AFTER DELETE ON sales BEGIN {_SUBTRACT_ROLLUPS} END",
+    "trg_sales_rollups_update": "CREATE TRIGGER IF NOT EXISTS trg_sales_rollups_update "
+    "AFTER UPDATE OF product_id, seller_id, sale_date, quantity, unit_price ON sales "
+    f"BEGIN {_SUBTRACT_ROLLUPS} {_ADD_ROLLUPS} END",
+}
+REFRESH_ROLLUPS_SQL = "".join(_rollup_refresh_sql(table, keys) for table, keys in ROLLUPS.items())
+
+
+def _rollup_rekey_sql(table: str, keys: dict[str, str]) -> str:
+    # Moves one seller's contribution to ``table`` from the OLD to the NEW region bucket.
+    other_keys = [key for key in keys if key != "region"]
+    selected = ", ".join(f"{keys[key].format(row='s')} AS {key}" for key in other_keys)
+    moved = (
+        f"(SELECT {selected}, SUM(s.quantity) AS quantity, SUM(s.quantity * s.unit_price) AS revenue "
+        f"FROM sales s WHERE s.seller_id = NEW.seller_id GROUP BY {', '.join(other_keys)}) AS moved"
+    )
+    match = " AND ".join(f"{table}.{key} = moved.{key}" for key in other_keys)
+    values = ", ".join("COALESCE(NEW.region, '')" if key == "region" else f"moved.{key}" for key in keys)
+    return (
+        f"UPDATE {table} SET total_quantity = total_quantity - moved.quantity, "
+        f"total_revenue = total_revenue - moved.revenue FROM {moved} "
+        f"WHERE {table}.region = COALESCE(OLD.region, '') AND {match}; "
+        f"DELETE FROM {table} WHERE region = COALESCE(OLD.region, '') AND total_quantity <= 0; "
+        f"INSERT INTO {table} ({', '.join(keys)}, total_quantity, total_revenue) "
+        f"SELECT {values}, moved.quantity, moved.revenue FROM {moved} WHERE true "
+        f"ON CONFLICT({', '.join(keys)}) DO UPDATE SET "
+        "total_quantity = total_quantity + excluded.total_quantity, "
+        "total_revenue = total_revenue + excluded.total_revenue;"
+    )
+
+
+# Keeps the region-keyed product rollups in step with ``sellers.region``, so sales
+# deleted or edited after a move subtract from the bucket they were counted in.
+REGION_TRIGGERS: dict[str, str] = {
+    "trg_sellers_region_update": "CREATE TRIGGER IF NOT EXISTS trg_sellers_region_update "
+    "AFTER UPDATE OF region ON sellers "
+    "WHEN COALESCE(OLD.region, '') <> COALESCE(NEW.region, '') BEGIN "
+    + " ".join(_rollup_rekey_sql(table, keys) for table, keys in ROLLUPS.items() if "region" in keys)
+    + " END",
+}
+
+# Row counters read by :func:`get_row_counts` instead of ``COUNT(*)`` scans.
+COUNTED_TABLES = ("products", "sellers", "sales")
+STATS_SQL = """
+CREATE TABLE IF NOT EXISTS table_stats (
+    table_name TEXT PRIMARY KEY,
+    row_count INTEGER NOT NULL
+);
+"""
+STATS_TRIGGERS: dict[str, str] = {
+    f"trg_{table}_stats_{event.lower()}": f"CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_{event.lower()} "
+    f"AFTER {event} ON {table} BEGIN "
+    f"UPDATE table_stats SET row_count = row_count {sign} 1 WHERE table_name = '{table}'; END"
+    for table in COUNTED_TABLES
+    for event, sign in (("INSERT", "+"), ("DELETE", "-"))
+}
+REFRESH_STATS_SQL = "".join(
+    f"INSERT OR REPLACE INTO table_stats (table_name, row_count) SELECT '{table}', COUNT(*) FROM {table};\n"
+    for table in COUNTED_TABLES
+)
+# Bumped by in-place updates of ``sales``: with the row counter and the highest ``sale_id``
+# it fingerprints the table contents for caches such as :mod:`agente_banco_dados.columnar`.
+VERSIONS_SQL = """
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('sales', 0);
+"""
+VERSION_TRIGGERS: dict[str, str] = {
+    "trg_sales_version_update": "CREATE TRIGGER IF NOT EXISTS trg_sales_version_update "
+    "AFTER UPDATE ON sales BEGIN "
+    "UPDATE table_versions SET version = version + 1 WHERE table_name = 'sales'; END",
+}
+# Triggers dropped around bulk loads of ``sales`` (rebuilt by :func:`refresh_sales_totals`).
+SALES_BULK_TRIGGERS = [
+    *TOTALS_TRIGGERS,
+    *ROLLUP_TRIGGERS,
+    "trg_sales_stats_insert",
+    "trg_sales_stats_delete",
+]
+
+# Each migration upgrades ``PRAGMA user_version`` from its position to the next one.
+MIGRATIONS: list[str] = [
+    ";\n".join(SALES_INDEXES.values()) + ";\nANALYZE;",
+    TOTALS_SQL + ";\n".join(TOTALS_TRIGGERS.values()) + ";\n" + REFRESH_TOTALS_SQL,
+    ROLLUPS_SQL + ";\n".join(ROLLUP_TRIGGERS.values()) + ";\n" + REFRESH_ROLLUPS_SQL,
+    STATS_SQL + ";\n".join(STATS_TRIGGERS.values()) + ";\n" + REFRESH_STATS_SQL,
+    VERSIONS_SQL + ";\n".join(VERSION_TRIGGERS.values()) + ";",
+    # Rollups written before the re-key trigger may hold stale regions: rebuild them.
+    ";\n".join(REGION_TRIGGERS.values()) + ";\n" + REFRESH_ROLLUPS_SQL,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# Opt-in PRAGMA profiles (``AGENT_DB_TUNING``); WAL is persistent and only set by writers.
+TUNING_PROFILES: dict[str, dict[str, str | int]] = {
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
 PRODUCT_SEED: list[tuple[str, str, str | None, float]] = [
     ("P-100", "Laptop Essentials", "Electronics", 2500.00),
     ("P-200", "Noise-Cancelling Headphones", "Electronics", 890.00),
@@ -82,8 +347,9 @@ SALE_SEED: list[tuple[str, str, str, int, float]] = [
 
 
 def ensure_data_directory() -> None:
-    """Create the data directory if it does not exist."""
+    """Create the data directory (and the parent of ``DB_PATH``) if it does not exist."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
 def get_connection() -> sqlite3.Connection:
@@ -92,12 +358,231 @@ def get_connection() -> sqlite3.Connection:
     connection = sqlite3.connect(DB_PATH)
     connection.row_factory = sqlite3.Row
     connection.execute("PRAGMA foreign_keys = ON")
+    connection.execute("PRAGMA recursive_triggers = ON")
     return connection
 
 
+def apply_tuning(connection: sqlite3.Connection, profile: str, *, read_only: bool = False) -> None:
+    """Apply the PRAGMAs of ``profile`` (see :data:`TUNING_PROFILES`); empty means SQLite defaults."""
+    if not profile:
+        return
+    if profile not in TUNING_PROFILES:
+        raise ValueError(f"Perfil de ajuste desconhecido: {profile!r}. Use um de {', '.join(TUNING_PROFILES)}.")
+    for pragma, value in TUNING_PROFILES[profile].items():
+        if read_only and pragma == "journal_mode":
+            continue
+        connection.execute(f"PRAGMA {pragma} = {value}")
+
+
+class PoolClosedError(RuntimeError):
+    """Raised when a connection is requested from a pool that was already closed."""
+
+
+class ConnectionPool:
+    """Thread-safe pool of SQLite connections to a single database file.
+
+    Connections are opened lazily up to ``size`` and handed out one caller at a time
+    (``check_same_thread`` is disabled because a connection may be reused by another
+    thread after it is returned). Read-only pools open the file with ``mode=ro`` and
+    ``PRAGMA query_only`` so reporting queries can never write.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DB_PATH,
+        *,
+        size: int = DB_POOL_SIZE,
+        read_only: bool = False,
+        timeout: float = DB_POOL_TIMEOUT_SECONDS,
+        tuning: str = DB_TUNING_PROFILE,
+    ) -> None:
+        self.path = Path(path)
+        self.size = max(1, size)
+        self.read_only = read_only
+        self.tuning = tuning
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        if self.read_only:
+            connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+            connection.execute("PRAGMA query_only = ON")
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA foreign_keys = ON")
+            # ``INSERT OR REPLACE`` only fires the delete triggers of the replaced row
+            # (totals, rollups, row counter) with recursive triggers enabled.
+            connection.execute("PRAGMA recursive_triggers = ON")
+        apply_tuning(connection, self.tuning, read_only=self.read_only)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._closed:
+                raise PoolClosedError(f"Pool de conexões para {self.path} já foi fechado.")
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                if self._created < self.size:
+                    self._created += 1
+                    opening = True
+                else:
+                    opening = False
+        if opening:
+            try:
+                return self._open()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._idle.get(timeout=self._timeout)
+        except queue.Empty as exc:
+            raise TimeoutError(
+                f"Nenhuma conexão livre em {self._timeout:.0f}s (pool com {self.size} conexões)."
+            ) from exc
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            if not self._closed:
+                self._idle.put(connection)
+                return
+            self._created -= 1
+        connection.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection; the transaction is committed on success and rolled back on error."""
+        connection = self._acquire()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._release(connection)
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when returned."""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    connection = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                self._created -= 1
+                connection.close()
+
+
+_POOLS: dict[tuple[Path, bool], ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(path: str | Path = DB_PATH, *, read_only: bool = False) -> ConnectionPool:
+    """Return the shared pool for ``path`` (one writer pool and one read-only pool per file)."""
+    key = (Path(path).resolve(), read_only)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(path, read_only=read_only)
+            _POOLS[key] = pool
+        return pool
+
+
+def close_pools() -> None:
+    """Close every shared pool (called on shutdown and safe to call more than once)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pools)
+
+
 def apply_schema(connection: sqlite3.Connection) -> None:
-    """Create tables if they are missing."""
+    """Create tables if they are missing and upgrade older files to :data:`SCHEMA_VERSION`."""
     connection.executescript(SCHEMA_SQL)
+    migrate_schema(connection)
+    repair_interrupted_bulk_load(connection)
+
+
+def migrate_schema(connection: sqlite3.Connection) -> int:
+    """Run the pending :data:`MIGRATIONS` (tracked in ``PRAGMA user_version``).
+
+    Existing ``sales.db`` files created before the indexes existed are upgraded the
+    next time :func:`initialize_database` runs. Each migration and its version bump run
+    in one transaction, so an interrupted upgrade is retried from a consistent state.
+    Returns the number of migrations run.
+    """
+    current = connection.execute("PRAGMA user_version").fetchone()[0]
+    for version in range(current, SCHEMA_VERSION):
+        try:
+            connection.executescript(
+                f"BEGIN;\n{MIGRATIONS[version]}\nPRAGMA user_version = {version + 1};\nCOMMIT;"
+            )
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.rollback()
+            raise
+    return max(SCHEMA_VERSION - current, 0)
+
+
+def drop_sales_indexes(connection: sqlite3.Connection) -> None:
+    """Drop the secondary indexes on ``sales`` (used around bulk loads)."""
+    for name in SALES_INDEXES:
+        connection.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def create_sales_indexes(connection: sqlite3.Connection) -> None:
+    """(Re)create the secondary indexes on ``sales`` and refresh planner statistics."""
+    for statement in SALES_INDEXES.values():
+        connection.execute(statement)
+    connection.execute("ANALYZE")
+
+
+def drop_totals_triggers(connection: sqlite3.Connection) -> None:
+    """Drop the triggers deriving totals, rollups and the row counter from ``sales`` (bulk loads)."""
+    for name in SALES_BULK_TRIGGERS:
+        connection.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def create_totals_triggers(connection: sqlite3.Connection) -> None:
+    """(Re)create the triggers dropped by :func:`drop_totals_triggers`."""
+    statements = {**TOTALS_TRIGGERS, **ROLLUP_TRIGGERS, **STATS_TRIGGERS}
+    for name in SALES_BULK_TRIGGERS:
+        connection.execute(statements[name])
+
+
+def refresh_sales_totals(connection: sqlite3.Connection) -> None:
+    """Recompute the totals, rollups and row counters from ``sales`` in the current transaction."""
+    for statement in (REFRESH_TOTALS_SQL + REFRESH_ROLLUPS_SQL + REFRESH_STATS_SQL).split(";"):
+        if statement.strip():
+            connection.execute(statement)
+
+
+def repair_interrupted_bulk_load(connection: sqlite3.Connection) -> bool:
+    """Restore what a bulk load drops if the process died before putting it back.
+
+    :func:`drop_totals_triggers` and :func:`drop_sales_indexes` are committed before a
+    load; when any of those triggers or indexes is missing on open, the derived tables
+    are recomputed and the triggers and indexes recreated. Returns whether it repaired.
+    """
+    present = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type IN ('trigger', 'index')")}
+    if set(SALES_BULK_TRIGGERS) <= present and set(SALES_INDEXES) <= present:
+        return False
+    refresh_sales_totals(connection)
+    create_totals_triggers(connection)
+    create_sales_indexes(connection)
+    connection.commit()
+    return True
 
 
 def seed_products(connection: sqlite3.Connection) -> None:
@@ -160,18 +645,36 @@ def seed_sales(connection: sqlite3.Connection) -> None:
     )
 
 
-def get_row_counts(connection: sqlite3.Connection) -> dict[str, int]:
-    """Return a summary of row counts per table."""
-    cursor = connection.execute(
-        """
-        SELECT
-            (SELECT COUNT(*) FROM products) AS products,
-            (SELECT COUNT(*) FROM sellers) AS sellers,
-            (SELECT COUNT(*) FROM sales) AS sales
-        """
+def get_row_counts(connection: sqlite3.Connection, *, exact: bool = False) -> dict[str, int]:
+    """Return a summary of row counts per table.
+
+    Reads the trigger-maintained ``table_stats`` counters (constant time); ``exact=True``
+    counts every table with ``COUNT(*)`` instead.
+    """
+    if exact:
+        cursor = connection.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM products) AS products,
+                (SELECT COUNT(*) FROM sellers) AS sellers,
+                (SELECT COUNT(*) FROM sales) AS sales
+            """
+        )
+        row = cursor.fetchone()
+        return {"products": row["products"], "sellers": row["sellers"], "sales": row["sales"]}
+    counts = dict.fromkeys(COUNTED_TABLES, 0)
+    for row in connection.execute("SELECT table_name, row_count FROM table_stats"):
+        counts[row["table_name"]] = row["row_count"]
+    return counts
+
+
+def seed_counts_satisfied(counts: dict[str, int]) -> bool:
+    """Return whether ``counts`` meet the minimum seed counts."""
+    return (
+        counts["products"] >= MIN_SEED_PRODUCTS
+        and counts["sellers"] >= MIN_SEED_SELLERS
+        and counts["sales"] >= MIN_SEED_SALES
     )
-    row = cursor.fetchone()
-    return {"products": row["products"], "sellers": row["sellers"], "sales": row["sales"]}
 
 
 def validate_seed_counts(counts: dict[str, int]) -> None:
@@ -184,9 +687,20 @@ def validate_seed_counts(counts: dict[str, int]) -> None:
         raise RuntimeError("Seeded sales count below required minimum.")
 
 
-def initialize_database() -> dict[str, int]:
-    """Create the database schema and seed sample data."""
-    with get_connection() as connection:
+def initialize_database(pool: ConnectionPool | None = None) -> dict[str, int]:
+    """Create the database schema and seed sample data.
+
+    When the file is already at :data:`SCHEMA_VERSION` and the maintained row counters
+    meet the seed minimums, schema creation and seeding are skipped, so startup cost
+    does not grow with the number of sales.
+    """
+    ensure_data_directory()
+    with (pool or get_pool()).connection() as connection:
+        if connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            repair_interrupted_bulk_load(connection)
+            counts = get_row_counts(connection)
+            if seed_counts_satisfied(counts):
+                return counts
         apply_schema(connection)
         seed_products(connection)
         seed_sellers(connection)
@@ -7,22 +7,35 @@ from langgraph.graph import END, START, StateGraph
 from agente_banco_dados.state import ReportState
 from agente_banco_dados.utils import (
     generate_insights_node,
-    load_sales_metrics,
+    load_top_products,
+    load_top_sellers,
     render_sales_report,
+    render_sales_tables,
 )
 
+METRIC_NODES = ["load_top_products", "load_top_sellers"]
+OUTPUT_NODES = ["generate_insights", "render_sales_tables"]
+
 
 def create_app():
-    """Compile and return the LangGraph application responsible for report generation."""
+    """Compile and return the LangGraph application responsible for report generation.
+
+    The two metric queries run as parallel branches; once both finish, the LLM call and
+    the table rendering run side by side and ``render_sales_report`` joins them.
+    """
 
     builder = StateGraph(ReportState)
-    builder.add_node("load_sales_metrics", load_sales_metrics)
-    builder.add_node("render_sales_report", render_sales_report)
+    builder.add_node("load_top_products", load_top_products)
+    builder.add_node("load_top_sellers", load_top_sellers)
     builder.add_node("generate_insights", generate_insights_node)
+    builder.add_node("render_sales_tables", render_sales_tables)
+    builder.add_node("render_sales_report", render_sales_report)
 
-    builder.add_edge(START, "load_sales_metrics")
-    builder.add_edge("load_sales_metrics", "generate_insights")
-    builder.add_edge("generate_insights", "render_sales_report")
+    for node in METRIC_NODES:
+        builder.add_edge(START, node)
+    for node in OUTPUT_NODES:
+        builder.add_edge(METRIC_NODES, node)
+    builder.add_edge(OUTPUT_NODES, "render_sales_report")
     builder.add_edge("render_sales_report", END)
 
     return builder.compile()
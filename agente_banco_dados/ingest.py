@@ -0,0 +1,226 @@
+"""Streaming bulk ingestion of sales exports into the local SQLite database."""
+
+from __future__ import annotations
+
+import csv
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence
+
+from .db_init import (
+    ConnectionPool,
+    apply_schema,
+    create_sales_indexes,
+    create_totals_triggers,
+    drop_sales_indexes,
+    drop_totals_triggers,
+    get_pool,
+    refresh_sales_totals,
+)
+
+DEFAULT_CHUNK_SIZE = 50_000
+CSV_COLUMNS = ("order_code", "sku", "seller_code", "sale_date", "quantity", "unit_price")
+
+SaleRecord = tuple[int, int, str, int, float, str]
+ProgressCallback = Callable[[int, float], None]
+
+INSERT_SALES_SQL = """
+INSERT OR IGNORE INTO sales (
+    product_id,
+    seller_id,
+    sale_date,
+    quantity,
+    unit_price,
+    order_code
+) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+@dataclass(slots=True)
+class IngestionReport:
+    """Outcome of a bulk load: rows read, inserted, skipped and duplicated, plus throughput.
+
+    ``rows_read == rows_inserted + rows_skipped + rows_duplicate`` once the load ends.
+    """
+
+    rows_read: int = 0
+    rows_inserted: int = 0
+    rows_skipped: int = 0
+    rows_duplicate: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def read_sales_csv(path: str | Path) -> Iterator[dict[str, str]]:
+    """Yield CSV rows as dicts, validating that every column in :data:`CSV_COLUMNS` is present."""
+    with Path(path).open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        missing = [column for column in CSV_COLUMNS if column not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"{path}: colunas ausentes no CSV: {', '.join(missing)}.")
+        yield from reader
+
+
+def chunked(rows: Iterable[SaleRecord], size: int) -> Iterator[list[SaleRecord]]:
+    """Group ``rows`` into lists of at most ``size`` items without materializing the stream."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def load_id_maps(connection: sqlite3.Connection) -> tuple[dict[str, int], dict[str, int]]:
+    """Return the ``sku -> product_id`` and ``code -> seller_id`` lookup dicts."""
+    product_id_by_sku = {
+        row["sku"]: row["product_id"]
+        for row in connection.execute("SELECT product_id, sku FROM products")
+    }
+    seller_id_by_code = {
+        row["code"]: row["seller_id"]
+        for row in connection.execute("SELECT seller_id, code FROM sellers")
+    }
+    return product_id_by_sku, seller_id_by_code
+
+
+def is_iso_date(value: str | None) -> bool:
+    """Return whether ``value`` is a ``YYYY-MM-DD`` date, the format the rollups and filters key on."""
+    try:
+        return date.fromisoformat(value or "").isoformat() == value
+    except ValueError:
+        return False
+
+
+def resolve_sales(
+    rows: Iterable[dict[str, str]],
+    product_id_by_sku: dict[str, int],
+    seller_id_by_code: dict[str, int],
+    report: IngestionReport,
+) -> Iterator[SaleRecord]:
+    """Map CSV rows to ``sales`` tuples, counting rows with unknown codes or invalid values as skipped.
+
+    ``sale_date`` must be an ISO ``YYYY-MM-DD`` date; other spellings (``18/10/2025``)
+    would be stored but never match a period filter, so they are skipped too.
+    """
+    for row in rows:
+        report.rows_read += 1
+        product_id = product_id_by_sku.get(row["sku"])
+        seller_id = seller_id_by_code.get(row["seller_code"])
+        try:
+            quantity = int(row["quantity"])
+            unit_price = float(row["unit_price"])
+        except (TypeError, ValueError):
+            quantity, unit_price = 0, 0.0
+        if (
+            product_id is None
+            or seller_id is None
+            or quantity <= 0
+            or unit_price < 0
+            or not is_iso_date(row["sale_date"])
+        ):
+            report.rows_skipped += 1
+            continue
+        yield (product_id, seller_id, row["sale_date"], quantity, unit_price, row["order_code"])
+
+
+def insert_sales(
+    records: Iterable[SaleRecord],
+    *,
+    pool: ConnectionPool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rebuild_indexes: bool = True,
+    progress: ProgressCallback | None = None,
+    report: IngestionReport | None = None,
+) -> IngestionReport:
+    """Insert ``sales`` tuples with ``executemany``, one transaction per chunk.
+
+    Secondary indexes and the triggers deriving totals, rollups and the ``sales`` row
+    counter are dropped before the load; at the end (also when the load fails) the
+    indexes are rebuilt and the derived tables refreshed once, which is much cheaper
+    than maintaining them row by row. If the process dies mid-load, the next
+    :func:`~agente_banco_dados.db_init.apply_schema` or ``initialize_database`` repairs
+    them. Rows whose ``order_code`` already exists are ignored.
+    """
+    report = report if report is not None else IngestionReport()
+    started = time.perf_counter()
+    with (pool or get_pool()).connection() as connection:
+        apply_schema(connection)
+        if rebuild_indexes:
+            drop_sales_indexes(connection)
+            drop_totals_triggers(connection)
+            connection.commit()
+        try:
+            for chunk in chunked(records, chunk_size):
+                inserted = connection.executemany(INSERT_SALES_SQL, chunk).rowcount
+                connection.commit()
+                report.rows_inserted += inserted
+                report.rows_duplicate += len(chunk) - inserted
+                if progress is not None:
+                    progress(report.rows_read or report.rows_inserted, time.perf_counter() - started)
+        finally:
+            if rebuild_indexes:
+                refresh_sales_totals(connection)
+                create_totals_triggers(connection)
+                create_sales_indexes(connection)
+                connection.commit()
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def ingest_sales_csv(
+    path: str | Path,
+    *,
+    pool: ConnectionPool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rebuild_indexes: bool = True,
+    progress: ProgressCallback | None = None,
+) -> IngestionReport:
+    """Stream a sales CSV (columns :data:`CSV_COLUMNS`) into ``sales`` in fixed-size chunks.
+
+    SKUs and seller codes are resolved through in-memory dicts loaded once, like
+    :func:`agente_banco_dados.db_init.seed_sales`; the file is never fully loaded.
+    """
+    pool = pool or get_pool()
+    with pool.connection() as connection:
+        apply_schema(connection)
+        product_id_by_sku, seller_id_by_code = load_id_maps(connection)
+    report = IngestionReport()
+    records = resolve_sales(read_sales_csv(path), product_id_by_sku, seller_id_by_code, report)
+    return insert_sales(
+        records,
+        pool=pool,
+        chunk_size=chunk_size,
+        rebuild_indexes=rebuild_indexes,
+        progress=progress,
+        report=report,
+    )
+
+
+def write_sales_csv(path: str | Path, rows: Iterable[Sequence[object]]) -> Path:
+    """Write ``rows`` (ordered as :data:`CSV_COLUMNS`) to a CSV file with a header."""
+    destination = Path(path)
+    with destination.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(rows)
+    return destination
+
+
+__all__ = [
+    "CSV_COLUMNS",
+    "DEFAULT_CHUNK_SIZE",
+    "IngestionReport",
+    "chunked",
+    "ingest_sales_csv",
+    "insert_sales",
+    "is_iso_date",
+    "load_id_maps",
+    "read_sales_csv",
+    "resolve_sales",
+    "write_sales_csv",
+]
@@ -2,53 +2,313 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
-
-from agente_banco_dados.config import TOP_N_PRODUCTS, TOP_N_SELLERS
-from agente_banco_dados.db_init import get_connection
-
-
-def query_top_products(limit: int = TOP_N_PRODUCTS) -> list[dict[str, float | str]]:
-    """Return the top products ordered by quantity sold."""
-    with get_connection() as connection:
-        rows = connection.execute(
-            """
-            SELECT
-                p.name AS product_name,
-                SUM(s.quantity) AS total_quantity,
-                ROUND(SUM(s.quantity * s.unit_price), 2) AS total_revenue
-            FROM sales s
-            JOIN products p ON p.product_id = s.product_id
-            GROUP BY p.product_id
-            ORDER BY total_quantity DESC, total_revenue DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
-    return [dict(row) for row in rows]
+import io
+from datetime import date, timedelta
+from typing import Iterable, Mapping, Sequence, TextIO
+
+from agente_banco_dados import columnar
+from agente_banco_dados.config import REPORT_SOURCE, REPORT_SOURCES, TOP_N_PRODUCTS, TOP_N_SELLERS
+from agente_banco_dados.db_init import ConnectionPool, get_pool
+
+TOP_PRODUCTS_SQL = {
+    "sales": """
+        SELECT
+            p.name AS product_name,
+            SUM(s.quantity) AS total_quantity,
+            ROUND(SUM(s.quantity * s.unit_price), 2) AS total_revenue
+        FROM sales s
+        JOIN products p ON p.product_id = s.product_id
+        GROUP BY p.product_id
+        ORDER BY total_quantity DESC, total_revenue DESC
+        LIMIT ?
+    """,
+    "totals": """
+        SELECT
+            p.name AS product_name,
+            t.total_quantity AS total_quantity,
+            ROUND(t.total_revenue, 2) AS total_revenue
+        FROM product_totals t
+        JOIN products p ON p.product_id = t.product_id
+        ORDER BY t.total_quantity DESC, t.total_revenue DESC
+        LIMIT ?
+    """,
+}
+
+TOP_SELLERS_SQL = {
+    "sales": """
+        SELECT
+            se.name AS seller_name,
+            COALESCE(se.region, 'Sem região') AS region,
+            SUM(sa.quantity) AS total_quantity,
+            ROUND(SUM(sa.quantity * sa.unit_price), 2) AS total_revenue
+        FROM sales sa
+        JOIN sellers se ON se.seller_id = sa.seller_id
+        GROUP BY se.seller_id
+        ORDER BY total_revenue DESC, total_quantity DESC
+        LIMIT ?
+    """,
+    "totals": """
+        SELECT
+            se.name AS seller_name,
+            COALESCE(se.region, 'Sem região') AS region,
+            t.total_quantity AS total_quantity,
+            ROUND(t.total_revenue, 2) AS total_revenue
+        FROM seller_totals t
+        JOIN sellers se ON se.seller_id = t.seller_id
+        ORDER BY t.total_revenue DESC, t.total_quantity DESC
+        LIMIT ?
+    """,
+}
+
+
+# Filtered reports combine monthly rollups for whole months with daily rollups for the
+# partial months at both edges of the period (see :func:`split_period`).
+TOP_PRODUCTS_ROLLUP_SQL = """
+    WITH rollup AS (
+        SELECT product_id, total_quantity, total_revenue FROM daily_product_sales
+        WHERE day BETWEEN :first_from AND :first_to AND (:region IS NULL OR region = :region)
+        UNION ALL
+        SELECT product_id, total_quantity, total_revenue FROM monthly_product_sales
+        WHERE month BETWEEN :month_from AND :month_to AND (:region IS NULL OR region = :region)
+        UNION ALL
+        SELECT product_id, total_quantity, total_revenue FROM daily_product_sales
+        WHERE day BETWEEN :last_from AND :last_to AND (:region IS NULL OR region = :region)
+    )
+    SELECT
+        p.name AS product_name,
+        SUM(r.total_quantity) AS total_quantity,
+        ROUND(SUM(r.total_revenue), 2) AS total_revenue
+    FROM rollup r
+    JOIN products p ON p.product_id = r.product_id
+    GROUP BY p.product_id
+    ORDER BY total_quantity DESC, total_revenue DESC
+    LIMIT :limit
+"""
+
+TOP_SELLERS_ROLLUP_SQL = """
+    WITH rollup AS (
+        SELECT seller_id, total_quantity, total_revenue FROM daily_seller_sales
+        WHERE day BETWEEN :first_from AND :first_to
+        UNION ALL
+        SELECT seller_id, total_quantity, total_revenue FROM monthly_seller_sales
+        WHERE month BETWEEN :month_from AND :month_to
+        UNION ALL
+        SELECT seller_id, total_quantity, total_revenue FROM daily_seller_sales
+        WHERE day BETWEEN :last_from AND :last_to
+    )
+    SELECT
+        se.name AS seller_name,
+        COALESCE(se.region, 'Sem região') AS region,
+        SUM(r.total_quantity) AS total_quantity,
+        ROUND(SUM(r.total_revenue), 2) AS total_revenue
+    FROM rollup r
+    JOIN sellers se ON se.seller_id = r.seller_id
+    WHERE :region IS NULL OR se.region = :region
+    GROUP BY se.seller_id
+    ORDER BY total_revenue DESC, total_quantity DESC
+    LIMIT :limit
+"""
+
+PRODUCT_HEADERS = ("Produto", "Quantidade", "Receita")
+SELLER_HEADERS = ("Vendedor", "Região", "Quantidade", "Receita")
+
+# Column widths of a top-N result computed in SQL (``{query}`` is the top-N query);
+# revenue cells are rendered as ``R$ <value with 2 decimals>``.
+PRODUCT_WIDTHS_SQL = """
+    SELECT
+        MAX(LENGTH(product_name)),
+        MAX(LENGTH(CAST(total_quantity AS INTEGER))),
+        MAX(LENGTH(printf('%.2f', total_revenue))) + 3
+    FROM ({query})
+"""
+SELLER_WIDTHS_SQL = """
+    SELECT
+        MAX(LENGTH(seller_name)),
+        MAX(LENGTH(region)),
+        MAX(LENGTH(CAST(total_quantity AS INTEGER))),
+        MAX(LENGTH(printf('%.2f', total_revenue))) + 3
+    FROM ({query})
+"""
+
+_EMPTY_RANGE = ("1", "0")
+
+
+def _as_date(value: date | str | None, name: str) -> date | None:
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError as exc:
+        raise ValueError(f"{name} inválida: {value!r}. Use o formato AAAA-MM-DD.") from exc
+
+
+def _next_month(day: date) -> date | None:
+    """First day of the month after ``day`` (``None`` past the last representable month)."""
+    try:
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    except OverflowError:
+        return None
+
+
+def _previous_month(day: date) -> date | None:
+    """First day of the month before ``day`` (``None`` before the first representable month)."""
+    try:
+        return (day.replace(day=1) - timedelta(days=1)).replace(day=1)
+    except OverflowError:
+        return None
 
 
-def query_top_sellers(limit: int = TOP_N_SELLERS) -> list[dict[str, float | str]]:
-    """Return the top sellers ordered by total revenue."""
-    with get_connection() as connection:
-        rows = connection.execute(
-            """
-            SELECT
-                se.name AS seller_name,
-                COALESCE(se.region, 'Sem região') AS region,
-                SUM(sa.quantity) AS total_quantity,
-                ROUND(SUM(sa.quantity * sa.unit_price), 2) AS total_revenue
-            FROM sales sa
-            JOIN sellers se ON se.seller_id = sa.seller_id
-            GROUP BY se.seller_id
-            ORDER BY total_revenue DESC, total_quantity DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
+def split_period(start_date: date | str | None, end_date: date | str | None) -> dict[str, str]:
+    """Split an inclusive period into daily edges around a run of whole months.
+
+    Returns the ``first_*`` and ``last_*`` day bounds and the ``month_*`` bounds used
+    by the rollup queries; empty segments get bounds that match nothing. Open ends
+    extend to the earliest/latest representable dates.
+    """
+    start = _as_date(start_date, "Data inicial") or date.min
+    end = _as_date(end_date, "Data final") or date.max
+    if start > end:
+        raise ValueError(f"Período inválido: {start.isoformat()} é posterior a {end.isoformat()}.")
+    first_month = start if start.day == 1 else _next_month(start)
+    after_end = _next_month(end)
+    ends_on_month_end = after_end is None or end + timedelta(days=1) == after_end
+    last_month = end.replace(day=1) if ends_on_month_end else _previous_month(end)
+    if first_month is None or last_month is None or first_month > last_month:
+        first, months, last = (start.isoformat(), end.isoformat()), _EMPTY_RANGE, _EMPTY_RANGE
+    else:
+        first = (start.isoformat(), (first_month - timedelta(days=1)).isoformat()) if start < first_month else _EMPTY_RANGE
+        months = (first_month.isoformat()[:7], last_month.isoformat()[:7])
+        after_months = _next_month(last_month)
+        last = (after_months.isoformat(), end.isoformat()) if after_months and after_months <= end else _EMPTY_RANGE
+    return {
+        "first_from": first[0],
+        "first_to": first[1],
+        "month_from": months[0],
+        "month_to": months[1],
+        "last_from": last[0],
+        "last_to": last[1],
+    }
+
+
+def describe_report_period(
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+    region: str | None = None,
+) -> str | None:
+    """Return a Portuguese description of the report filters, or ``None`` when unfiltered."""
+    start = _as_date(start_date, "Data inicial")
+    end = _as_date(end_date, "Data final")
+    parts = []
+    if start and end:
+        parts.append(f"de {start.isoformat()} a {end.isoformat()}")
+    elif start:
+        parts.append(f"a partir de {start.isoformat()}")
+    elif end:
+        parts.append(f"até {end.isoformat()}")
+    if region:
+        parts.append(f"região {region}")
+    return ", ".join(parts) or None
+
+
+def _resolve_source(source: str | None) -> str:
+    resolved = source or REPORT_SOURCE
+    if resolved not in REPORT_SOURCES:
+        raise ValueError(f"Fonte de relatório desconhecida: {resolved!r}. Use um de {', '.join(REPORT_SOURCES)}.")
+    return resolved
+
+
+TopQuery = tuple[str, tuple[int] | dict[str, object]]
+
+
+def _top_query(
+    unfiltered_sql: str,
+    rollup_sql: str,
+    limit: int,
+    start_date: date | str | None,
+    end_date: date | str | None,
+    region: str | None,
+) -> TopQuery:
+    """Pick the SQL and parameters for a top-N query (rollups when any filter is set)."""
+    if start_date is None and end_date is None and not region:
+        return unfiltered_sql, (limit,)
+    return rollup_sql, {**split_period(start_date, end_date), "region": region or None, "limit": limit}
+
+
+def _run_top_query(pool: ConnectionPool | None, query: TopQuery) -> list[dict[str, float | str]]:
+    with (pool or get_pool(read_only=True)).connection() as connection:
+        rows = connection.execute(*query).fetchall()
     return [dict(row) for row in rows]
 
 
+def _columnar_filters(
+    start_date: date | str | None,
+    end_date: date | str | None,
+    region: str | None,
+) -> dict[str, date | str | None]:
+    return {
+        "start_date": _as_date(start_date, "Data inicial"),
+        "end_date": _as_date(end_date, "Data final"),
+        "region": region or None,
+    }
+
+
+def query_top_products(
+    limit: int = TOP_N_PRODUCTS,
+    *,
+    pool: ConnectionPool | None = None,
+    source: str | None = None,
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+    region: str | None = None,
+) -> list[dict[str, float | str]]:
+    """Return the top products ordered by quantity sold (read-only pooled connection).
+
+    ``source="totals"`` (default from ``AGENT_REPORT_SOURCE``) reads ``product_totals``
+    through its ranking index instead of aggregating every row of ``sales``. With an
+    inclusive ``start_date``/``end_date`` period or a seller ``region``, the daily and
+    monthly rollups are read instead. ``source="columnar"`` aggregates cached NumPy
+    columns of ``sales`` (see :mod:`agente_banco_dados.columnar`).
+    """
+    if _resolve_source(source) == "columnar":
+        return columnar.top_products(limit, pool=pool, **_columnar_filters(start_date, end_date, region))
+    query = _top_query(
+        TOP_PRODUCTS_SQL[_resolve_source(source)],
+        TOP_PRODUCTS_ROLLUP_SQL,
+        limit,
+        start_date,
+        end_date,
+        region,
+    )
+    return _run_top_query(pool, query)
+
+
+def query_top_sellers(
+    limit: int = TOP_N_SELLERS,
+    *,
+    pool: ConnectionPool | None = None,
+    source: str | None = None,
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+    region: str | None = None,
+) -> list[dict[str, float | str]]:
+    """Return the top sellers ordered by total revenue (read-only pooled connection).
+
+    ``source="totals"`` reads ``seller_totals`` through its ranking index; filters
+    behave as in :func:`query_top_products`.
+    """
+    if _resolve_source(source) == "columnar":
+        return columnar.top_sellers(limit, pool=pool, **_columnar_filters(start_date, end_date, region))
+    query = _top_query(
+        TOP_SELLERS_SQL[_resolve_source(source)],
+        TOP_SELLERS_ROLLUP_SQL,
+        limit,
+        start_date,
+        end_date,
+        region,
+    )
+    return _run_top_query(pool, query)
+
+
 def _format_markdown_row(cells: Sequence[str], widths: Sequence[int]) -> str:
     """Return a markdown table row with padded cells."""
     padded = [cell.ljust(width) for cell, width in zip(cells, widths)]
@@ -58,49 +318,145 @@ def _format_markdown_row(cells: Sequence[str], widths: Sequence[int]) -> str:
 def format_markdown_table(headers: Sequence[str], rows: Iterable[Sequence[str]]) -> str:
     """Format a markdown table from headers and row values."""
     rows_list = [tuple(row) for row in rows]
-    widths = [len(header) for header in headers]
-    for row in rows_list:
-        widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+    widths = [max((len(row[column]) for row in rows_list), default=0) for column in range(len(headers))]
+    buffer = io.StringIO()
+    write_markdown_table(buffer, headers, rows_list, widths)
+    return buffer.getvalue().rstrip("\n")
+
+
+def _format_revenue(value: float | str) -> str:
+    return f"R$ {float(value):.2f}".replace(".", ",", 1)
+
+
+def _product_cells(record: Mapping[str, float | str]) -> tuple[str, str, str]:
+    return (
+        str(record["product_name"]),
+        str(int(record["total_quantity"])),
+        _format_revenue(record["total_revenue"]),
+    )
 
-    header_line = _format_markdown_row(headers, widths)
-    separator = "| " + " | ".join("-" * width for width in widths) + " |"
-    data_lines = [_format_markdown_row(row, widths) for row in rows_list]
-    return "\n".join([header_line, separator, *data_lines]) if data_lines else "\n".join([header_line, separator])
+
+def _seller_cells(record: Mapping[str, float | str]) -> tuple[str, str, str, str]:
+    return (
+        str(record["seller_name"]),
+        str(record["region"]),
+        str(int(record["total_quantity"])),
+        _format_revenue(record["total_revenue"]),
+    )
+
+
+def _report_header(period: str | None) -> list[str]:
+    return [
+        "# Relatório de Vendas Baseado em SQLite",
+        "*Fonte: banco de dados local agente_banco_dados/data/sales.db*",
+        *([f"*Período: {period}*"] if period else []),
+        "",
+    ]
 
 
 def build_markdown_report(
     top_products: list[dict[str, float | str]],
     top_sellers: list[dict[str, float | str]],
+    period: str | None = None,
 ) -> str:
     """Return the markdown report for top products and sellers."""
-    product_rows = [
-        (
-            record["product_name"],
-            str(int(record["total_quantity"])),
-            f"R$ {record['total_revenue']:.2f}".replace(".", ",", 1)
-        )
-        for record in top_products
-    ]
-
-    seller_rows = [
-        (
-            record["seller_name"],
-            record["region"],
-            str(int(record["total_quantity"])),
-            f"R$ {record['total_revenue']:.2f}".replace(".", ",", 1)
-        )
-        for record in top_sellers
-    ]
-
     report_sections = [
-        "# Relatório de Vendas Baseado em SQLite",
-        "*Fonte: banco de dados local agente_banco_dados/data/sales.db*",
-        "",
+        *_report_header(period),
         "## Produtos mais vendidos",
-        format_markdown_table(("Produto", "Quantidade", "Receita"), product_rows),
+        format_markdown_table(PRODUCT_HEADERS, map(_product_cells, top_products)),
         "",
         "## Melhores vendedores",
-        format_markdown_table(("Vendedor", "Região", "Quantidade", "Receita"), seller_rows),
+        format_markdown_table(SELLER_HEADERS, map(_seller_cells, top_sellers)),
     ]
-    return "\n".join(section for section in report_sections if section is not None)
+    return "\n".join(report_sections)
 
+
+def write_markdown_table(
+    sink: TextIO,
+    headers: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    widths: Sequence[int | None],
+) -> int:
+    """Write a markdown table row by row using precomputed column ``widths``.
+
+    ``widths`` only needs to cover the data cells (header lengths are applied here);
+    cells wider than their column are written unpadded. Returns the rows written.
+    """
+    widths = [max(len(header), width or 0) for header, width in zip(headers, widths)]
+    sink.write(_format_markdown_row(headers, widths) + "\n")
+    sink.write("| " + " | ".join("-" * width for width in widths) + " |\n")
+    written = 0
+    for row in rows:
+        sink.write(_format_markdown_row(row, widths) + "\n")
+        written += 1
+    return written
+
+
+def write_markdown_report(
+    sink: TextIO,
+    *,
+    top_products: int = TOP_N_PRODUCTS,
+    top_sellers: int = TOP_N_SELLERS,
+    pool: ConnectionPool | None = None,
+    source: str | None = None,
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+    region: str | None = None,
+) -> dict[str, int]:
+    """Stream the tables of the report to ``sink`` without materializing the rows.
+
+    Column widths come from one aggregate query over each top-N result; rows are then
+    read from the cursor and written one at a time, so top-N sizes in the thousands
+    keep memory flat. The output matches :func:`build_markdown_report` for the same
+    rows. Returns how many product and seller rows were written.
+    """
+    if _resolve_source(source) == "columnar":
+        # The columnar engine already holds the ranking in memory; nothing to stream.
+        filters = {"start_date": start_date, "end_date": end_date, "region": region}
+        products = query_top_products(top_products, pool=pool, source=source, **filters)
+        sellers = query_top_sellers(top_sellers, pool=pool, source=source, **filters)
+        sink.write(build_markdown_report(products, sellers, describe_report_period(**filters)) + "\n")
+        return {"products": len(products), "sellers": len(sellers)}
+    sections = (
+        (
+            "products",
+            "Produtos mais vendidos",
+            PRODUCT_HEADERS,
+            PRODUCT_WIDTHS_SQL,
+            _product_cells,
+            _top_query(
+                TOP_PRODUCTS_SQL[_resolve_source(source)],
+                TOP_PRODUCTS_ROLLUP_SQL,
+                top_products,
+                start_date,
+                end_date,
+                region,
+            ),
+        ),
+        (
+            "sellers",
+            "Melhores vendedores",
+            SELLER_HEADERS,
+            SELLER_WIDTHS_SQL,
+            _seller_cells,
+            _top_query(
+                TOP_SELLERS_SQL[_resolve_source(source)],
+                TOP_SELLERS_ROLLUP_SQL,
+                top_sellers,
+                start_date,
+                end_date,
+                region,
+            ),
+        ),
+    )
+    sink.write("\n".join(_report_header(describe_report_period(start_date, end_date, region))) + "\n")
+    written: dict[str, int] = {}
+    with (pool or get_pool(read_only=True)).connection() as connection:
+        for position, (key, title, headers, widths_sql, cells, (sql, parameters)) in enumerate(sections):
+            if position:
+                sink.write("\n")
+            widths = connection.execute(widths_sql.format(query=sql), parameters).fetchone()
+            sink.write(f"## {title}\n")
+            rows = (cells(record) for record in connection.execute(sql, parameters))
+            written[key] = write_markdown_table(sink, headers, rows, tuple(widths))
+    return written
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
-from typing_extensions import TypedDict
+from typing import Any, Dict, List, Optional
+from typing_extensions import Annotated, TypedDict
+
+
+def merge_metadata(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge metadata written by parallel branches (later keys win)."""
+
+    return {**(left or {}), **(right or {})}
 
 
 class ProductSummary(TypedDict):
@@ -32,12 +38,24 @@ class InsightSummary(TypedDict):
 
 
 class ReportState(TypedDict, total=False):
-    """LangGraph state exchanged between nodes during report generation."""
+    """LangGraph state exchanged between nodes during report generation.
 
+    ``start_date``/``end_date`` (inclusive, ``AAAA-MM-DD``) and ``region`` are optional
+    inputs restricting the report; without them it covers all sales. ``top_n_products``
+    and ``top_n_sellers`` override the default table sizes.
+    """
+
+    start_date: str
+    end_date: str
+    region: str
+    top_n_products: int
+    top_n_sellers: int
     top_products: List[ProductSummary]
     top_sellers: List[SellerSummary]
     insights: List[InsightSummary]
+    report_tables: str
     report_markdown: str
-    metadata: Dict[str, Any]
+    fallback_message: str
+    metadata: Annotated[Dict[str, Any], merge_metadata]
     llm_latency_seconds: float
     processed_records: int
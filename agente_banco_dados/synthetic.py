@@ -0,0 +1,135 @@
+"""Deterministic synthetic catalog and sales data for scale testing the report."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Iterator
+
+import numpy as np
+
+from .db_init import ConnectionPool, apply_schema, get_pool
+from .ingest import (
+    DEFAULT_CHUNK_SIZE,
+    IngestionReport,
+    ProgressCallback,
+    SaleRecord,
+    insert_sales,
+    load_id_maps,
+)
+
+CATEGORIES = ("Electronics", "Office", "Accessories", "Furniture", "Software", "Services")
+REGIONS = ("São Paulo", "Rio de Janeiro", "Minas Gerais", "Paraná", "Bahia", "Pernambuco", "Rio Grande do Sul")
+FIRST_SALE_DATE = np.datetime64("2024-01-01")
+SALE_DAYS = 730
+DISCOUNTS = np.array([0.0, 0.05, 0.10, 0.20])
+DISCOUNT_WEIGHTS = np.array([0.70, 0.15, 0.10, 0.05])
+
+
+def zipf_weights(count: int, exponent: float) -> np.ndarray:
+    """Return normalized Zipf probabilities ``rank ** -exponent`` for ``count`` ranks."""
+    weights = np.arange(1, count + 1, dtype=np.float64) ** -exponent
+    return weights / weights.sum()
+
+
+def seed_catalog(connection: sqlite3.Connection, products: int, sellers: int, *, seed: int) -> None:
+    """Insert ``products`` synthetic products and ``sellers`` synthetic sellers (idempotent)."""
+    rng = np.random.default_rng([seed, 0])
+    prices = np.maximum(np.round(rng.lognormal(np.log(300.0), 1.0, size=products), 2), 5.0)
+    categories = rng.integers(0, len(CATEGORIES), size=products)
+    regions = rng.integers(0, len(REGIONS), size=sellers)
+    connection.executemany(
+        "INSERT OR IGNORE INTO products (sku, name, category, unit_price) VALUES (?, ?, ?, ?)",
+        (
+            (f"SYN-P{number:07d}", f"Produto sintético {number}", CATEGORIES[category], price)
+            for number, (category, price) in enumerate(zip(categories.tolist(), prices.tolist()), start=1)
+        ),
+    )
+    connection.executemany(
+        "INSERT OR IGNORE INTO sellers (code, name, region) VALUES (?, ?, ?)",
+        (
+            (f"SYN-S{number:05d}", f"Vendedor sintético {number}", REGIONS[region])
+            for number, region in enumerate(regions.tolist(), start=1)
+        ),
+    )
+
+
+def generate_sales(
+    count: int,
+    product_ids: np.ndarray,
+    product_prices: np.ndarray,
+    seller_ids: np.ndarray,
+    *,
+    seed: int,
+    product_exponent: float = 1.1,
+    seller_exponent: float = 0.8,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[SaleRecord]:
+    """Yield ``count`` sales rows sampled chunk by chunk with vectorized NumPy draws.
+
+    Product and seller popularity follow Zipf laws over a seeded random ranking, so
+    a few items dominate the totals like in real sales. Chunk ``n`` uses the
+    generator seeded with ``(seed, n + 1)``: the same arguments always produce the
+    same rows, and order codes are derived from ``seed`` so reruns are idempotent.
+    """
+    rng = np.random.default_rng([seed, 0])
+    product_rank = rng.permutation(len(product_ids))
+    seller_rank = rng.permutation(len(seller_ids))
+    product_weights = zipf_weights(len(product_ids), product_exponent)
+    seller_weights = zipf_weights(len(seller_ids), seller_exponent)
+    for number, start in enumerate(range(0, count, chunk_size)):
+        size = min(chunk_size, count - start)
+        chunk_rng = np.random.default_rng([seed, number + 1])
+        products = product_rank[chunk_rng.choice(len(product_ids), size=size, p=product_weights)]
+        sellers = seller_rank[chunk_rng.choice(len(seller_ids), size=size, p=seller_weights)]
+        dates = (FIRST_SALE_DATE + chunk_rng.integers(0, SALE_DAYS, size=size)).astype(str)
+        quantities = chunk_rng.geometric(0.35, size=size)
+        discounts = chunk_rng.choice(DISCOUNTS, size=size, p=DISCOUNT_WEIGHTS)
+        prices = np.round(product_prices[products] * (1.0 - discounts), 2)
+        codes = (f"SYN{seed}-{position:010d}" for position in range(start, start + size))
+        yield from zip(
+            product_ids[products].tolist(),
+            seller_ids[sellers].tolist(),
+            dates.tolist(),
+            quantities.tolist(),
+            prices.tolist(),
+            codes,
+        )
+
+
+def populate_synthetic(
+    *,
+    products: int = 1_000,
+    sellers: int = 100,
+    sales: int = 100_000,
+    seed: int = 42,
+    pool: ConnectionPool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+) -> IngestionReport:
+    """Fill the database with a synthetic catalog and ``sales`` rows through the bulk loader."""
+    pool = pool or get_pool()
+    with pool.connection() as connection:
+        apply_schema(connection)
+        seed_catalog(connection, products, sellers, seed=seed)
+        connection.commit()
+        product_id_by_sku, seller_id_by_code = load_id_maps(connection)
+        prices_by_sku = {
+            row["sku"]: row["unit_price"]
+            for row in connection.execute("SELECT sku, unit_price FROM products WHERE sku LIKE 'SYN-P%'")
+        }
+    skus = [f"SYN-P{number:07d}" for number in range(1, products + 1)]
+    codes = [f"SYN-S{number:05d}" for number in range(1, sellers + 1)]
+    records = generate_sales(
+        sales,
+        np.array([product_id_by_sku[sku] for sku in skus], dtype=np.int64),
+        np.array([prices_by_sku[sku] for sku in skus], dtype=np.float64),
+        np.array([seller_id_by_code[code] for code in codes], dtype=np.int64),
+        seed=seed,
+        chunk_size=chunk_size,
+    )
+    report = insert_sales(records, pool=pool, chunk_size=chunk_size, progress=progress)
+    report.rows_read = sales
+    return report
+
+
+__all__ = ["generate_sales", "populate_synthetic", "seed_catalog", "zipf_weights"]
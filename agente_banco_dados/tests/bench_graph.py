@@ -0,0 +1,145 @@
+"""Per-node latency benchmark of the sales report graph on synthetic data.
+
+Run with ``python -m agente_banco_dados.tests.bench_graph`` (add ``--sizes 1000,100000``
+for a quick pass). For each sales volume a fresh database is filled by
+:func:`agente_banco_dados.synthetic.populate_synthetic` (bulk path) and the compiled
+graph is streamed ``--repeats`` times; the p50/max of every node's update is reported.
+
+The database lives in a temporary directory exposed through ``AGENT_DB_PATH``. The
+package reads it on import, so when it is unset the benchmark re-runs itself in a
+child process with the variable pointing at a temporary file (``sales.db`` is never
+touched).
+
+Without ``--llm`` the Gemini key is cleared and ``generate_insights`` measures the
+offline fallback path; with it, the insight cache (``insight_cache.db``) is disabled
+so the real model is called on every repetition instead of serving cache hits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from agente_banco_dados import db_init
+from agente_banco_dados.config import DATA_DIR, DB_PATH, config
+from agente_banco_dados.graph import create_app
+from agente_banco_dados.synthetic import populate_synthetic
+from agente_banco_dados.utils import insight_cache
+
+DEFAULT_SIZES = (1_000, 100_000, 10_000_000)
+
+
+@dataclass(slots=True)
+class NodeTiming:
+    """Latency (milliseconds) of one graph node for one sales volume."""
+
+    sales: int
+    node: str
+    repeats: int
+    p50_ms: float
+    max_ms: float
+
+
+def _time_nodes(app, repeats: int) -> dict[str, list[float]]:
+    """Time each update since the previous one, plus the whole run under ``grafo``.
+
+    Parallel branches of the same step report their completion offset within the step.
+    """
+    timings: dict[str, list[float]] = {}
+    for _ in range(repeats):
+        run_started = started = time.perf_counter()
+        for update in app.stream({}, stream_mode="updates"):
+            finished = time.perf_counter()
+            for node in update:
+                timings.setdefault(node, []).append((finished - started) * 1000.0)
+            started = finished
+        timings.setdefault("grafo", []).append((time.perf_counter() - run_started) * 1000.0)
+    return timings
+
+
+def run_benchmark(
+    sizes: Sequence[int],
+    *,
+    products: int = 1_000,
+    sellers: int = 100,
+    repeats: int = 5,
+    seed: int = 42,
+    use_llm: bool = False,
+) -> list[NodeTiming]:
+    """Fill a database per size and return the per-node latencies of the report graph."""
+    if DB_PATH.parent == DATA_DIR:
+        raise RuntimeError("Defina AGENT_DB_PATH fora de agente_banco_dados/data antes de rodar o benchmark.")
+    if not use_llm:
+        config.api_key = None
+    # Repetitions reuse the same report state: a cache hit would hide the model latency.
+    insight_cache.INSIGHT_CACHE_TTL_SECONDS = 0
+    app = create_app()
+    results: list[NodeTiming] = []
+    for size in sizes:
+        db_init.close_pools()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{DB_PATH}{suffix}").unlink(missing_ok=True)
+        db_init.ensure_data_directory()
+        load = populate_synthetic(products=products, sellers=sellers, sales=size, seed=seed)
+        print(f"{size:>10} vendas carregadas em {load.elapsed_seconds:.1f} s", flush=True)
+        for node, latencies in _time_nodes(app, repeats).items():
+            results.append(
+                NodeTiming(
+                    sales=size,
+                    node=node,
+                    repeats=len(latencies),
+                    p50_ms=round(float(np.percentile(latencies, 50)), 3),
+                    max_ms=round(max(latencies), 3),
+                )
+            )
+            print(_format(results[-1]), flush=True)
+    db_init.close_pools()
+    return results
+
+
+def _format(result: NodeTiming) -> str:
+    return f"{result.sales:>10} {result.node:<22} p50={result.p50_ms:10.3f}ms máx={result.max_ms:10.3f}ms"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--produtos", type=int, default=1_000)
+    parser.add_argument("--vendedores", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--llm", action="store_true", help="Chama o modelo real em generate_insights (sem cache de insights).")
+    parser.add_argument("--json", type=Path, help="Grava os resultados em JSON neste caminho.")
+    args = parser.parse_args(argv)
+
+    if not os.environ.get("AGENT_DB_PATH"):
+        with tempfile.TemporaryDirectory() as directory:
+            env = {**os.environ, "AGENT_DB_PATH": str(Path(directory) / "bench.db")}
+            command = [sys.executable, "-m", __spec__.name, *(sys.argv[1:] if argv is None else argv)]
+            return subprocess.run(command, env=env, check=False).returncode
+
+    results = run_benchmark(
+        [int(size) for size in args.sizes.split(",") if size.strip()],
+        products=args.produtos,
+        sellers=args.vendedores,
+        repeats=args.repeats,
+        seed=args.semente,
+        use_llm=args.llm,
+    )
+    if args.json is not None:
+        args.json.write_text(json.dumps([asdict(result) for result in results], indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
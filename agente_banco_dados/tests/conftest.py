@@ -0,0 +1,19 @@
+"""Shared fixtures for the sales agent tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados.utils import nodes
+from agente_banco_dados.utils.insight_cache import InsightCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_insight_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> InsightCache:
+    """Give every test an empty insight cache instead of the one next to ``sales.db``."""
+
+    cache = InsightCache(tmp_path / "insight_cache.db", ttl_seconds=3600)
+    monkeypatch.setattr(nodes, "get_insight_cache", lambda: cache)
+    return cache
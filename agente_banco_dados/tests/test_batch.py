@@ -0,0 +1,113 @@
+"""Tests for the batch report mode."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados import batch
+from agente_banco_dados.batch import format_batch_summary, load_report_specs, parse_report_specs, run_batch
+from agente_banco_dados.graph import create_app
+from agente_banco_dados.utils import nodes
+
+DELAY = 0.05
+
+
+@pytest.fixture()
+def fake_metrics(monkeypatch):
+    """Replace the queries and the model with fakes that track concurrent graph runs."""
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    llm_calls: list[str | None] = []
+
+    def _products(limit, *, start_date=None, end_date=None, region=None):
+        if region == "Erro":
+            raise RuntimeError("falha simulada")
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(DELAY)
+        with lock:
+            active["now"] -= 1
+        return [{"product_name": f"Produto {region or 'geral'}", "total_quantity": limit, "total_revenue": 10.0}]
+
+    def _sellers(limit, *, start_date=None, end_date=None, region=None):
+        return [{"seller_name": "Alice", "region": region or "SP", "total_quantity": 1, "total_revenue": 10.0}]
+
+    def _insights(products, sellers, period=None):
+        llm_calls.append(period)
+        return "1. Tendência: vendas estáveis.", 0.1
+
+    monkeypatch.setattr(batch, "initialize_database", lambda: None)
+    monkeypatch.setattr(nodes, "query_top_products", _products)
+    monkeypatch.setattr(nodes, "query_top_sellers", _sellers)
+    monkeypatch.setattr(nodes, "generate_sales_insights", _insights)
+    monkeypatch.setattr(nodes.config, "api_key", "test-key")
+    return active, llm_calls
+
+
+def test_parse_specs_resolves_last_days_and_validates() -> None:
+    specs = parse_report_specs(
+        [
+            {"name": "São Paulo semana", "last_days": 7, "region": "São Paulo"},
+            {"name": "Janeiro", "start_date": "2025-01-01", "end_date": "2025-01-31", "top_n_products": 10},
+        ],
+        today=date(2025, 3, 10),
+    )
+
+    assert specs[0].filename == "sao-paulo-semana.md"
+    assert specs[0].to_state() == {"start_date": "2025-03-04", "end_date": "2025-03-10", "region": "São Paulo"}
+    assert specs[1].to_state()["top_n_products"] == 10
+
+    with pytest.raises(ValueError, match="AAAA-MM-DD"):
+        parse_report_specs([{"name": "x", "start_date": "10/01/2025"}])
+    with pytest.raises(ValueError, match="desconhecidos: regiao"):
+        parse_report_specs([{"name": "x", "regiao": "SP"}])
+    with pytest.raises(ValueError, match="mesmo arquivo"):
+        parse_report_specs([{"name": "Relatório SP"}, {"name": "relatorio-sp"}])
+
+
+def test_load_specs_requires_a_json_list(tmp_path: Path) -> None:
+    path = tmp_path / "specs.json"
+    path.write_text('{"name": "x"}', encoding="utf-8")
+    with pytest.raises(ValueError, match="lista"):
+        load_report_specs(path)
+
+
+def test_batch_bounds_concurrency_and_writes_reports(tmp_path: Path, fake_metrics) -> None:
+    active, _ = fake_metrics
+    specs = parse_report_specs(
+        [{"name": f"Região {number}", "region": f"R{number}"} for number in range(6)]
+        + [{"name": "Quebrado", "region": "Erro"}]
+    )
+
+    report = run_batch(specs, tmp_path / "saida", max_concurrency=2, app=create_app())
+
+    assert active["peak"] == 2
+    assert [result.name for result in report.results] == [spec.name for spec in specs]
+    for result in report.results[:-1]:
+        assert result.error is None and result.latency_seconds >= DELAY
+        assert f"Produto {result.name.replace('Região ', 'R')}" in result.path.read_text(encoding="utf-8")
+    assert report.failed == [report.results[-1]]
+    assert "falha simulada" in report.results[-1].error
+    assert sorted(path.name for path in (tmp_path / "saida").iterdir()) == [
+        f"regiao-{number}.md" for number in range(6)
+    ]
+    summary = format_batch_summary(report)
+    assert "| Região 0" in summary and "(1 com erro)" in summary
+
+
+def test_batch_jobs_share_the_insight_cache(tmp_path: Path, fake_metrics) -> None:
+    _, llm_calls = fake_metrics
+    specs = parse_report_specs([{"name": "Primeiro", "region": "SP"}, {"name": "Segundo", "region": "SP"}])
+
+    report = run_batch(specs, tmp_path, max_concurrency=1, app=create_app())
+
+    assert llm_calls == ["região SP"]
+    assert [result.cache_hit for result in report.results] == [False, True]
+    assert "vendas estáveis" in (tmp_path / "segundo.md").read_text(encoding="utf-8")
@@ -0,0 +1,142 @@
+"""Tests for the NumPy columnar report source and its on-disk column cache."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from agente_banco_dados import columnar
+from agente_banco_dados.db_init import ConnectionPool
+from agente_banco_dados.reporting import query_top_products, query_top_sellers
+from agente_banco_dados.synthetic import populate_synthetic
+
+FILTERS = [
+    {},
+    {"start_date": "2024-02-10", "end_date": "2024-07-03"},
+    {"region": "Bahia"},
+    {"start_date": "2025-03-01", "region": "São Paulo"},
+    {"start_date": "2030-01-01"},
+]
+
+
+@pytest.fixture()
+def pool(tmp_path: Path):
+    pool = ConnectionPool(tmp_path / "sales.db", size=1)
+    populate_synthetic(products=40, sellers=10, sales=4_000, seed=9, pool=pool, chunk_size=1_000)
+    yield pool
+    pool.close()
+
+
+def _cache_dirs(pool: ConnectionPool) -> list[Path]:
+    return sorted(columnar.default_cache_dir(pool.path).iterdir())
+
+
+def _approx(rows: list[dict]) -> list[dict]:
+    return [{**row, "total_revenue": pytest.approx(row["total_revenue"], abs=0.01)} for row in rows]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_columnar_rankings_match_sql(pool: ConnectionPool, filters: dict) -> None:
+    for query, limit in ((query_top_products, 15), (query_top_sellers, 10)):
+        expected = query(limit, pool=pool, source="sales", **filters)
+        assert query(limit, pool=pool, source="columnar", **filters) == _approx(expected)
+
+
+def test_cache_is_reused_until_sales_change(pool: ConnectionPool, monkeypatch) -> None:
+    before = query_top_products(5, pool=pool, source="columnar")
+    (directory,) = _cache_dirs(pool)
+
+    fetches = []
+    original = columnar.fetch_sales_columns
+    monkeypatch.setattr(columnar, "fetch_sales_columns", lambda *args: fetches.append(1) or original(*args))
+    query_top_sellers(5, pool=pool, source="columnar")
+    assert fetches == [] and _cache_dirs(pool) == [directory]
+
+    top_name = before[0]["product_name"]
+    with pool.connection() as connection:
+        connection.execute(
+            "UPDATE sales SET quantity = quantity + 1000 WHERE sale_id = ("
+            "SELECT MIN(s.sale_id) FROM sales s JOIN products p USING (product_id) WHERE p.name = ?)",
+            (top_name,),
+        )
+        connection.commit()
+    after = query_top_products(5, pool=pool, source="columnar")
+
+    assert fetches == [1]
+    assert after[0]["total_quantity"] == before[0]["total_quantity"] + 1000
+    assert directory in _cache_dirs(pool) and len(_cache_dirs(pool)) == 2  # kept for other readers
+    assert after == _approx(query_top_products(5, pool=pool, source="sales"))
+
+
+def test_columns_are_memory_mapped(pool: ConnectionPool) -> None:
+    with pool.connection() as connection:
+        columns = columnar.load_sales_columns(connection, columnar.default_cache_dir(pool.path))
+        assert not connection.in_transaction
+    assert len(columns) == 4_000
+    assert columns.quantity.dtype == columnar.COLUMN_DTYPES["quantity"]
+    assert columns.revenue.filename is not None
+
+
+def test_empty_sales_table(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "empty.db", size=1)
+    populate_synthetic(products=3, sellers=2, sales=0, pool=pool)
+    assert query_top_products(pool=pool, source="columnar") == []
+    assert query_top_sellers(pool=pool, source="columnar") == []
+    pool.close()
+
+
+def test_fetch_keeps_column_dtypes_and_exact_integers(pool: ConnectionPool) -> None:
+    huge = 2**53 + 1
+    with pool.connection() as connection:
+        connection.execute(
+            "INSERT INTO sales (product_id, seller_id, sale_date, quantity, unit_price, order_code) "
+            "VALUES (1, 1, '2025-01-01', ?, 0.0, 'HUGE-1')",
+            (huge,),
+        )
+        connection.commit()
+        connection.execute("BEGIN")
+        columns = columnar.fetch_sales_columns(connection, chunk_size=999)
+        connection.rollback()
+
+    assert {name: values.dtype for name, values in columns.items()} == {
+        name: np.dtype(dtype) for name, dtype in columnar.COLUMN_DTYPES.items()
+    }
+    assert len(columns["quantity"]) == 4_001
+    assert int(columns["quantity"][-1]) == huge
+
+
+def test_old_snapshots_expire_after_the_grace_period(pool: ConnectionPool) -> None:
+    cache_dir = columnar.default_cache_dir(pool.path)
+    query_top_products(5, pool=pool, source="columnar")
+    (old,) = _cache_dirs(pool)
+    os.utime(old, (0, 0))
+    with pool.connection() as connection:
+        connection.execute("DELETE FROM sales WHERE sale_id = 1")
+
+    query_top_products(5, pool=pool, source="columnar")
+
+    (current,) = _cache_dirs(pool)
+    assert current != old and current.parent == cache_dir
+
+
+def test_load_rebuilds_a_directory_removed_by_another_process(pool: ConnectionPool, monkeypatch) -> None:
+    cache_dir = columnar.default_cache_dir(pool.path)
+    original = columnar._open_columns
+    removed = []
+
+    def _racing_open(directory: Path):
+        if not removed:
+            removed.append(directory)
+            shutil.rmtree(directory)
+        return original(directory)
+
+    monkeypatch.setattr(columnar, "_open_columns", _racing_open)
+    with pool.connection() as connection:
+        columns = columnar.load_sales_columns(connection, cache_dir)
+
+    assert len(columns) == 4_000
+    assert removed and removed[0].is_dir()
@@ -0,0 +1,82 @@
+"""Tests for the pooled SQLite connections used by the reporting queries."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados import db_init
+from agente_banco_dados.db_init import ConnectionPool, PoolClosedError
+from agente_banco_dados.reporting import query_top_products, query_top_sellers
+
+
+@pytest.fixture()
+def seeded_db(tmp_path: Path) -> Path:
+    """Create and seed a throwaway database file."""
+
+    path = tmp_path / "sales.db"
+    pool = ConnectionPool(path, size=1)
+    with pool.connection() as connection:
+        db_init.apply_schema(connection)
+        db_init.seed_products(connection)
+        db_init.seed_sellers(connection)
+        db_init.seed_sales(connection)
+    pool.close()
+    return path
+
+
+def test_pool_reuses_connections_up_to_size(seeded_db: Path) -> None:
+    pool = ConnectionPool(seeded_db, size=2, timeout=0.05)
+    with pool.connection() as first:
+        with pool.connection() as second:
+            assert first is not second
+            with pytest.raises(TimeoutError):
+                with pool.connection():
+                    pass
+    with pool.connection() as again:
+        assert again in (first, second)
+    pool.close()
+
+
+def test_read_only_pool_rejects_writes(seeded_db: Path) -> None:
+    pool = ConnectionPool(seeded_db, read_only=True)
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.connection() as connection:
+            connection.execute("DELETE FROM sales")
+    with pool.connection() as connection:
+        assert connection.execute("SELECT COUNT(*) FROM sales").fetchone()[0] == len(db_init.SALE_SEED)
+    pool.close()
+
+
+def test_closed_pool_refuses_new_borrowers(seeded_db: Path) -> None:
+    pool = ConnectionPool(seeded_db)
+    with pool.connection() as connection:
+        pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+    with pytest.raises(PoolClosedError):
+        with pool.connection():
+            pass
+
+
+def test_reporting_queries_share_a_read_only_pool_across_threads(seeded_db: Path) -> None:
+    pool = ConnectionPool(seeded_db, size=2, read_only=True)
+    results: list[tuple[list, list]] = []
+
+    def _report() -> None:
+        results.append((query_top_products(pool=pool), query_top_sellers(pool=pool)))
+
+    threads = [threading.Thread(target=_report) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result == results[0] for result in results)
+    assert results[0][0][0]["product_name"] == "Conference Speaker"
+    assert pool._created <= 2
+    pool.close()
@@ -29,7 +29,8 @@ def sample_state() -> Dict[str, object]:
 def test_generate_insights_node_returns_three_blocks(monkeypatch, sample_state):
     """The node must structure up to three insight blocks with latency metadata."""
 
-    def fake_generate(products, sellers):
+    def fake_generate(products, sellers, period=None):
+        assert period is None
         assert products == sample_state["top_products"]
         assert sellers == sample_state["top_sellers"]
         return (
@@ -0,0 +1,47 @@
+"""Tests for the parallel fan-out of the report graph."""
+
+from __future__ import annotations
+
+import time
+
+from agente_banco_dados.graph import create_app
+from agente_banco_dados.state import merge_metadata
+from agente_banco_dados.utils import nodes
+
+DELAY = 0.2
+
+
+def _slow(result):
+    def _call(*_args, **_kwargs):
+        time.sleep(DELAY)
+        return result
+
+    return _call
+
+
+def test_branches_overlap_and_join_assembles_report(monkeypatch) -> None:
+    products = [{"product_name": "Notebook Pro", "total_quantity": 20, "total_revenue": 45000.0}]
+    sellers = [{"seller_name": "Alice Alves", "region": "SP", "total_quantity": 25, "total_revenue": 30000.0}]
+    monkeypatch.setattr(nodes, "query_top_products", _slow(products))
+    monkeypatch.setattr(nodes, "query_top_sellers", _slow(sellers))
+    monkeypatch.setattr(nodes, "generate_sales_insights", _slow(("Notebook Pro lidera as vendas.", DELAY)))
+    monkeypatch.setattr(nodes, "build_markdown_report", _slow("## Produtos mais vendidos\n| Notebook Pro |"))
+
+    started = time.perf_counter()
+    result = create_app().invoke({"region": "SP"})
+    elapsed = time.perf_counter() - started
+
+    # Sequential execution would take four delays; the fan-out needs two.
+    assert elapsed < 3 * DELAY
+    markdown = result["report_markdown"]
+    assert markdown.startswith("## Produtos mais vendidos")
+    assert "- Notebook Pro lidera as vendas." in markdown
+    assert result["processed_records"] == 2
+    assert result["metadata"]["period"] == "região SP"
+    assert result["metadata"]["llm_latency_seconds"] == DELAY
+    assert result["metadata"]["processed_records"] == 2
+
+
+def test_merge_metadata_combines_branch_updates() -> None:
+    assert merge_metadata({"a": 1, "b": 1}, {"b": 2, "c": 3}) == {"a": 1, "b": 2, "c": 3}
+    assert merge_metadata(None, {"a": 1}) == {"a": 1}
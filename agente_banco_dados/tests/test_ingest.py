@@ -0,0 +1,78 @@
+"""Tests for the streaming CSV sales ingestion."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados import db_init
+from agente_banco_dados.db_init import SALES_INDEXES, ConnectionPool
+from agente_banco_dados.ingest import chunked, ingest_sales_csv, write_sales_csv
+
+
+@pytest.fixture()
+def catalog_pool(tmp_path: Path):
+    """Pool over a database holding only the product and seller catalog."""
+
+    pool = ConnectionPool(tmp_path / "sales.db", size=1)
+    with pool.connection() as connection:
+        db_init.apply_schema(connection)
+        db_init.seed_products(connection)
+        db_init.seed_sellers(connection)
+    yield pool
+    pool.close()
+
+
+def _index_names(connection: sqlite3.Connection) -> set[str]:
+    rows = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'sales'")
+    return {row[0] for row in rows}
+
+
+def test_chunked_streams_fixed_size_groups() -> None:
+    assert list(chunked(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_ingest_loads_rows_in_chunks_and_rebuilds_indexes(catalog_pool: ConnectionPool, tmp_path: Path) -> None:
+    rows = [(f"CSV-{number:03d}", "P-100", "S-200", "2025-02-01", 1 + number % 3, 2500.0) for number in range(10)]
+    rows += [
+        ("CSV-X01", "P-999", "S-200", "2025-02-01", 1, 10.0),
+        ("CSV-X02", "P-100", "S-999", "2025-02-01", 1, 10.0),
+        ("CSV-X03", "P-100", "S-200", "2025-02-01", "muitos", 10.0),
+        ("CSV-X04", "P-100", "S-200", "01/02/2025", 1, 10.0),
+        ("CSV-X05", "P-100", "S-200", "20250201", 1, 10.0),
+        ("CSV-X06", "P-100", "S-200", "2025-02-30", 1, 10.0),
+        ("CSV-000", "P-200", "S-100", "2025-02-02", 1, 890.0),
+    ]
+    path = write_sales_csv(tmp_path / "vendas.csv", rows)
+    progress: list[int] = []
+
+    report = ingest_sales_csv(path, pool=catalog_pool, chunk_size=4, progress=lambda done, _: progress.append(done))
+
+    assert (report.rows_read, report.rows_inserted, report.rows_skipped, report.rows_duplicate) == (17, 10, 6, 1)
+    assert report.rows_read == report.rows_inserted + report.rows_skipped + report.rows_duplicate
+    assert progress == [4, 8, 17]
+    assert report.rows_per_second > 0
+    with catalog_pool.connection() as connection:
+        total = connection.execute("SELECT SUM(quantity) FROM sales WHERE seller_id = 2").fetchone()[0]
+        assert total == sum(row[4] for row in rows[:10])
+        assert set(SALES_INDEXES) <= _index_names(connection)
+
+
+def test_reimport_counts_repeated_order_codes(catalog_pool: ConnectionPool, tmp_path: Path) -> None:
+    rows = [("DUP-1", "P-100", "S-100", "2025-02-01", 1, 10.0), ("DUP-2", "P-100", "S-100", "2025-02-01", 1, 10.0)]
+    path = write_sales_csv(tmp_path / "vendas.csv", [*rows, rows[0]])
+
+    first = ingest_sales_csv(path, pool=catalog_pool)
+    second = ingest_sales_csv(path, pool=catalog_pool)
+
+    assert (first.rows_inserted, first.rows_duplicate) == (2, 1)
+    assert (second.rows_read, second.rows_inserted, second.rows_duplicate) == (3, 0, 3)
+
+
+def test_ingest_rejects_missing_columns(catalog_pool: ConnectionPool, tmp_path: Path) -> None:
+    path = tmp_path / "vendas.csv"
+    path.write_text("order_code,sku\nA,P-100\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="seller_code"):
+        ingest_sales_csv(path, pool=catalog_pool)
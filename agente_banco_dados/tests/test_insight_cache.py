@@ -0,0 +1,75 @@
+"""Tests for the metrics-fingerprint cache of LLM insights."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados.config import ConfigurationError
+from agente_banco_dados.utils import insight_cache, nodes
+from agente_banco_dados.utils.insight_cache import InsightCache, insight_cache_key
+from agente_banco_dados.utils.prompts import SALES_PROMPT_VERSION
+
+PRODUCTS = [{"product_name": "Notebook Pro", "total_quantity": 20, "total_revenue": 45000.0}]
+SELLERS = [{"seller_name": "Alice Alves", "region": "SP", "total_quantity": 25, "total_revenue": 30000.0}]
+
+
+def _key(**overrides) -> str:
+    arguments = {"model": "gemini-2.5-flash", "prompt_version": SALES_PROMPT_VERSION, "period": None, **overrides}
+    return insight_cache_key(arguments.pop("products", PRODUCTS), SELLERS, **arguments)
+
+
+def test_key_normalizes_metrics_and_tracks_model_prompt_and_period() -> None:
+    same = [{"product_name": "Notebook Pro", "total_quantity": 20.0, "total_revenue": 45000.001}]
+    assert _key(products=same) == _key()
+    assert _key(model="gemini-2.5-pro") != _key()
+    assert _key(prompt_version="3") != _key()
+    assert _key(period="região SP") != _key()
+
+
+def test_entries_expire_after_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = InsightCache(tmp_path / "cache.db", ttl_seconds=60)
+    cache.put("chave", "texto", model="m")
+    assert cache.get("chave") == "texto"
+    now = time.time()
+    monkeypatch.setattr(insight_cache.time, "time", lambda: now + 61)
+    assert cache.get("chave") is None
+
+
+def test_node_serves_repeated_metrics_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str | None] = []
+
+    def fake_generate(products, sellers, period=None):
+        calls.append(period)
+        return "Notebook Pro lidera.\n\nAlice Alves cresce.", 1.5
+
+    monkeypatch.setattr(nodes, "generate_sales_insights", fake_generate)
+    state = {"top_products": PRODUCTS, "top_sellers": SELLERS, "metadata": {}}
+
+    first = nodes.generate_insights_node(state)
+    second = nodes.generate_insights_node(state)
+
+    assert len(calls) == 1
+    assert first["metadata"]["cache_hit"] is False
+    assert first["llm_latency_seconds"] == 1.5
+    assert second["metadata"]["cache_hit"] is True
+    assert second["llm_latency_seconds"] == 0.0
+    assert second["metadata"]["llm_latency_seconds"] == 0.0
+    assert second["insights"] == first["insights"]
+
+    nodes.generate_insights_node({**state, "region": "SP"})
+    assert calls == [None, "região SP"]
+
+
+def test_failed_generations_are_not_cached(monkeypatch: pytest.MonkeyPatch, isolated_insight_cache) -> None:
+    def failing_generate(*_args, **_kwargs):
+        raise ConfigurationError("GEMINI_API_KEY ausente.")
+
+    monkeypatch.setattr(nodes, "generate_sales_insights", failing_generate)
+    result = nodes.generate_insights_node({"top_products": PRODUCTS, "top_sellers": SELLERS})
+
+    assert result["insights"] == []
+    assert result["metadata"]["cache_hit"] is False
+    assert isolated_insight_cache.get(_key(model=nodes.config.model_name)) is None
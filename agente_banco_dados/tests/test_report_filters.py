@@ -0,0 +1,149 @@
+"""Tests for date-range and region filtered reports backed by the rollup tables."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados import db_init
+from agente_banco_dados.db_init import ConnectionPool
+from agente_banco_dados.reporting import describe_report_period, query_top_products, query_top_sellers, split_period
+from agente_banco_dados.synthetic import populate_synthetic
+from agente_banco_dados.utils.prompts import build_sales_prompt
+
+PERIODS = [
+    ("2024-01-05", "2024-03-10"),
+    ("2024-02-01", "2024-02-29"),
+    ("2024-06-10", "2024-06-20"),
+    (None, "2024-04-15"),
+    ("2025-11-03", None),
+]
+
+
+@pytest.fixture(scope="module")
+def pool(tmp_path_factory: pytest.TempPathFactory):
+    """Writer pool over a small synthetic database spanning two years."""
+
+    pool = ConnectionPool(tmp_path_factory.mktemp("filters") / "sales.db", size=1)
+    populate_synthetic(products=30, sellers=8, sales=5_000, seed=5, pool=pool, chunk_size=1_000)
+    yield pool
+    pool.close()
+
+
+def _raw_top_products(pool: ConnectionPool, start: str | None, end: str | None, region: str | None) -> list[dict]:
+    with pool.connection() as connection:
+        rows = connection.execute(
+            """
+            SELECT p.name AS product_name, SUM(s.quantity) AS total_quantity,
+                   ROUND(SUM(s.quantity * s.unit_price), 2) AS total_revenue
+            FROM sales s
+            JOIN products p ON p.product_id = s.product_id
+            JOIN sellers se ON se.seller_id = s.seller_id
+            WHERE s.sale_date BETWEEN COALESCE(?, '0000') AND COALESCE(?, '9999')
+              AND (? IS NULL OR se.region = ?)
+            GROUP BY p.product_id
+            ORDER BY total_quantity DESC, total_revenue DESC
+            LIMIT 5
+            """,
+            (start, end, region, region),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+@pytest.mark.parametrize(("start", "end"), PERIODS)
+def test_rollups_match_raw_aggregation(pool: ConnectionPool, start: str | None, end: str | None) -> None:
+    for region in (None, "Bahia"):
+        expected = _raw_top_products(pool, start, end, region)
+        assert query_top_products(5, pool=pool, start_date=start, end_date=end, region=region) == expected
+
+
+def test_seller_rollups_follow_triggers(pool: ConnectionPool) -> None:
+    with pool.connection() as connection:
+        connection.execute("DELETE FROM sales WHERE sale_date BETWEEN '2024-03-01' AND '2024-03-05'")
+        connection.execute("UPDATE sales SET sale_date = '2024-03-02' WHERE sale_date = '2024-04-01'")
+        expected = [
+            dict(row)
+            for row in connection.execute(
+                """
+                SELECT se.seller_id, SUM(s.quantity) AS total_quantity FROM sales s
+                JOIN sellers se ON se.seller_id = s.seller_id
+                WHERE s.sale_date BETWEEN '2024-02-20' AND '2024-04-10'
+                GROUP BY se.seller_id
+                """
+            )
+        ]
+    sellers = query_top_sellers(50, pool=pool, start_date="2024-02-20", end_date="2024-04-10")
+    assert sorted(row["total_quantity"] for row in sellers) == sorted(row["total_quantity"] for row in expected)
+
+
+def test_split_period_uses_months_between_partial_edges() -> None:
+    assert split_period("2025-01-05", "2025-03-10") == {
+        "first_from": "2025-01-05",
+        "first_to": "2025-01-31",
+        "month_from": "2025-02",
+        "month_to": "2025-02",
+        "last_from": "2025-03-01",
+        "last_to": "2025-03-10",
+    }
+    with pytest.raises(ValueError, match="Período inválido"):
+        split_period("2025-02-01", "2025-01-01")
+    with pytest.raises(ValueError, match="AAAA-MM-DD"):
+        split_period("01/02/2025", None)
+
+
+def test_period_reaches_the_prompt() -> None:
+    period = describe_report_period("2025-01-01", "2025-01-31", "Bahia")
+    assert period == "de 2025-01-01 a 2025-01-31, região Bahia"
+    assert "Período analisado: de 2025-01-01 a 2025-01-31, região Bahia." in build_sales_prompt([], [], period)
+    assert "todo o histórico" in build_sales_prompt([], [])
+    assert describe_report_period() is None
+
+
+def test_migration_backfills_rollups(tmp_path: Path) -> None:
+    path = tmp_path / "legacy.db"
+    pool = ConnectionPool(path, size=1)
+    with pool.connection() as connection:
+        db_init.apply_schema(connection)
+        db_init.seed_products(connection)
+        db_init.seed_sellers(connection)
+        db_init.seed_sales(connection)
+        for table in db_init.ROLLUPS:
+            connection.execute(f"DROP TABLE {table}")
+        for trigger in db_init.ROLLUP_TRIGGERS:
+            connection.execute(f"DROP TRIGGER {trigger}")
+        connection.execute("PRAGMA user_version = 2")
+    with pool.connection() as connection:
+        assert db_init.migrate_schema(connection) == db_init.SCHEMA_VERSION - 2
+    top = query_top_products(pool=pool, start_date="2025-01-01", end_date="2025-01-31")
+    assert top == query_top_products(pool=pool, source="sales")
+    pool.close()
+
+
+def test_region_change_rekeys_product_rollups(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "moves.db", size=1)
+    with pool.connection() as connection:
+        db_init.apply_schema(connection)
+        db_init.seed_products(connection)
+        db_init.seed_sellers(connection)
+        db_init.seed_sales(connection)
+
+    def assert_rollups_match_raw() -> None:
+        for region in (None, "São Paulo", "Nova"):
+            expected = _raw_top_products(pool, None, None, region)
+            assert query_top_products(5, pool=pool, start_date="2025-01-01", region=region) == expected
+
+    with pool.connection() as connection:
+        connection.execute("UPDATE sellers SET region = 'Nova' WHERE code = 'S-100'")
+    assert_rollups_match_raw()
+    assert query_top_products(5, pool=pool, start_date="2025-01-01", region="Nova")
+
+    with pool.connection() as connection:
+        connection.execute("DELETE FROM sales WHERE seller_id = (SELECT seller_id FROM sellers WHERE code = 'S-100')")
+        remaining = connection.execute(
+            "SELECT COUNT(*) FROM daily_product_sales WHERE region IN ('São Paulo', 'Nova')"
+        ).fetchone()[0]
+    assert remaining == 0
+    assert_rollups_match_raw()
+    assert query_top_sellers(5, pool=pool, start_date="2025-01-01", region="São Paulo") == []
+    pool.close()
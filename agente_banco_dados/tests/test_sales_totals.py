@@ -0,0 +1,130 @@
+"""Tests for the trigger-maintained product and seller totals."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados import db_init
+from agente_banco_dados.db_init import TOTALS_TRIGGERS, ConnectionPool
+from agente_banco_dados.ingest import insert_sales
+from agente_banco_dados.reporting import query_top_products, query_top_sellers
+
+
+@pytest.fixture()
+def pool(tmp_path: Path):
+    """Writer pool over a seeded throwaway database."""
+
+    pool = ConnectionPool(tmp_path / "sales.db", size=1)
+    with pool.connection() as connection:
+        db_init.apply_schema(connection)
+        db_init.seed_products(connection)
+        db_init.seed_sellers(connection)
+        db_init.seed_sales(connection)
+    yield pool
+    pool.close()
+
+
+def _totals(connection: sqlite3.Connection) -> tuple[list[tuple], list[tuple]]:
+    products = connection.execute(
+        "SELECT product_id, total_quantity, ROUND(total_revenue, 2) FROM product_totals ORDER BY product_id"
+    ).fetchall()
+    sellers = connection.execute(
+        "SELECT seller_id, total_quantity, ROUND(total_revenue, 2) FROM seller_totals ORDER BY seller_id"
+    ).fetchall()
+    return [tuple(row) for row in products], [tuple(row) for row in sellers]
+
+
+def _recomputed(connection: sqlite3.Connection) -> tuple[list[tuple], list[tuple]]:
+    db_init.refresh_sales_totals(connection)
+    return _totals(connection)
+
+
+def test_triggers_track_inserts_updates_and_deletes(pool: ConnectionPool) -> None:
+    with pool.connection() as connection:
+        connection.execute("UPDATE sales SET quantity = quantity + 5 WHERE order_code = 'ORD-001'")
+        connection.execute("UPDATE sales SET seller_id = 4, product_id = 6 WHERE order_code = 'ORD-002'")
+        connection.execute("DELETE FROM sales WHERE product_id = 3")
+        maintained = _totals(connection)
+        assert 3 not in {row[0] for row in maintained[0]}
+        assert maintained == _recomputed(connection)
+
+
+def test_totals_source_matches_full_aggregation(pool: ConnectionPool) -> None:
+    assert query_top_products(pool=pool, source="totals") == query_top_products(pool=pool, source="sales")
+    assert query_top_sellers(pool=pool, source="totals") == query_top_sellers(pool=pool, source="sales")
+    with pytest.raises(ValueError, match="cubo"):
+        query_top_products(pool=pool, source="cubo")
+
+
+def test_bulk_load_restores_triggers_and_refreshes_totals(pool: ConnectionPool) -> None:
+    records = [(1, 1, "2025-02-01", 2, 100.0, f"BULK-{number}") for number in range(50)]
+    insert_sales(records, pool=pool, chunk_size=20)
+    with pool.connection() as connection:
+        triggers = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        assert set(TOTALS_TRIGGERS) <= triggers
+        assert _totals(connection) == _recomputed(connection)
+        plan = " ".join(
+            row["detail"]
+            for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT product_id FROM product_totals "
+                "ORDER BY total_quantity DESC, total_revenue DESC LIMIT 3"
+            )
+        )
+    assert "idx_product_totals_rank" in plan
+
+
+def test_interrupted_bulk_load_is_repaired_on_next_open(pool: ConnectionPool) -> None:
+    with pool.connection() as connection:
+        db_init.drop_sales_indexes(connection)
+        db_init.drop_totals_triggers(connection)
+        connection.commit()
+        connection.execute(
+            "INSERT INTO sales (product_id, seller_id, sale_date, quantity, unit_price, order_code) "
+            "VALUES (1, 1, '2025-02-01', 7, 100.0, 'KILLED-1')"
+        )
+    # The process "dies" here: nothing put the triggers or indexes back.
+
+    counts = db_init.initialize_database(pool)
+
+    assert counts["sales"] == len(db_init.SALE_SEED) + 1
+    with pool.connection() as connection:
+        names = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+        assert set(db_init.SALES_BULK_TRIGGERS) | set(db_init.SALES_INDEXES) <= names
+        assert db_init.repair_interrupted_bulk_load(connection) is False
+        assert _totals(connection) == _recomputed(connection)
+
+
+def _derived_tables(connection: sqlite3.Connection) -> dict[str, list[tuple]]:
+    tables = ["product_totals", "seller_totals", *db_init.ROLLUPS, "table_stats"]
+    snapshot = {}
+    for table in tables:
+        rows = connection.execute(f"SELECT * FROM {table}").fetchall()
+        snapshot[table] = sorted(
+            tuple(round(value, 2) if isinstance(value, float) else value for value in row) for row in rows
+        )
+    return snapshot
+
+
+def test_derived_tables_match_refresh_after_mixed_writes(pool: ConnectionPool) -> None:
+    with pool.connection() as connection:
+        connection.execute("UPDATE sellers SET region = 'Nova' WHERE code = 'S-100'")
+        connection.execute("UPDATE sales SET seller_id = 2, sale_date = '2025-02-03' WHERE order_code = 'ORD-002'")
+        connection.execute("DELETE FROM sales WHERE order_code = 'ORD-009'")
+        connection.execute(
+            "INSERT OR REPLACE INTO sales (product_id, seller_id, sale_date, quantity, unit_price, order_code) "
+            "VALUES (2, 3, '2025-03-01', 11, 900.0, 'ORD-004')"
+        )
+        connection.execute("UPDATE sellers SET region = NULL WHERE code = 'S-300'")
+        connection.execute(
+            "REPLACE INTO sales (product_id, seller_id, sale_date, quantity, unit_price, order_code) "
+            "VALUES (5, 1, '2025-01-10', 1, 1590.0, 'ORD-005')"
+        )
+        maintained = _derived_tables(connection)
+        assert dict(connection.execute("SELECT 'sales', COUNT(*) FROM sales").fetchall()) == {
+            "sales": len(db_init.SALE_SEED) - 1
+        }
+        db_init.refresh_sales_totals(connection)
+        assert maintained == _derived_tables(connection)
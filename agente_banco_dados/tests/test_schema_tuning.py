@@ -0,0 +1,82 @@
+"""Tests for the sales indexes, schema migrations and PRAGMA tuning profile."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados import db_init
+from agente_banco_dados.db_init import SALES_INDEXES, SCHEMA_VERSION, ConnectionPool
+
+
+def _index_names(connection: sqlite3.Connection) -> set[str]:
+    rows = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'sales'")
+    return {row[0] for row in rows}
+
+
+def test_legacy_database_is_migrated_to_current_schema(tmp_path: Path) -> None:
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as legacy:
+        legacy.executescript(db_init.SCHEMA_SQL)
+    assert not set(SALES_INDEXES) & _index_names(sqlite3.connect(path))
+
+    pool = ConnectionPool(path, size=1)
+    with pool.connection() as connection:
+        db_init.apply_schema(connection)
+        assert db_init.migrate_schema(connection) == 0
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert set(SALES_INDEXES) <= _index_names(connection)
+    pool.close()
+
+
+def test_failed_migration_keeps_previous_version(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as legacy:
+        legacy.executescript(db_init.SCHEMA_SQL)
+    broken = "CREATE TABLE half_done (id INTEGER);\nINSERT INTO missing_table VALUES (1);"
+    monkeypatch.setattr(db_init, "MIGRATIONS", [broken])
+    monkeypatch.setattr(db_init, "SCHEMA_VERSION", 1)
+
+    connection = sqlite3.connect(path)
+    with pytest.raises(sqlite3.OperationalError, match="missing_table"):
+        db_init.migrate_schema(connection)
+    assert connection.execute("PRAGMA user_version").fetchone()[0] == 0
+    assert not connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'half_done'").fetchall()
+    connection.close()
+
+
+def test_top_queries_use_covering_indexes(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "sales.db", size=1)
+    with pool.connection() as connection:
+        db_init.apply_schema(connection)
+        plan = " ".join(
+            row["detail"]
+            for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT seller_id, SUM(quantity * unit_price) FROM sales GROUP BY seller_id"
+            )
+        )
+    assert "COVERING INDEX idx_sales_seller_cover" in plan
+    pool.close()
+
+
+def test_performance_profile_enables_wal_on_writers_only(tmp_path: Path) -> None:
+    path = tmp_path / "tuned.db"
+    writer = ConnectionPool(path, tuning="performance")
+    with writer.connection() as connection:
+        db_init.apply_schema(connection)
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+    reader = ConnectionPool(path, read_only=True, tuning="performance")
+    with reader.connection() as connection:
+        assert connection.execute("PRAGMA cache_size").fetchone()[0] == -64 * 1024
+    reader.close()
+    writer.close()
+
+
+def test_unknown_tuning_profile_is_rejected(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "sales.db", tuning="turbo")
+    with pytest.raises(ValueError, match="turbo"):
+        with pool.connection():
+            pass
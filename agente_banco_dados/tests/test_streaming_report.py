@@ -0,0 +1,99 @@
+"""Tests for the streaming markdown writer and the top-N request parameters."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from agente_banco_dados.config import TOP_N_PRODUCTS, TOP_N_SELLERS
+from agente_banco_dados.db_init import ConnectionPool
+from agente_banco_dados.reporting import (
+    build_markdown_report,
+    describe_report_period,
+    format_markdown_table,
+    query_top_products,
+    query_top_sellers,
+    write_markdown_report,
+)
+from agente_banco_dados.synthetic import populate_synthetic
+from agente_banco_dados.utils import nodes
+
+
+@pytest.fixture(scope="module")
+def pool(tmp_path_factory: pytest.TempPathFactory):
+    """Writer pool over a synthetic catalog large enough for top-N in the thousands."""
+
+    pool = ConnectionPool(tmp_path_factory.mktemp("streaming") / "sales.db", size=1)
+    populate_synthetic(products=2_000, sellers=50, sales=20_000, seed=3, pool=pool, chunk_size=5_000)
+    yield pool
+    pool.close()
+
+
+def _streamed(pool: ConnectionPool, **kwargs) -> tuple[str, dict[str, int]]:
+    sink = io.StringIO()
+    written = write_markdown_report(sink, pool=pool, **kwargs)
+    return sink.getvalue(), written
+
+
+@pytest.mark.parametrize(
+    ("limits", "filters"),
+    [
+        ((TOP_N_PRODUCTS, TOP_N_SELLERS), {}),
+        ((1_500, 40), {}),
+        ((25, 10), {"start_date": "2024-02-01", "end_date": "2024-05-15", "region": "Bahia"}),
+        ((5, 5), {"start_date": "2030-01-01", "end_date": "2030-12-31"}),
+    ],
+)
+def test_streamed_report_matches_in_memory_report(pool: ConnectionPool, limits, filters) -> None:
+    products = query_top_products(limits[0], pool=pool, **filters)
+    sellers = query_top_sellers(limits[1], pool=pool, **filters)
+    expected = build_markdown_report(products, sellers, period=describe_report_period(**filters))
+
+    streamed, written = _streamed(pool, top_products=limits[0], top_sellers=limits[1], **filters)
+
+    assert streamed == expected + "\n"
+    assert written == {"products": len(products), "sellers": len(sellers)}
+
+
+def test_large_top_n_streams_every_ranked_row(pool: ConnectionPool) -> None:
+    streamed, written = _streamed(pool, top_products=1_500, top_sellers=TOP_N_SELLERS, source="totals")
+
+    assert written["products"] == 1_500
+    product_lines = streamed.split("## Melhores vendedores")[0].strip().splitlines()[6:]
+    assert len(product_lines) == 1_500
+    assert len({len(line) for line in product_lines}) == 1
+
+
+def test_format_markdown_table_pads_to_widest_cell() -> None:
+    table = format_markdown_table(("A", "Valor"), [("longo", "1"), ("x", "12345678")])
+
+    assert table.splitlines() == [
+        "| A     | Valor    |",
+        "| ----- | -------- |",
+        "| longo | 1        |",
+        "| x     | 12345678 |",
+    ]
+    assert format_markdown_table(("A",), []) == "| A |\n| - |"
+
+
+def test_top_n_state_parameters_reach_the_queries(monkeypatch) -> None:
+    limits: dict[str, int] = {}
+
+    def _query(name):
+        def _call(limit, **_filters):
+            limits[name] = limit
+            return []
+
+        return _call
+
+    monkeypatch.setattr(nodes, "query_top_products", _query("products"))
+    monkeypatch.setattr(nodes, "query_top_sellers", _query("sellers"))
+
+    nodes.load_top_products({"top_n_products": 250})
+    nodes.load_top_sellers({"top_n_sellers": 40})
+    assert limits == {"products": 250, "sellers": 40}
+
+    nodes.load_top_products({})
+    nodes.load_top_sellers({})
+    assert limits == {"products": TOP_N_PRODUCTS, "sellers": TOP_N_SELLERS}
@@ -0,0 +1,47 @@
+"""Tests for the deterministic synthetic sales generator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from agente_banco_dados.db_init import ConnectionPool
+from agente_banco_dados.reporting import query_top_products
+from agente_banco_dados.synthetic import generate_sales, populate_synthetic, zipf_weights
+
+
+def test_generated_sales_are_deterministic_per_seed() -> None:
+    ids = np.arange(1, 51)
+    prices = np.full(50, 100.0)
+    first = list(generate_sales(500, ids, prices, ids[:5], seed=3, chunk_size=128))
+    again = list(generate_sales(500, ids, prices, ids[:5], seed=3, chunk_size=128))
+    other = list(generate_sales(500, ids, prices, ids[:5], seed=4, chunk_size=128))
+
+    assert first == again
+    assert first != other
+    assert len({record[5] for record in first}) == 500
+    assert all(record[3] > 0 and record[4] <= 100.0 for record in first)
+
+
+def test_zipf_popularity_is_skewed() -> None:
+    weights = zipf_weights(1_000, 1.1)
+    assert abs(weights.sum() - 1.0) < 1e-12
+    assert weights[:10].sum() > 0.3
+
+
+def test_populate_synthetic_loads_catalog_and_sales(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "sales.db", size=1)
+    report = populate_synthetic(products=40, sellers=6, sales=2_000, seed=1, pool=pool, chunk_size=512)
+    rerun = populate_synthetic(products=40, sellers=6, sales=2_000, seed=1, pool=pool, chunk_size=512)
+
+    assert (report.rows_read, report.rows_inserted) == (2_000, 2_000)
+    assert (rerun.rows_inserted, rerun.rows_duplicate) == (0, 2_000)
+    with pool.connection() as connection:
+        counts = connection.execute(
+            "SELECT (SELECT COUNT(*) FROM products), (SELECT COUNT(*) FROM sellers), (SELECT COUNT(*) FROM sales)"
+        ).fetchone()
+    assert tuple(counts) == (40, 6, 2_000)
+    top = query_top_products(pool=pool)
+    assert top[0]["total_quantity"] > top[-1]["total_quantity"]
+    pool.close()
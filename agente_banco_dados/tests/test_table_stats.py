@@ -0,0 +1,50 @@
+"""Tests for the maintained row counters and the initialization fast path."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agente_banco_dados import db_init
+from agente_banco_dados.db_init import ConnectionPool
+from agente_banco_dados.ingest import insert_sales
+
+
+@pytest.fixture()
+def pool(tmp_path: Path):
+    pool = ConnectionPool(tmp_path / "sales.db", size=1)
+    yield pool
+    pool.close()
+
+
+def test_counters_follow_writes_and_bulk_loads(pool: ConnectionPool) -> None:
+    counts = db_init.initialize_database(pool)
+    assert counts == {"products": 6, "sellers": 4, "sales": len(db_init.SALE_SEED)}
+
+    with pool.connection() as connection:
+        connection.execute("DELETE FROM sales WHERE order_code IN ('ORD-001', 'ORD-002')")
+        connection.execute("INSERT INTO sellers (code, name, region) VALUES ('S-900', 'Nova', NULL)")
+    insert_sales([(1, 1, "2025-03-01", 1, 10.0, f"BULK-{number}") for number in range(30)], pool=pool)
+
+    with pool.connection() as connection:
+        assert db_init.get_row_counts(connection) == db_init.get_row_counts(connection, exact=True)
+        assert db_init.get_row_counts(connection)["sales"] == len(db_init.SALE_SEED) - 2 + 30
+
+
+def test_initialize_skips_schema_and_seed_when_current(pool: ConnectionPool, monkeypatch) -> None:
+    first = db_init.initialize_database(pool)
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("fast path should skip schema and seed")
+
+    monkeypatch.setattr(db_init, "apply_schema", _unexpected)
+    monkeypatch.setattr(db_init, "seed_sales", _unexpected)
+    assert db_init.initialize_database(pool) == first
+
+
+def test_initialize_reseeds_when_counts_fall_short(pool: ConnectionPool) -> None:
+    db_init.initialize_database(pool)
+    with pool.connection() as connection:
+        connection.execute("DELETE FROM sales")
+    assert db_init.initialize_database(pool)["sales"] == len(db_init.SALE_SEED)
@@ -1,7 +1,14 @@
 """Utility exports for the SQLite sales agent."""
 
 from .llm import generate_sales_insights
-from .nodes import generate_insights_node, load_sales_metrics, render_sales_report
+from .nodes import (
+    generate_insights_node,
+    load_sales_metrics,
+    load_top_products,
+    load_top_sellers,
+    render_sales_report,
+    render_sales_tables,
+)
 from .prompts import SALES_INSIGHT_SYSTEM, build_sales_prompt
 
 __all__ = [
@@ -10,5 +17,8 @@ __all__ = [
     "generate_sales_insights",
     "generate_insights_node",
     "load_sales_metrics",
+    "load_top_products",
+    "load_top_sellers",
     "render_sales_report",
+    "render_sales_tables",
 ]
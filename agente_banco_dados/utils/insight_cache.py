@@ -0,0 +1,106 @@
+"""SQLite-backed cache of LLM sales insights keyed by a fingerprint of the metrics."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from agente_banco_dados.config import INSIGHT_CACHE_PATH, INSIGHT_CACHE_TTL_SECONDS
+from agente_banco_dados.db_init import ConnectionPool, get_pool
+
+CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS insight_cache (
+    cache_key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    insights TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+def insight_cache_key(
+    products: Iterable[Mapping[str, object]],
+    sellers: Iterable[Mapping[str, object]],
+    *,
+    model: str,
+    prompt_version: str,
+    period: str | None = None,
+) -> str:
+    """Return the SHA-256 fingerprint of the normalized metrics, model, prompt version and period."""
+    payload = {
+        "products": [
+            [str(item["product_name"]), int(item["total_quantity"]), round(float(item["total_revenue"]), 2)]
+            for item in products
+        ],
+        "sellers": [
+            [
+                str(item["seller_name"]),
+                str(item["region"]),
+                int(item["total_quantity"]),
+                round(float(item["total_revenue"]), 2),
+            ]
+            for item in sellers
+        ],
+        "model": model,
+        "prompt_version": prompt_version,
+        "period": period,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class InsightCache:
+    """Insight texts stored in an ``insight_cache`` table, expiring after ``ttl_seconds``."""
+
+    def __init__(self, path: str | Path = INSIGHT_CACHE_PATH, *, ttl_seconds: float = INSIGHT_CACHE_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._ready = False
+
+    def _pool(self) -> ConnectionPool:
+        # Looked up on every call so the cache keeps working after ``close_pools()``.
+        pool = get_pool(self.path)
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with pool.connection() as connection:
+                connection.execute(CACHE_SCHEMA_SQL)
+            self._ready = True
+        return pool
+
+    def get(self, key: str) -> str | None:
+        """Return the cached insight text for ``key`` unless missing or expired."""
+        with self._pool().connection() as connection:
+            row = connection.execute(
+                "SELECT insights FROM insight_cache WHERE cache_key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds),
+            ).fetchone()
+        return None if row is None else row["insights"]
+
+    def put(self, key: str, insights: str, *, model: str) -> None:
+        """Store ``insights`` under ``key`` and drop expired entries."""
+        now = time.time()
+        with self._pool().connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO insight_cache (cache_key, model, insights, created_at) VALUES (?, ?, ?, ?)",
+                (key, model, insights, now),
+            )
+            connection.execute("DELETE FROM insight_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+
+_CACHE: InsightCache | None = None
+
+
+def get_insight_cache() -> InsightCache | None:
+    """Return the shared cache configured by ``AGENT_INSIGHT_CACHE_*`` (``None`` when the TTL is 0)."""
+    global _CACHE
+    if INSIGHT_CACHE_TTL_SECONDS <= 0:
+        return None
+    if _CACHE is None:
+        _CACHE = InsightCache()
+    return _CACHE
+
+
+__all__ = ["CACHE_SCHEMA_SQL", "InsightCache", "get_insight_cache", "insight_cache_key"]
@@ -15,11 +15,12 @@ from agente_banco_dados.utils.prompts import SALES_INSIGHT_SYSTEM, build_sales_p
 def generate_sales_insights(
     products: Sequence[ProductSummary],
     sellers: Sequence[SellerSummary],
+    period: str | None = None,
 ) -> Tuple[str, float]:
     """Invoke the configured Gemini model and return the narrative plus call latency in seconds."""
 
     llm = config.create_llm()
-    prompt = build_sales_prompt(products, sellers)
+    prompt = build_sales_prompt(products, sellers, period)
     start = perf_counter()
     response = llm.invoke(
         [
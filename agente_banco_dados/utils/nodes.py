@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime, timezone
 from typing import Dict, List
 
-from agente_banco_dados.config import DB_PATH, ConfigurationError
+from agente_banco_dados.config import DB_PATH, TOP_N_PRODUCTS, TOP_N_SELLERS, ConfigurationError, config
 from agente_banco_dados.reporting import (
     build_markdown_report,
+    describe_report_period,
     query_top_products,
     query_top_sellers,
 )
@@ -17,7 +19,9 @@ from agente_banco_dados.state import (
     ReportState,
     SellerSummary,
 )
+from agente_banco_dados.utils.insight_cache import InsightCache, get_insight_cache, insight_cache_key
 from agente_banco_dados.utils.llm import generate_sales_insights
+from agente_banco_dados.utils.prompts import SALES_PROMPT_VERSION
 
 
 def _normalise_products(raw_products: List[Dict[str, object]]) -> List[ProductSummary]:
@@ -51,23 +55,84 @@ def _normalise_sellers(raw_sellers: List[Dict[str, object]]) -> List[SellerSumma
     return summaries
 
 
-def load_sales_metrics(_: ReportState) -> Dict[str, object]:
+def _report_filters(state: ReportState) -> Dict[str, str | None]:
+    """Return the optional period and region filters carried by the state."""
+
+    return {
+        "start_date": state.get("start_date") or None,
+        "end_date": state.get("end_date") or None,
+        "region": state.get("region") or None,
+    }
+
+
+def _source_metadata(filters: Dict[str, str | None]) -> Dict[str, object]:
+    metadata: Dict[str, object] = {"data_source": str(DB_PATH)}
+    period = describe_report_period(**filters)
+    if period:
+        metadata["period"] = period
+    return metadata
+
+
+def load_top_products(state: ReportState) -> Dict[str, object]:
+    """Fetch the top products (parallel branch of the metrics fan-out)."""
+
+    filters = _report_filters(state)
+    return {
+        "top_products": _normalise_products(
+            query_top_products(state.get("top_n_products") or TOP_N_PRODUCTS, **filters)
+        ),
+        "metadata": _source_metadata(filters),
+    }
+
+
+def load_top_sellers(state: ReportState) -> Dict[str, object]:
+    """Fetch the top sellers (parallel branch of the metrics fan-out)."""
+
+    filters = _report_filters(state)
+    return {
+        "top_sellers": _normalise_sellers(
+            query_top_sellers(state.get("top_n_sellers") or TOP_N_SELLERS, **filters)
+        ),
+        "metadata": _source_metadata(filters),
+    }
+
+
+def load_sales_metrics(state: ReportState) -> Dict[str, object]:
     """Fetch top products and sellers from the local SQLite database."""
 
-    products_raw = query_top_products()
-    sellers_raw = query_top_sellers()
-    processed_records = len(products_raw) + len(sellers_raw)
+    products = load_top_products(state)
+    sellers = load_top_sellers(state)
+    processed_records = len(products["top_products"]) + len(sellers["top_sellers"])
     return {
-        "top_products": _normalise_products(products_raw),
-        "top_sellers": _normalise_sellers(sellers_raw),
+        "top_products": products["top_products"],
+        "top_sellers": sellers["top_sellers"],
         "processed_records": processed_records,
-        "metadata": {
-            "processed_records": processed_records,
-            "data_source": str(DB_PATH),
-        },
+        "metadata": {**products["metadata"], "processed_records": processed_records},
     }
 
 
+def _cache_lookup(cache: InsightCache | None, key: str) -> str | None:
+    """Return cached insights, treating an unreadable cache as a miss."""
+
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except sqlite3.Error:
+        return None
+
+
+def _cache_store(cache: InsightCache | None, key: str, insights_text: str) -> None:
+    """Best-effort write of fresh insights; a cache failure never fails the report."""
+
+    if cache is None:
+        return
+    try:
+        cache.put(key, insights_text, model=config.model_name)
+    except sqlite3.Error:
+        pass
+
+
 def generate_insights_node(state: ReportState) -> Dict[str, object]:
     """Invoke the Gemini model to build narrative insights anchored in the sales metrics."""
 
@@ -79,7 +144,23 @@ def generate_insights_node(state: ReportState) -> Dict[str, object]:
     metadata.setdefault("data_source", str(DB_PATH))
 
     try:
-        insights_text, latency = generate_sales_insights(products, sellers)
+        period = describe_report_period(**_report_filters(state))
+        cache = get_insight_cache()
+        cache_key = insight_cache_key(
+            products,
+            sellers,
+            model=config.model_name,
+            prompt_version=SALES_PROMPT_VERSION,
+            period=period,
+        )
+        insights_text = _cache_lookup(cache, cache_key)
+        metadata["cache_hit"] = insights_text is not None
+        if insights_text is None:
+            insights_text, latency = generate_sales_insights(products, sellers, period=period)
+            if insights_text.strip():
+                _cache_store(cache, cache_key, insights_text)
+        else:
+            latency = 0.0
         insights = _structure_insights(insights_text)
         metadata["llm_latency_seconds"] = latency
         return {
@@ -114,13 +195,29 @@ def generate_insights_node(state: ReportState) -> Dict[str, object]:
         }
 
 
-def render_sales_report(state: ReportState) -> Dict[str, object]:
-    """Render the Markdown report given the pre-populated sales metrics."""
-
+def _require_metrics(state: ReportState) -> None:
     if "top_products" not in state or "top_sellers" not in state:
         raise KeyError("Sales metrics must be collected before rendering the report.")
 
-    report_markdown = build_markdown_report(state["top_products"], state["top_sellers"])
+
+def render_sales_tables(state: ReportState) -> Dict[str, object]:
+    """Render the Markdown tables, which do not depend on the LLM (runs alongside it)."""
+
+    _require_metrics(state)
+    return {
+        "report_tables": build_markdown_report(
+            state["top_products"],
+            state["top_sellers"],
+            describe_report_period(**_report_filters(state)),
+        )
+    }
+
+
+def render_sales_report(state: ReportState) -> Dict[str, object]:
+    """Assemble the final Markdown report from the tables, insights and metadata (join node)."""
+
+    _require_metrics(state)
+    report_markdown = state.get("report_tables") or render_sales_tables(state)["report_tables"]
 
     insight_lines = []
     if state.get("fallback_message"):
@@ -143,15 +240,16 @@ def render_sales_report(state: ReportState) -> Dict[str, object]:
         f"*Gerado em {generated_at}*",
     ]
 
+    processed_records = state.get("processed_records", len(state["top_products"]) + len(state["top_sellers"]))
     metadata = {**state.get("metadata", {}), "generated_at": generated_at}
     metadata.setdefault("data_source", str(DB_PATH))
-    if "processed_records" in state:
-        metadata.setdefault("processed_records", state["processed_records"])
+    metadata.setdefault("processed_records", processed_records)
     if "llm_latency_seconds" in state:
         metadata.setdefault("llm_latency_seconds", state["llm_latency_seconds"])
 
     return {
         "report_markdown": "\n".join(sections).strip(),
+        "processed_records": processed_records,
         "metadata": metadata,
     }
 
@@ -186,6 +284,9 @@ def _structure_insights(raw_text: str) -> List[InsightSummary]:
 
 __all__ = [
     "load_sales_metrics",
+    "load_top_products",
+    "load_top_sellers",
     "generate_insights_node",
+    "render_sales_tables",
     "render_sales_report",
 ]
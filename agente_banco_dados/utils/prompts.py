@@ -6,6 +6,9 @@ from textwrap import dedent
 from typing import Iterable, Mapping
 
 
+# Part of the insight cache key: bump whenever SALES_INSIGHT_SYSTEM or build_sales_prompt changes.
+SALES_PROMPT_VERSION = "2"
+
 SALES_INSIGHT_SYSTEM = dedent(
     """
     Você é uma analista de vendas experiente.
@@ -21,10 +24,15 @@ SALES_INSIGHT_SYSTEM = dedent(
 def build_sales_prompt(
     products: Iterable[Mapping[str, object]],
     sellers: Iterable[Mapping[str, object]],
+    period: str | None = None,
 ) -> str:
     """Return the user prompt describing sales metrics that the Gemini model must analyse."""
 
-    lines: list[str] = ["Dados consolidados a partir do banco SQLite local:", ""]
+    lines: list[str] = [
+        "Dados consolidados a partir do banco SQLite local:",
+        f"Período analisado: {period or 'todo o histórico de vendas'}.",
+        "",
+    ]
 
     lines.append("Produtos mais vendidos:")
     for item in products:
@@ -4,16 +4,19 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 import uuid
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from langchain_core.messages import HumanMessage
 from langgraph.checkpoint.memory import InMemorySaver
 
 from agente_perguntas.config import AppConfig
-from agente_perguntas.graph import build_graph
+from agente_perguntas.graph import build_faq_index, build_graph, build_learned_store
 from agente_perguntas.state import AgentState
+from agente_perguntas.utils.faq_store import compile_faq_file
 from agente_perguntas.utils.logging import log_interaction, setup_logging
 from agente_perguntas.utils.nodes import (
     DEFAULT_NOTES,
@@ -21,6 +24,7 @@ from agente_perguntas.utils.nodes import (
     resume_with_human_response,
 )
 from agente_perguntas.utils.prompts import DEMO_QUESTIONS, build_system_prompt
+from agente_perguntas.utils.similarity import FAQIndex, TokenNormalizer, meets_threshold, rank_batch
 
 
 @dataclass(slots=True)
@@ -47,6 +51,37 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "--thread-id",
         help="Identificador opcional para reutilizar checkpoints do LangGraph.",
     )
+    parser.add_argument(
+        "--lote",
+        type=Path,
+        help="Arquivo texto com uma pergunta por linha para pontuação em lote contra o FAQ (sem HITL).",
+    )
+    parser.add_argument(
+        "--compilar-faq",
+        nargs=2,
+        type=Path,
+        metavar=("ORIGEM_JSONL", "DESTINO"),
+        help="Compila um FAQ em JSONL para o índice binário mapeado em memória e encerra.",
+    )
+    parser.add_argument(
+        "--deduplicar",
+        type=float,
+        default=0.0,
+        metavar="LIMIAR",
+        help="Com --compilar-faq, remove perguntas com similaridade de Jaccard >= LIMIAR (0 desativa).",
+    )
+    parser.add_argument(
+        "--normalizacao",
+        default="",
+        metavar="ETAPAS",
+        help="Com --compilar-faq, etapas de normalização (accents,stem,stopwords ou pt para todas).",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=1,
+        help="Quantidade de correspondências exibidas por pergunta no modo --lote (padrão: 1).",
+    )
     return parser.parse_args(argv)
 
 
@@ -68,6 +103,11 @@ def _handle_interrupt(payload: dict[str, Any]) -> tuple[str, str]:
     if best_match:
         confidence = payload.get("best_match_confidence", 0.0)
         print(f"Melhor correspondência ({confidence:.2f}): {best_match}")
+    references = payload.get("faq_reference") or []
+    if len(references) > 1:
+        print(f"Outras correspondências (FAQ {payload.get('faq_version', '?')}):")
+        for reference in references[1:]:
+            print(f"  #{reference['position']} ({reference['score']:.2f}) {reference['question']}")
     message = input("Resposta do especialista (enter para padrão): ").strip() or ESCALATION_MESSAGE
     notes = input("Notas do especialista (opcional): ").strip() or DEFAULT_NOTES
     return message, notes
@@ -158,8 +198,94 @@ def run_demo(graph: Any, *, logger: Any) -> None:
         print("• Nenhuma pergunta pendente")
 
 
+def _read_questions(path: Path) -> list[str]:
+    """Return the non-empty, stripped lines of ``path``."""
+
+    with path.open(encoding="utf-8") as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+def run_batch(
+    faq_index: FAQIndex,
+    questions: list[str],
+    *,
+    threshold: float,
+    logger: Any,
+    top_k: int = 1,
+) -> list[InteractionResult]:
+    """Rank all ``questions`` at once with ``rank_batch`` and print the best matches."""
+
+    started = time.perf_counter()
+    ranking = rank_batch(questions, faq_index, limit=max(top_k, 1))
+    elapsed = time.perf_counter() - started
+
+    results: list[InteractionResult] = []
+    for question, matches in zip(questions, ranking.ranked(faq_index)):
+        if not matches:
+            results.append(
+                InteractionResult(
+                    question=question,
+                    answer=ESCALATION_MESSAGE,
+                    confidence=0.0,
+                    status="encaminhar para humano",
+                    notes="Nenhuma entrada de FAQ disponível para avaliação.",
+                )
+            )
+            print(f"Pergunta: {question}")
+            print("Status: encaminhar para humano (FAQ vazio)")
+            continue
+        best = matches[0]
+        status = (
+            "respondido automaticamente"
+            if meets_threshold(best.score, threshold)
+            else "encaminhar para humano"
+        )
+        results.append(
+            InteractionResult(
+                question=question,
+                answer=best.entry["answer"],
+                confidence=best.score,
+                status=status,
+                notes=f"Correspondência: {best.entry['question']}",
+            )
+        )
+        print(f"Pergunta: {question}")
+        print(f"Status: {status}")
+        for match in matches[:top_k]:
+            print(f"  ({match.score:.2f}) {match.entry['question']}")
+
+    resolved = sum(1 for item in results if item.status == "respondido automaticamente")
+    print()
+    print(f"Lote concluído: {len(results)} perguntas em {elapsed:.3f}s")
+    print(f"• Respondidas automaticamente: {resolved}")
+    print(f"• Encaminhadas para humano: {len(results) - resolved}")
+    logger.info(
+        "batch_ranked",
+        questions=len(results),
+        auto_answered=resolved,
+        elapsed_seconds=round(elapsed, 4),
+        scorer=faq_index.scorer,
+    )
+    return results
+
+
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
+    if args.compilar_faq:
+        source, destination = args.compilar_faq
+        try:
+            compile_faq_file(
+                source,
+                destination,
+                dedupe_threshold=args.deduplicar,
+                normalizer=TokenNormalizer.from_spec(args.normalizacao),
+            )
+        except (OSError, ValueError) as exc:
+            print(f"[Erro] Não foi possível compilar o FAQ: {exc}")
+            return 1
+        print(f"Índice do FAQ gravado em {destination}")
+        return 0
+
     try:
         config = AppConfig.load()
     except RuntimeError as exc:
@@ -167,6 +293,21 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     logger = setup_logging()
+    if args.lote:
+        try:
+            questions = _read_questions(args.lote)
+        except OSError as exc:
+            print(f"[Erro] Não foi possível ler {args.lote}: {exc}")
+            return 1
+        run_batch(
+            build_faq_index(config, build_learned_store(config)),
+            questions,
+            threshold=config.confidence_threshold,
+            logger=logger,
+            top_k=args.top_k,
+        )
+        return 0
+
     build_system_prompt(config.confidence_threshold)
     graph = build_graph(config, logger, checkpointer=InMemorySaver())
 
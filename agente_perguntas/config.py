@@ -7,10 +7,18 @@ import os
 from pathlib import Path
 
 from agente_perguntas.utils.logging import LOG_DIR
+from agente_perguntas.utils.minhash import CANDIDATE_STRATEGIES, CANDIDATES_EXACT
+from agente_perguntas.utils.similarity import PLAIN_NORMALIZER, SCORER_OVERLAP, SCORERS, TokenNormalizer
 
 DEFAULT_MODEL = "gemini-2.5-flash"
 DEFAULT_TEMPERATURE = 0.2
 DEFAULT_CONFIDENCE = 0.7
+DEFAULT_SCORER = SCORER_OVERLAP
+DEFAULT_FAQ_RELOAD_SECONDS = 5.0
+DEFAULT_ESCALATION_TOP_K = 3
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+DEFAULT_CANDIDATES = CANDIDATES_EXACT
 
 
 def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
@@ -26,6 +34,21 @@ def _parse_float(raw: str | None, fallback: float) -> float:
         return fallback
 
 
+def _parse_int(raw: str | None, fallback: int, *, minimum: int = 0) -> int:
+    """Return ``raw`` converted to ``int`` (at least ``minimum``) or ``fallback`` when invalid."""
+    try:
+        value = int(raw) if raw is not None else fallback
+    except (TypeError, ValueError):
+        return fallback
+    return max(minimum, value)
+
+
+def _parse_choice(raw: str | None, choices: tuple[str, ...], fallback: str) -> str:
+    """Return ``raw`` normalized to lowercase when it is one of ``choices``."""
+    value = (raw or "").strip().lower()
+    return value if value in choices else fallback
+
+
 @dataclass(frozen=True)
 class AppConfig:
     """Centralized runtime configuration loaded from environment variables."""
@@ -35,6 +58,16 @@ class AppConfig:
     temperature: float
     confidence_threshold: float
     log_dir: Path
+    similarity_scorer: str = DEFAULT_SCORER
+    faq_path: Path | None = None
+    faq_reload_seconds: float = DEFAULT_FAQ_RELOAD_SECONDS
+    escalation_top_k: int = DEFAULT_ESCALATION_TOP_K
+    answer_cache_size: int = DEFAULT_CACHE_SIZE
+    answer_cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS
+    learned_db_path: Path | None = None
+    candidate_strategy: str = DEFAULT_CANDIDATES
+    dedupe_threshold: float = 0.0
+    normalizer: TokenNormalizer = PLAIN_NORMALIZER
 
     @classmethod
     def load(cls) -> "AppConfig":
@@ -50,13 +83,53 @@ class AppConfig:
         confidence = _clamp(
             _parse_float(os.environ.get("AGENTE_PERGUNTAS_CONFIDENCE"), DEFAULT_CONFIDENCE)
         )
+        scorer = _parse_choice(os.environ.get("AGENTE_PERGUNTAS_SCORER"), SCORERS, DEFAULT_SCORER)
+        faq_path_raw = os.environ.get("AGENTE_PERGUNTAS_FAQ_PATH", "").strip()
+        reload_seconds = max(
+            0.0,
+            _parse_float(os.environ.get("AGENTE_PERGUNTAS_FAQ_RELOAD_SECONDS"), DEFAULT_FAQ_RELOAD_SECONDS),
+        )
+        escalation_top_k = _parse_int(
+            os.environ.get("AGENTE_PERGUNTAS_ESCALATION_TOP_K"), DEFAULT_ESCALATION_TOP_K, minimum=1
+        )
+        cache_size = _parse_int(os.environ.get("AGENTE_PERGUNTAS_CACHE_SIZE"), DEFAULT_CACHE_SIZE)
+        cache_ttl = max(
+            0.0, _parse_float(os.environ.get("AGENTE_PERGUNTAS_CACHE_TTL"), DEFAULT_CACHE_TTL_SECONDS)
+        )
+        candidate_strategy = _parse_choice(
+            os.environ.get("AGENTE_PERGUNTAS_CANDIDATES"), CANDIDATE_STRATEGIES, DEFAULT_CANDIDATES
+        )
+        dedupe_threshold = _clamp(_parse_float(os.environ.get("AGENTE_PERGUNTAS_DEDUPE_THRESHOLD"), 0.0))
+        normalizer = TokenNormalizer.from_spec(os.environ.get("AGENTE_PERGUNTAS_NORMALIZATION"))
+        learned_db_raw = os.environ.get("AGENTE_PERGUNTAS_LEARNED_DB", "").strip()
         return cls(
             gemini_api_key=api_key,
             model_name=model_name,
             temperature=temperature,
             confidence_threshold=confidence,
             log_dir=LOG_DIR,
+            similarity_scorer=scorer,
+            faq_path=Path(faq_path_raw).expanduser() if faq_path_raw else None,
+            faq_reload_seconds=reload_seconds,
+            escalation_top_k=escalation_top_k,
+            answer_cache_size=cache_size,
+            answer_cache_ttl_seconds=cache_ttl,
+            learned_db_path=Path(learned_db_raw).expanduser() if learned_db_raw else None,
+            candidate_strategy=candidate_strategy,
+            dedupe_threshold=dedupe_threshold,
+            normalizer=normalizer,
         )
 
 
-__all__ = ["AppConfig", "DEFAULT_MODEL", "DEFAULT_TEMPERATURE", "DEFAULT_CONFIDENCE"]
+__all__ = [
+    "AppConfig",
+    "DEFAULT_MODEL",
+    "DEFAULT_TEMPERATURE",
+    "DEFAULT_CONFIDENCE",
+    "DEFAULT_SCORER",
+    "DEFAULT_FAQ_RELOAD_SECONDS",
+    "DEFAULT_ESCALATION_TOP_K",
+    "DEFAULT_CACHE_SIZE",
+    "DEFAULT_CACHE_TTL_SECONDS",
+    "DEFAULT_CANDIDATES",
+]
@@ -10,22 +10,96 @@ from structlog.stdlib import BoundLogger
 
 from agente_perguntas.config import AppConfig
 from agente_perguntas.state import AgentState
+from agente_perguntas.utils.cache import AnswerCache
+from agente_perguntas.utils.faq_store import FAQIndexProvider, load_faq_index, prepare_entries
+from agente_perguntas.utils.learned import LearnedAnswerStore
 from agente_perguntas.utils.logging import setup_logging
+from agente_perguntas.utils.minhash import CANDIDATES_LSH, LSHCandidateGenerator
 from agente_perguntas.utils.nodes import evaluate_question
 from agente_perguntas.utils.prompts import get_faq_entries
+from agente_perguntas.utils.similarity import FAQIndex
 
 CompiledGraph = Any
 
 
+def build_faq_index(app_config: AppConfig, learned_store: LearnedAnswerStore | None = None) -> FAQIndex:
+    """Build the FAQ index from ``AGENTE_PERGUNTAS_FAQ_PATH`` or the embedded FAQ.
+
+    Questions are tokenized with ``AGENTE_PERGUNTAS_NORMALIZATION``, near-duplicate
+    questions are dropped when ``AGENTE_PERGUNTAS_DEDUPE_THRESHOLD`` is set,
+    ``AGENTE_PERGUNTAS_CANDIDATES=lsh`` attaches the MinHash/LSH pre-filter and
+    answers already stored in ``learned_store`` are merged on top of the base FAQ.
+    """
+
+    if app_config.faq_path is not None:
+        index = load_faq_index(
+            app_config.faq_path,
+            scorer=app_config.similarity_scorer,
+            dedupe_threshold=app_config.dedupe_threshold,
+            normalizer=app_config.normalizer,
+        )
+    else:
+        entries = prepare_entries(
+            get_faq_entries(),
+            dedupe_threshold=app_config.dedupe_threshold,
+            normalizer=app_config.normalizer,
+        )
+        index = FAQIndex(entries, scorer=app_config.similarity_scorer, normalizer=app_config.normalizer)
+    if app_config.candidate_strategy == CANDIDATES_LSH:
+        index.set_candidate_generator(LSHCandidateGenerator.from_index(index))
+    if learned_store is not None:
+        for learned in learned_store.load():
+            index.add_entry(learned.to_entry())
+    return index
+
+
+def build_learned_store(app_config: AppConfig) -> LearnedAnswerStore | None:
+    """Open the learned answers database when ``AGENTE_PERGUNTAS_LEARNED_DB`` is set."""
+
+    if app_config.learned_db_path is None:
+        return None
+    return LearnedAnswerStore(app_config.learned_db_path)
+
+
+def build_faq_provider(
+    app_config: AppConfig,
+    logger: BoundLogger | None = None,
+    *,
+    learned_store: LearnedAnswerStore | None = None,
+) -> FAQIndexProvider:
+    """Return a provider that hot-reloads the FAQ index when the configured file changes."""
+
+    return FAQIndexProvider(
+        lambda: build_faq_index(app_config, learned_store),
+        path=app_config.faq_path,
+        check_interval=app_config.faq_reload_seconds,
+        logger=logger,
+    )
+
+
 def build_graph(
     app_config: AppConfig,
     logger: BoundLogger,
     *,
     checkpointer: InMemorySaver | None = None,
+    faq_provider: FAQIndexProvider | None = None,
+    learned_store: LearnedAnswerStore | None = None,
 ) -> CompiledGraph:
-    """Compile and return the LangGraph workflow for the FAQ agent."""
-
-    faq_entries = get_faq_entries()
+    """Compile and return the LangGraph workflow for the FAQ agent.
+
+    ``learned_store`` defaults to the database configured in ``AGENTE_PERGUNTAS_LEARNED_DB``;
+    specialist answers are then recorded there and merged into the live index.
+    """
+
+    if learned_store is None:
+        learned_store = build_learned_store(app_config)
+    provider = faq_provider or build_faq_provider(app_config, logger, learned_store=learned_store)
+    answer_cache: AnswerCache[AgentState] | None = None
+    if app_config.answer_cache_size > 0:
+        answer_cache = AnswerCache(
+            max_entries=app_config.answer_cache_size,
+            ttl_seconds=app_config.answer_cache_ttl_seconds,
+        )
     builder = StateGraph(AgentState)
 
     def _evaluate(state: AgentState) -> AgentState:
@@ -33,7 +107,9 @@ def build_graph(
             state,
             settings=app_config,
             logger=logger,
-            faq_entries=faq_entries,
+            faq_index=provider.current(),
+            answer_cache=answer_cache,
+            learned_store=learned_store,
         )
 
     builder.add_node("evaluate", _evaluate)
@@ -53,4 +129,4 @@ def create_app(checkpointer: InMemorySaver | None = None) -> CompiledGraph:
     return build_graph(app_config, logger, checkpointer=checkpointer)
 
 
-__all__ = ["build_graph", "create_app"]
+__all__ = ["build_faq_index", "build_faq_provider", "build_graph", "build_learned_store", "create_app"]
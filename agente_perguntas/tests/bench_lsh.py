@@ -0,0 +1,84 @@
+"""Recall-vs-latency benchmark for the MinHash/LSH candidate generator.
+
+Run with ``python -m agente_perguntas.tests.bench_lsh --entries 100000``. Builds a
+synthetic FAQ (Zipf-distributed vocabulary, so a few tokens are very common), asks
+perturbed copies of FAQ questions and compares each LSH configuration against the
+exact inverted index: recall@1 (same best score as the exact ranking), mean number
+of rescored candidates and p50/p95 latency per question.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Sequence
+
+import numpy as np
+
+from agente_perguntas.tests.synthetic import synthetic_faq
+from agente_perguntas.utils.minhash import LSHCandidateGenerator
+from agente_perguntas.utils.prompts import FAQEntry
+from agente_perguntas.utils.similarity import SCORERS, FAQIndex
+
+CONFIGURATIONS = ((10, 2), (16, 3), (20, 3), (32, 4))
+
+
+def perturbed_questions(entries: Sequence[FAQEntry], count: int, *, seed: int = 11) -> list[str]:
+    """Return questions that drop one token of a FAQ question and add an unseen one."""
+    rng = np.random.default_rng(seed)
+    questions = []
+    for position in rng.integers(0, len(entries), size=count):
+        words = entries[int(position)]["question"].split()
+        words.pop(int(rng.integers(0, len(words))))
+        questions.append(" ".join([*words, f"novo{int(position)}"]))
+    return questions
+
+
+def _measure(index: FAQIndex, questions: Sequence[str]) -> tuple[list[float], np.ndarray]:
+    latencies, scores = [], []
+    for question in questions:
+        started = time.perf_counter()
+        best = index.top_match(question)
+        latencies.append(time.perf_counter() - started)
+        scores.append(best.score)
+    return latencies, np.array(scores)
+
+
+def _percentiles(latencies: Sequence[float]) -> str:
+    p50, p95 = np.percentile(np.array(latencies) * 1000.0, (50, 95))
+    return f"p50={p50:8.3f}ms p95={p95:8.3f}ms"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--questions", type=int, default=500)
+    parser.add_argument("--scorer", choices=SCORERS, default=SCORERS[0])
+    args = parser.parse_args(argv)
+
+    entries = synthetic_faq(args.entries)
+    questions = perturbed_questions(entries, args.questions)
+    index = FAQIndex(entries, scorer=args.scorer)
+    print(f"FAQ sintético: {len(entries)} entradas, {len(index.vocabulary)} tokens, scorer={args.scorer}")
+
+    exact_latencies, exact_scores = _measure(index, questions)
+    print(f"{'exato':>12}  recall@1=1.000 candidatos=  todos  {_percentiles(exact_latencies)}")
+
+    for bands, rows in CONFIGURATIONS:
+        started = time.perf_counter()
+        generator = LSHCandidateGenerator.from_index(index, bands=bands, rows=rows)
+        build_seconds = time.perf_counter() - started
+        index.set_candidate_generator(generator)
+        latencies, scores = _measure(index, questions)
+        index.set_candidate_generator(None)
+        sizes = [len(found) if (found := generator.candidates(set(q.split()))) is not None else 0 for q in questions]
+        recall = float(np.mean(np.isclose(scores, exact_scores)))
+        print(
+            f"{bands:>3}x{rows} bandas  recall@1={recall:.3f} candidatos={np.mean(sizes):7.1f} "
+            f"{_percentiles(latencies)} (construção {build_seconds:.2f}s)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""Latency and memory benchmark for FAQ similarity and the full graph path.
+
+Run with ``python -m agente_perguntas.tests.bench_similarity`` (add ``--sizes 1000,10000``
+for a quick pass). For every corpus size and scorer it reports p50/p95/p99 latency of
+
+* ``legacy``: :func:`rank_faq_by_similarity` (linear scan, skipped above ``--legacy-max``);
+* ``index``: :meth:`FAQIndex.rank` with the escalation top-k;
+* ``graph``: ``build_graph(...).invoke`` for one question per thread (cache disabled),
+
+plus the peak traced memory while building the index and the size of its arrays.
+Questions share a controlled fraction of tokens with a FAQ entry (``--overlaps``),
+so both automatic answers and escalations are exercised. Everything runs offline:
+the FAQ agent never calls the model and a placeholder API key is used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from agente_perguntas.config import DEFAULT_CONFIDENCE, DEFAULT_MODEL, DEFAULT_TEMPERATURE, AppConfig
+from agente_perguntas.graph import build_graph
+from agente_perguntas.tests.synthetic import controlled_questions, synthetic_faq
+from agente_perguntas.utils.faq_store import FAQIndexProvider
+from agente_perguntas.utils.logging import setup_logging
+from agente_perguntas.utils.similarity import SCORERS, FAQIndex, rank_faq_by_similarity
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_OVERLAPS = (0.25, 0.5, 0.75, 1.0)
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Latency percentiles (milliseconds) of one path for one corpus size and scorer."""
+
+    size: int
+    scorer: str
+    path: str
+    questions: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    build_peak_mb: float
+    index_mb: float
+
+
+def _time_each(call: Callable[[str], object], questions: Sequence[str]) -> np.ndarray:
+    latencies = np.empty(len(questions), dtype=np.float64)
+    for number, question in enumerate(questions):
+        started = time.perf_counter()
+        call(question)
+        latencies[number] = time.perf_counter() - started
+    return latencies * 1000.0
+
+
+def _build_index(entries, scorer: str) -> tuple[FAQIndex, float, float]:
+    tracemalloc.start()
+    index = FAQIndex(entries, scorer=scorer)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    arrays_bytes = sum(values.nbytes for values in index.arrays().values())
+    return index, peak / 2**20, arrays_bytes / 2**20
+
+
+def _graph_runner(index: FAQIndex, scorer: str, log_dir: Path) -> Callable[[str], object]:
+    settings = AppConfig(
+        gemini_api_key="offline-benchmark",
+        model_name=DEFAULT_MODEL,
+        temperature=DEFAULT_TEMPERATURE,
+        confidence_threshold=DEFAULT_CONFIDENCE,
+        log_dir=log_dir,
+        similarity_scorer=scorer,
+        answer_cache_size=0,
+    )
+    logger = setup_logging(enable_file_handler=False)
+    graph = build_graph(
+        settings,
+        logger,
+        checkpointer=InMemorySaver(),
+        faq_provider=FAQIndexProvider(lambda: index),
+    )
+    counter = iter(range(1 << 62))
+
+    def _invoke(question: str) -> object:
+        config = {"configurable": {"thread_id": f"bench-{next(counter)}"}}
+        return graph.invoke({"messages": [HumanMessage(content=question)]}, config=config)
+
+    return _invoke
+
+
+def run_benchmark(
+    sizes: Sequence[int],
+    *,
+    scorers: Sequence[str] = SCORERS,
+    overlaps: Sequence[float] = DEFAULT_OVERLAPS,
+    questions_per_overlap: int = 50,
+    legacy_max: int = 100_000,
+    top_k: int = 3,
+) -> list[BenchmarkResult]:
+    """Run every path for each corpus size and scorer and return the measurements."""
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory() as log_dir:
+        for size in sizes:
+            entries = synthetic_faq(size)
+            questions = [
+                question
+                for number, overlap in enumerate(overlaps)
+                for question in controlled_questions(entries, questions_per_overlap, overlap=overlap, seed=number)
+            ]
+            for scorer in scorers:
+                index, build_peak, index_size = _build_index(entries, scorer)
+                paths: dict[str, Callable[[str], object]] = {
+                    "index": lambda question: index.rank(question, limit=top_k),
+                    "graph": _graph_runner(index, scorer, Path(log_dir)),
+                }
+                if scorer == SCORERS[0] and size <= legacy_max:
+                    paths = {"legacy": lambda question: rank_faq_by_similarity(question, entries), **paths}
+                for path, call in paths.items():
+                    latencies = _time_each(call, questions)
+                    p50, p95, p99 = np.percentile(latencies, (50, 95, 99))
+                    results.append(
+                        BenchmarkResult(
+                            size=size,
+                            scorer=scorer,
+                            path=path,
+                            questions=len(questions),
+                            p50_ms=round(float(p50), 4),
+                            p95_ms=round(float(p95), 4),
+                            p99_ms=round(float(p99), 4),
+                            build_peak_mb=round(build_peak, 2),
+                            index_mb=round(index_size, 2),
+                        )
+                    )
+                    print(_format(results[-1]), flush=True)
+    return results
+
+
+def _format(result: BenchmarkResult) -> str:
+    return (
+        f"{result.size:>9} {result.scorer:<8} {result.path:<7} "
+        f"p50={result.p50_ms:9.3f}ms p95={result.p95_ms:9.3f}ms p99={result.p99_ms:9.3f}ms "
+        f"pico_construção={result.build_peak_mb:8.1f}MB índice={result.index_mb:7.1f}MB"
+    )
+
+
+def _parse_list(raw: str, convert: Callable[[str], float]) -> list:
+    return [convert(item) for item in raw.split(",") if item.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--scorers", default=",".join(SCORERS))
+    parser.add_argument("--overlaps", default=",".join(map(str, DEFAULT_OVERLAPS)))
+    parser.add_argument("--questions", type=int, default=50, help="Perguntas por nível de sobreposição.")
+    parser.add_argument("--legacy-max", type=int, default=100_000)
+    parser.add_argument("--json", type=Path, help="Grava os resultados em JSON neste caminho.")
+    args = parser.parse_args(argv)
+
+    setup_logging(enable_file_handler=False)
+    logging.getLogger("agente_perguntas").setLevel(logging.WARNING)
+    results = run_benchmark(
+        _parse_list(args.sizes, int),
+        scorers=[scorer for scorer in args.scorers.split(",") if scorer in SCORERS],
+        overlaps=_parse_list(args.overlaps, float),
+        questions_per_overlap=args.questions,
+        legacy_max=args.legacy_max,
+    )
+    if args.json is not None:
+        args.json.write_text(json.dumps([asdict(result) for result in results], indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
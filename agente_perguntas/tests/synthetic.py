@@ -0,0 +1,50 @@
+"""Deterministic synthetic FAQ corpora and question sets shared by the benchmarks."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from agente_perguntas.utils.prompts import FAQEntry
+
+
+def synthetic_faq(count: int, *, vocabulary_size: int = 20_000, seed: int = 7) -> list[FAQEntry]:
+    """Return ``count`` FAQ entries whose questions draw 4–10 Zipf-distributed tokens."""
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(4, 11, size=count)
+    tokens = np.minimum(rng.zipf(1.3, size=int(sizes.sum())), vocabulary_size)
+    entries: list[FAQEntry] = []
+    cursor = 0
+    for position, size in enumerate(sizes):
+        words = dict.fromkeys(f"t{token}" for token in tokens[cursor : cursor + size])
+        cursor += size
+        entries.append(FAQEntry(question=" ".join(words), answer=f"Resposta {position}", tags=[]))
+    return entries
+
+
+def controlled_questions(
+    entries: Sequence[FAQEntry],
+    count: int,
+    *,
+    overlap: float,
+    seed: int = 11,
+) -> list[str]:
+    """Return ``count`` questions sharing a fraction ``overlap`` of a FAQ question's tokens.
+
+    Each question keeps ``round(overlap * n)`` tokens of a random entry (``n`` tokens)
+    and pads with tokens absent from the FAQ, so its overlap score against the source
+    entry is exactly the kept fraction.
+    """
+    rng = np.random.default_rng(seed)
+    questions = []
+    for number, position in enumerate(rng.integers(0, len(entries), size=count)):
+        words = entries[int(position)]["question"].split()
+        kept = int(round(overlap * len(words)))
+        chosen = [words[index] for index in sorted(rng.choice(len(words), size=kept, replace=False))]
+        fresh = [f"novo{number}x{index}" for index in range(len(words) - kept)]
+        questions.append(" ".join([*chosen, *fresh]))
+    return questions
+
+
+__all__ = ["controlled_questions", "synthetic_faq"]
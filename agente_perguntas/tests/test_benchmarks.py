@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from agente_perguntas.tests.bench_similarity import run_benchmark
+from agente_perguntas.tests.synthetic import controlled_questions, synthetic_faq
+from agente_perguntas.utils.similarity import score_similarity
+
+
+def test_controlled_questions_hit_requested_overlap() -> None:
+    entries = synthetic_faq(50)
+    question = controlled_questions(entries, 1, overlap=0.5, seed=3)[0]
+    best = max(score_similarity(question, entry["question"]) for entry in entries)
+    words = question.split()
+    assert sum(not word.startswith("novo") for word in words) == round(0.5 * len(words))
+    assert 0.4 <= best <= 0.6
+
+
+def test_benchmark_runs_offline_for_every_path() -> None:
+    results = run_benchmark([200], overlaps=(0.5, 1.0), questions_per_overlap=3)
+    assert {(result.scorer, result.path) for result in results} == {
+        ("overlap", "legacy"),
+        ("overlap", "index"),
+        ("overlap", "graph"),
+        ("bm25", "index"),
+        ("bm25", "graph"),
+    }
+    assert all(result.p50_ms <= result.p99_ms for result in results)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from langchain_core.messages import HumanMessage
+
+from agente_perguntas.utils.cache import AnswerCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_answer_cache_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache: AnswerCache[str] = AnswerCache(max_entries=4, ttl_seconds=10.0, clock=clock)
+    cache.put("altero minha senha", "v1", "resposta")
+    assert cache.get("altero minha senha", "v1") == "resposta"
+    clock.now = 11.0
+    assert cache.get("altero minha senha", "v1") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_answer_cache_evicts_least_recently_used() -> None:
+    cache: AnswerCache[int] = AnswerCache(max_entries=2)
+    cache.put("a", "v1", 1)
+    cache.put("b", "v1", 2)
+    assert cache.get("a", "v1") == 1
+    cache.put("c", "v1", 3)
+    assert cache.get("b", "v1") is None
+    assert cache.get("a", "v1") == 1
+
+
+def test_answer_cache_is_cleared_when_faq_version_changes() -> None:
+    cache: AnswerCache[int] = AnswerCache()
+    cache.put("a", "v1", 1)
+    assert cache.get("a", "v2") is None
+    assert len(cache) == 0
+
+
+def test_graph_serves_repeated_question_from_cache(graph, thread_config, caplog) -> None:
+    caplog.set_level("INFO", logger="agente_perguntas")
+    first = thread_config("cache-1")
+    second = thread_config("cache-2")
+    graph.invoke({"messages": [HumanMessage(content="Como altero minha senha?")]}, config=first)
+    state = graph.invoke({"messages": [HumanMessage(content="minha senha: como ALTERO")]}, config=second)
+    assert state["status"] == "respondido automaticamente"
+    assert "senha" in state["notes"]
+    hits = [record.message for record in caplog.records if "answer_cache_hit" in record.message]
+    assert hits and '"cache_hits": 1' in hits[0]
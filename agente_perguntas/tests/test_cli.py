@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from agente_perguntas import cli
+from agente_perguntas.utils.learned import LearnedAnswerStore
 
 
 def test_run_single_question_writes_log(graph, logger, env_settings: Path, caplog) -> None:
@@ -30,3 +31,39 @@ def test_run_single_question_handles_interrupt(monkeypatch, graph, logger) -> No
     assert result.status == "encaminhar para humano"
     assert result.answer == "Resposta humana"
     assert result.notes == "Notas QA"
+
+
+def test_main_batch_mode_ranks_questions_file(env_settings: Path, tmp_path: Path, capsys) -> None:
+    questions_file = tmp_path / "perguntas.txt"
+    questions_file.write_text("Como altero minha senha?\n\nPreciso falar com um humano\n", encoding="utf-8")
+    assert cli.main(["--lote", str(questions_file), "--top-k", "2"]) == 0
+    output = capsys.readouterr().out
+    assert "Lote concluído: 2 perguntas" in output
+    assert "• Respondidas automaticamente: 1" in output
+    assert "• Encaminhadas para humano: 1" in output
+
+
+def test_main_batch_mode_escalates_with_empty_faq(env_settings: Path, tmp_path: Path, monkeypatch, capsys) -> None:
+    faq_file = tmp_path / "faq.jsonl"
+    faq_file.write_text("", encoding="utf-8")
+    monkeypatch.setenv("AGENTE_PERGUNTAS_FAQ_PATH", str(faq_file))
+    questions_file = tmp_path / "perguntas.txt"
+    questions_file.write_text("Como altero minha senha?\n", encoding="utf-8")
+
+    assert cli.main(["--lote", str(questions_file)]) == 0
+    output = capsys.readouterr().out
+    assert "FAQ vazio" in output
+    assert "• Encaminhadas para humano: 1" in output
+
+
+def test_main_batch_mode_uses_learned_answers(env_settings: Path, tmp_path: Path, monkeypatch, capsys) -> None:
+    learned_db = tmp_path / "learned.db"
+    LearnedAnswerStore(learned_db).record("Como emito a segunda via do boleto?", "Pelo portal.")
+    monkeypatch.setenv("AGENTE_PERGUNTAS_LEARNED_DB", str(learned_db))
+    questions_file = tmp_path / "perguntas.txt"
+    questions_file.write_text("Como emito a segunda via do boleto?\n", encoding="utf-8")
+
+    assert cli.main(["--lote", str(questions_file)]) == 0
+    output = capsys.readouterr().out
+    assert "(1.00) Como emito a segunda via do boleto?" in output
+    assert "• Respondidas automaticamente: 1" in output
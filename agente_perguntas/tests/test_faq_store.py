@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from agente_perguntas.utils.faq_store import (
+    FAQIndexProvider,
+    compile_faq_file,
+    load_faq_index,
+    load_faq_jsonl,
+    open_compiled_index,
+)
+from agente_perguntas.utils.prompts import FAQ_ENTRIES
+from agente_perguntas.utils.similarity import FAQIndex, TokenNormalizer
+
+
+def _write_jsonl(path: Path, entries) -> Path:
+    path.write_text("\n".join(json.dumps(entry, ensure_ascii=False) for entry in entries) + "\n", encoding="utf-8")
+    return path
+
+
+def test_load_faq_jsonl_normalizes_entries(tmp_path: Path) -> None:
+    source = _write_jsonl(tmp_path / "faq.jsonl", [{"question": "  Como   altero a senha? ", "answer": "Portal."}])
+    entries = load_faq_jsonl(source)
+    assert entries == [{"question": "Como altero a senha?", "answer": "Portal.", "tags": []}]
+
+
+def test_load_faq_jsonl_reports_invalid_line(tmp_path: Path) -> None:
+    source = tmp_path / "faq.jsonl"
+    source.write_text('{"question": "ok", "answer": "ok"}\n{"question": 1}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match=":2:"):
+        load_faq_jsonl(source)
+
+
+def test_compiled_index_is_memory_mapped_and_ranks_like_in_memory(tmp_path: Path) -> None:
+    source = _write_jsonl(tmp_path / "faq.jsonl", FAQ_ENTRIES)
+    compiled = compile_faq_file(source, tmp_path / "faq.idx")
+
+    mapped = open_compiled_index(compiled, scorer="bm25")
+    in_memory = FAQIndex(load_faq_jsonl(source), scorer="bm25")
+    assert isinstance(mapped.arrays()["positions"].base, np.memmap)
+    assert mapped.version == in_memory.version
+    for question in ("Como altero minha senha?", "Posso cancelar minha assinatura?"):
+        assert mapped.rank(question, limit=3) == in_memory.rank(question, limit=3)
+    assert load_faq_index(compiled).entries[1] == FAQ_ENTRIES[1]
+
+
+def test_compiled_index_keeps_normalization(tmp_path: Path) -> None:
+    source = _write_jsonl(tmp_path / "faq.jsonl", FAQ_ENTRIES)
+    compiled = compile_faq_file(source, tmp_path / "faq.idx", normalizer=TokenNormalizer.from_spec("pt"))
+    mapped = load_faq_index(compiled)
+    assert mapped.normalizer == TokenNormalizer.from_spec("pt")
+    assert mapped.top_match("formas de pagamentos aceitas?").entry == FAQ_ENTRIES[1]
+
+
+def test_provider_reloads_in_background_when_file_changes(tmp_path: Path) -> None:
+    source = _write_jsonl(tmp_path / "faq.jsonl", FAQ_ENTRIES[:2])
+    release = threading.Event()
+    loads = []
+
+    def _loader() -> FAQIndex:
+        if loads:
+            release.wait(timeout=5)
+        loads.append(source)
+        return load_faq_index(source)
+
+    provider = FAQIndexProvider(_loader, path=source, check_interval=0.0)
+    original = provider.current()
+    assert len(original) == 2
+
+    _write_jsonl(source, FAQ_ENTRIES)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert provider.current() is original
+    release.set()
+    assert provider.wait_for_reload(timeout=5)
+    reloaded = provider.current()
+    assert len(reloaded) == len(FAQ_ENTRIES)
+    assert reloaded.version != original.version
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import json
+
 from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
 
+from agente_perguntas.graph import build_graph
+from agente_perguntas.utils.faq_store import FAQIndexProvider
 from agente_perguntas.utils.nodes import resume_with_human_response
+from agente_perguntas.utils.similarity import FAQIndex
 
 
 def test_graph_answers_known_question(graph, thread_config) -> None:
@@ -33,3 +39,27 @@ def test_graph_handles_human_escalation(graph, thread_config) -> None:
     assert final_state["status"] == "encaminhar para humano"
     assert final_state["answer"] == "Especialista retornará em breve."
     assert final_state["notes"] == "Ticket aberto"
+
+
+def test_escalation_payload_is_bounded_by_top_k(app_config, logger, thread_config) -> None:
+    entries = [
+        {"question": f"Pergunta sintética número {index} sobre faturamento", "answer": "x" * 200, "tags": []}
+        for index in range(5000)
+    ]
+    index = FAQIndex(entries)
+    graph = build_graph(
+        app_config,
+        logger,
+        checkpointer=InMemorySaver(),
+        faq_provider=FAQIndexProvider(lambda: index),
+    )
+    config = thread_config("hitl-payload")
+    payload = None
+    for event in graph.stream({"messages": [HumanMessage(content="Preciso falar com um humano")]}, config=config):
+        interrupt_events = event.get("__interrupt__")
+        if interrupt_events:
+            payload = interrupt_events[0].value
+    assert payload is not None
+    assert payload["faq_version"] == index.version
+    assert len(payload["faq_reference"]) == app_config.escalation_top_k
+    assert len(json.dumps(payload, ensure_ascii=False)) < 1024
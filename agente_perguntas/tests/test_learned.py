@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from agente_perguntas.graph import build_faq_index, build_graph
+from agente_perguntas.utils.learned import LearnedAnswerStore
+from agente_perguntas.utils.nodes import resume_with_human_response
+from agente_perguntas.utils.prompts import FAQ_ENTRIES
+from agente_perguntas.utils.similarity import FAQIndex, rank_batch
+
+
+def test_add_entry_matches_rebuilt_index_for_overlap() -> None:
+    extra = {"question": "Como emito a segunda via do boleto?", "answer": "Portal.", "tags": []}
+    incremental = FAQIndex(FAQ_ENTRIES)
+    base_version = incremental.version
+    position = incremental.add_entry(extra)
+    rebuilt = FAQIndex([*FAQ_ENTRIES, extra])
+
+    assert position == len(FAQ_ENTRIES)
+    assert len(incremental) == len(rebuilt)
+    assert incremental.version != base_version
+    for question in ("segunda via do boleto", "Como altero minha senha?", "pergunta sem relação"):
+        assert incremental.rank(question, limit=3) == rebuilt.rank(question, limit=3)
+
+
+def test_rank_batch_sees_added_entries() -> None:
+    questions = ["segunda via do boleto", "Como altero minha senha?", "pergunta sem relação"]
+    for scorer in ("overlap", "bm25"):
+        index = FAQIndex(FAQ_ENTRIES, scorer=scorer)
+        index.add_entry({"question": "Como emito a segunda via do boleto?", "answer": "Portal.", "tags": []})
+
+        batch = rank_batch(questions, index, limit=3)
+
+        for question, row in zip(questions, batch.ranked(index)):
+            assert row == index.rank(question, limit=3)
+
+
+def test_add_entry_replaces_previous_answer_for_same_question() -> None:
+    index = FAQIndex(FAQ_ENTRIES, scorer="bm25")
+    first = index.add_entry({"question": "Qual o prazo do reembolso?", "answer": "10 dias.", "tags": []})
+    second = index.add_entry({"question": "Qual o prazo do reembolso?", "answer": "5 dias.", "tags": []})
+    assert first == second
+    best = index.top_match("Qual o prazo do reembolso?")
+    assert best.entry["answer"] == "5 dias."
+    assert best.score == 1.0
+
+
+def test_store_keeps_latest_answer(tmp_path: Path) -> None:
+    store = LearnedAnswerStore(tmp_path / "learned.db")
+    store.record("Qual o prazo  do reembolso?", "10 dias.")
+    store.record("Qual o prazo do reembolso?", "5 dias.", "Revisado")
+    learned = store.load()
+    assert [(item.question, item.answer, item.notes) for item in learned] == [
+        ("Qual o prazo do reembolso?", "5 dias.", "Revisado")
+    ]
+    assert learned[0].to_entry()["provenance"].startswith("especialista em ")
+
+
+def test_specialist_answer_is_learned_by_live_graph(app_config, logger, thread_config, tmp_path: Path) -> None:
+    settings = dataclasses.replace(app_config, learned_db_path=tmp_path / "learned.db")
+    graph = build_graph(settings, logger, checkpointer=InMemorySaver())
+    question = "Qual o prazo para receber o reembolso?"
+
+    config = thread_config("learn-1")
+    for _ in graph.stream({"messages": [HumanMessage(content=question)]}, config=config):
+        pass
+    resume_with_human_response(graph, config=config, message="O reembolso leva até 5 dias úteis.", notes="Ticket 42")
+
+    state = graph.invoke({"messages": [HumanMessage(content=question)]}, config=thread_config("learn-2"))
+    assert state["status"] == "respondido automaticamente"
+    assert state["answer"] == "O reembolso leva até 5 dias úteis."
+    assert "aprendida de especialista" in state["notes"]
+
+    reloaded = build_faq_index(settings, LearnedAnswerStore(settings.learned_db_path))
+    assert reloaded.top_match(question).entry["answer"] == "O reembolso leva até 5 dias úteis."
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from agente_perguntas.utils.faq_store import compile_faq_file, load_faq_index
+from agente_perguntas.utils.minhash import (
+    LSHCandidateGenerator,
+    MinHasher,
+    deduplicate_entries,
+    jaccard,
+    token_hash,
+)
+from agente_perguntas.utils.prompts import FAQ_ENTRIES
+from agente_perguntas.utils.similarity import FAQIndex
+
+
+def test_batched_signatures_match_single_signatures() -> None:
+    hasher = MinHasher(24)
+    token_sets = [["senha", "altero"], [], ["boleto"], ["senha", "altero"]]
+    offsets = np.array([0, 2, 2, 3, 5])
+    hashes = np.array([token_hash(token) for tokens in token_sets for token in tokens], dtype=np.uint64)
+    batched = hasher.signatures(offsets, hashes)
+    for row, tokens in zip(batched, token_sets):
+        assert np.array_equal(row, hasher.signature(tokens))
+    assert np.array_equal(batched[0], batched[3])
+
+
+def test_signature_agreement_estimates_jaccard() -> None:
+    hasher = MinHasher(512)
+    left = {f"t{index}" for index in range(40)}
+    right = {f"t{index}" for index in range(20, 60)}
+    agreement = float(np.mean(hasher.signature(left) == hasher.signature(right)))
+    assert abs(agreement - jaccard(left, right)) < 0.08
+
+
+def test_deduplicate_entries_keeps_first_occurrence() -> None:
+    entries = [
+        *FAQ_ENTRIES,
+        {"question": "como ALTERO minha senha", "answer": "Duplicada.", "tags": []},
+        {"question": "Como altero meu e-mail?", "answer": "Outra.", "tags": []},
+    ]
+    kept, duplicates = deduplicate_entries(entries, threshold=0.9)
+    assert kept == [*FAQ_ENTRIES, entries[-1]]
+    assert [(item.position, item.kept_position) for item in duplicates] == [(len(FAQ_ENTRIES), 0)]
+
+
+def test_lsh_candidates_rank_like_exact_index_for_near_matches() -> None:
+    entries = [
+        {"question": f"como consultar o pedido {index} da loja {index % 7}", "answer": str(index), "tags": []}
+        for index in range(400)
+    ]
+    exact = FAQIndex(entries, scorer="bm25")
+    pruned = FAQIndex(entries, scorer="bm25")
+    pruned.set_candidate_generator(LSHCandidateGenerator.from_index(pruned))
+    for question in ("consultar o pedido 42 da loja 0", "como consultar pedido 399 da loja 0"):
+        best, expected = pruned.top_match(question), exact.top_match(question)
+        assert best.position == expected.position
+        assert best.score == pytest.approx(expected.score)
+    assert pruned.candidate_generator.candidates({"pedido", "42", "consultar", "loja", "0"}).size < len(entries)
+    assert pruned.top_match("pergunta desconhecida") == exact.top_match("pergunta desconhecida")
+
+
+def test_compiled_index_can_be_deduplicated(tmp_path: Path) -> None:
+    source = tmp_path / "faq.jsonl"
+    rows = [*FAQ_ENTRIES, {"question": "Como altero minha senha", "answer": "x", "tags": []}]
+    source.write_text("\n".join(json.dumps(row, ensure_ascii=False) for row in rows), encoding="utf-8")
+    compiled = compile_faq_file(source, tmp_path / "faq.idx", dedupe_threshold=0.9)
+    assert len(load_faq_index(compiled)) == len(FAQ_ENTRIES)
+    assert len(load_faq_index(source)) == len(rows)
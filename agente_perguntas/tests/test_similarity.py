@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import pytest
+
 from agente_perguntas.utils.prompts import FAQ_ENTRIES
 from agente_perguntas.utils.similarity import (
+    SCORER_BM25,
+    FAQIndex,
+    TokenNormalizer,
+    calibrate_score,
     meets_threshold,
+    rank_batch,
     rank_faq_by_similarity,
     score_similarity,
+    stem_portuguese,
 )
 
 
@@ -24,3 +32,92 @@ def test_rank_faq_by_similarity_returns_best_entry_first() -> None:
 def test_meets_threshold_respects_tolerance() -> None:
     assert meets_threshold(0.69, 0.7, tolerance=0.02)
     assert not meets_threshold(0.5, 0.7)
+
+
+def test_faq_index_scores_match_full_ranking() -> None:
+    index = FAQIndex(FAQ_ENTRIES)
+    questions = [
+        "Como altero minha senha?",
+        "Posso cancelar minha assinatura?",
+        "Onde vejo o status do pedido?",
+        "Vocês oferecem suporte 24 horas?",
+    ]
+    for question in questions:
+        expected = rank_faq_by_similarity(question, FAQ_ENTRIES)
+        ranked = index.rank(question, limit=len(FAQ_ENTRIES))
+        assert [item.entry["question"] for item in ranked] == [item.entry["question"] for item in expected]
+        assert [item.score for item in ranked] == [item.score for item in expected]
+        for item in ranked:
+            assert item.score == score_similarity(question, item.entry["question"])
+
+
+def test_faq_index_falls_back_to_first_entry_without_shared_tokens() -> None:
+    index = FAQIndex(FAQ_ENTRIES)
+    best = index.top_match("xyz")
+    assert best.entry["question"] == FAQ_ENTRIES[0]["question"]
+    assert best.score == 0.0
+    assert len(index.rank("Como altero minha senha?", limit=2)) == 2
+
+
+def test_bm25_scorer_calibrates_exact_match_to_one() -> None:
+    index = FAQIndex(FAQ_ENTRIES, scorer=SCORER_BM25)
+    best = index.top_match("Como altero minha senha?")
+    assert best.entry["question"] == "Como altero minha senha?"
+    assert best.score == 1.0
+    assert 0.0 <= index.top_match("Vocês oferecem suporte 24 horas?").score < 0.7
+
+
+def test_bm25_scorer_weights_rare_tokens_above_common_ones() -> None:
+    index = FAQIndex(FAQ_ENTRIES, scorer=SCORER_BM25)
+    rare = index.top_match("senha")
+    common = index.top_match("minha")
+    assert rare.entry["question"] == "Como altero minha senha?"
+    assert rare.score > common.score
+
+
+def test_calibrate_score_clamps_into_unit_range() -> None:
+    assert calibrate_score(2.0, 1.0) == 1.0
+    assert calibrate_score(0.5, 1.0) == 0.5
+    assert calibrate_score(1.0, 0.0) == 0.0
+
+
+def test_rank_batch_matches_per_question_ranking() -> None:
+    questions = [
+        "Como altero minha senha?",
+        "Posso cancelar minha assinatura?",
+        "",
+        "Vocês oferecem suporte 24 horas?",
+    ]
+    for scorer in ("overlap", SCORER_BM25):
+        index = FAQIndex(FAQ_ENTRIES, scorer=scorer)
+        batch = rank_batch(questions, index, limit=3)
+        assert batch.indices.shape == (len(questions), 3)
+        for question, row in zip(questions, batch.ranked(index)):
+            expected = index.rank(question, limit=3)
+            assert [item.entry["question"] for item in row] == [item.entry["question"] for item in expected]
+            assert [item.score for item in row] == pytest.approx([item.score for item in expected])
+
+
+def test_portuguese_normalizer_folds_accents_stems_and_drops_stopwords() -> None:
+    normalizer = TokenNormalizer.from_spec("pt")
+    assert normalizer("Quais formas de pagamento vocês aceitam?") == normalizer("formas pagamentos voces aceitam")
+    assert "nao" in normalizer("Não consigo baixar a nota")
+    assert normalizer("Como?") == frozenset({"com"})
+    assert normalizer("pagamentos") is normalizer("pagamentos")
+    assert stem_portuguese("cartões") == stem_portuguese("cartão")
+
+
+def test_plain_normalizer_matches_legacy_tokenization() -> None:
+    assert TokenNormalizer.from_spec("") == TokenNormalizer()
+    assert TokenNormalizer.from_spec("stem, accents").spec == "accents,stem"
+    plain = FAQIndex(FAQ_ENTRIES)
+    assert plain.top_match("Quais formas de pagamentos voces aceitam?").score < 0.7
+
+
+def test_normalized_index_matches_inflected_question() -> None:
+    index = FAQIndex(FAQ_ENTRIES, normalizer=TokenNormalizer.from_spec("pt"))
+    best = index.top_match("Quais formas de pagamentos voces aceitam?")
+    assert best.entry["question"] == "Quais formas de pagamento vocês aceitam?"
+    assert best.score == 1.0
+    assert index.version.endswith(":accents,stem,stopwords")
+    assert index.vocabulary.keys() >= {"pagament", "form", "aceitam"}
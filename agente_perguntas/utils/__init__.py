@@ -10,16 +10,28 @@ from .prompts import (
     get_faq_entries,
     list_faq_questions,
 )
-from .similarity import RankedFAQ, meets_threshold, rank_faq_by_similarity, score_similarity, top_match
+from .similarity import (
+    SCORERS,
+    FAQIndex,
+    RankedFAQ,
+    calibrate_score,
+    meets_threshold,
+    rank_faq_by_similarity,
+    score_similarity,
+    top_match,
+)
 from .logging import log_interaction, setup_logging
 
 __all__ = [
     "DEMO_QUESTIONS",
     "FAQEntry",
+    "FAQIndex",
     "FAQ_ENTRIES",
     "build_system_prompt",
     "get_faq_entries",
     "list_faq_questions",
+    "SCORERS",
+    "calibrate_score",
     "rank_faq_by_similarity",
     "score_similarity",
     "top_match",
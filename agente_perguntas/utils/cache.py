@@ -0,0 +1,81 @@
+"""In-process answer cache placed in front of FAQ ranking."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+
+class AnswerCache(Generic[ValueT]):
+    """Thread-safe LRU cache with per-entry TTL, scoped to one FAQ index version.
+
+    Keys are question token signatures (see :meth:`FAQIndex.signature`). Every lookup
+    and insert carries the version of the index that produced the answer; when it
+    differs from the cached version the whole cache is dropped, so answers never
+    outlive the FAQ they came from. ``max_entries <= 0`` disables caching.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, ValueT]] = OrderedDict()
+        self._version: str | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sync_version(self, version: str) -> None:
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: str, version: str) -> ValueT | None:
+        """Return the cached value for ``key`` or ``None`` (counting hits and misses)."""
+        with self._lock:
+            self._sync_version(version)
+            item = self._entries.get(key)
+            if item is not None and item[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, version: str, value: ValueT) -> None:
+        """Store ``value`` for ``key``, evicting the least recently used entries."""
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._sync_version(version)
+            self._entries[key] = (self._clock() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return counters suitable for structured logging."""
+        return {"cache_hits": self.hits, "cache_misses": self.misses, "cache_size": len(self._entries)}
+
+
+__all__ = ["AnswerCache"]
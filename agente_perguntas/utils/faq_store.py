@@ -0,0 +1,330 @@
+"""External FAQ corpus loading, compiled memory-mapped indexes and hot reload."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Callable, Iterator, overload
+
+import numpy as np
+from structlog.stdlib import BoundLogger
+
+from agente_perguntas.utils.minhash import deduplicate_entries
+from agente_perguntas.utils.prompts import FAQEntry, _normalize
+from agente_perguntas.utils.similarity import PLAIN_NORMALIZER, SCORER_OVERLAP, FAQIndex, TokenNormalizer
+
+INDEX_MAGIC = b"FAQIDX01"
+_PREAMBLE_SIZE = len(INDEX_MAGIC) + 8
+_ALIGNMENT = 64
+
+
+def _parse_entry(raw: Any, *, source: str) -> FAQEntry:
+    """Validate and normalize a decoded JSON object into a :class:`FAQEntry`."""
+    if not isinstance(raw, dict):
+        raise ValueError(f"{source}: esperado um objeto JSON com 'question' e 'answer'.")
+    question = raw.get("question")
+    answer = raw.get("answer")
+    if not isinstance(question, str) or not isinstance(answer, str) or not question.strip():
+        raise ValueError(f"{source}: campos 'question' e 'answer' são obrigatórios.")
+    tags = raw.get("tags") or []
+    return FAQEntry(question=_normalize(question), answer=_normalize(answer), tags=[str(tag) for tag in tags])
+
+
+def load_faq_jsonl(path: str | Path) -> list[FAQEntry]:
+    """Load FAQ entries from a JSON Lines file (one ``{"question", "answer", "tags"}`` per line)."""
+    entries: list[FAQEntry] = []
+    with Path(path).open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{line_number}: JSON inválido ({exc.msg}).") from exc
+            entries.append(_parse_entry(raw, source=f"{path}:{line_number}"))
+    return entries
+
+
+class MappedFAQEntries(Sequence[FAQEntry]):
+    """Read-only view over FAQ entries stored as JSON blobs in a memory-mapped index.
+
+    Entries are decoded on access, so worker processes only materialize the entries
+    they actually return instead of holding a private copy of the whole FAQ.
+    """
+
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray) -> None:
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return max(len(self._offsets) - 1, 0)
+
+    @overload
+    def __getitem__(self, position: int) -> FAQEntry: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[FAQEntry]: ...
+
+    def __getitem__(self, position: int | slice) -> FAQEntry | list[FAQEntry]:
+        if isinstance(position, slice):
+            return [self[item] for item in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("FAQ entry index out of range")
+        start, end = int(self._offsets[position]), int(self._offsets[position + 1])
+        return json.loads(self._blob[start:end].tobytes().decode("utf-8"))
+
+    def __iter__(self) -> Iterator[FAQEntry]:
+        for position in range(len(self)):
+            yield self[position]
+
+
+def _aligned(value: int) -> int:
+    return (value + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def write_compiled_index(index: FAQIndex, path: str | Path) -> Path:
+    """Persist ``index`` (arrays, vocabulary and entries) into a single binary file.
+
+    The file is written next to the destination and atomically renamed, so processes
+    that already mapped the previous version keep reading a consistent snapshot.
+    """
+    destination = Path(path)
+    encoded = [json.dumps(entry, ensure_ascii=False).encode("utf-8") for entry in index.entries]
+    entry_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=entry_offsets[1:])
+    arrays = {
+        **index.arrays(),
+        "entry_offsets": entry_offsets,
+        "entry_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+    }
+
+    layout: dict[str, dict[str, Any]] = {}
+    cursor = 0
+    for name, values in arrays.items():
+        values = np.ascontiguousarray(values)
+        arrays[name] = values
+        layout[name] = {"dtype": values.dtype.str, "shape": list(values.shape), "offset": cursor}
+        cursor = _aligned(cursor + values.nbytes)
+
+    vocabulary = sorted(index.vocabulary, key=index.vocabulary.__getitem__)
+    header = json.dumps(
+        {
+            "version": index.version,
+            "normalization": index.normalizer.spec,
+            "vocabulary": vocabulary,
+            "arrays": layout,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    data_start = _aligned(_PREAMBLE_SIZE + len(header))
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    with temporary.open("wb") as handle:
+        handle.write(INDEX_MAGIC)
+        handle.write(len(header).to_bytes(8, "little"))
+        handle.write(header)
+        for name, values in arrays.items():
+            handle.seek(data_start + layout[name]["offset"])
+            handle.write(values.tobytes())
+        handle.truncate(data_start + cursor)
+    os.replace(temporary, destination)
+    return destination
+
+
+def is_compiled_index(path: str | Path) -> bool:
+    """Return ``True`` when ``path`` starts with the compiled index magic bytes."""
+    try:
+        with Path(path).open("rb") as handle:
+            return handle.read(len(INDEX_MAGIC)) == INDEX_MAGIC
+    except OSError:
+        return False
+
+
+def open_compiled_index(path: str | Path, *, scorer: str = SCORER_OVERLAP) -> FAQIndex:
+    """Memory-map a file produced by :func:`write_compiled_index` as a :class:`FAQIndex`.
+
+    Arrays are read-only views on a shared mapping, so every worker process opening
+    the same file shares one copy of the postings in the page cache. Questions are
+    normalized with the pipeline recorded when the file was compiled.
+    """
+    source = Path(path)
+    with source.open("rb") as handle:
+        if handle.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            raise ValueError(f"{source} não é um índice de FAQ compilado.")
+        header_size = int.from_bytes(handle.read(8), "little")
+        header = json.loads(handle.read(header_size).decode("utf-8"))
+
+    data_start = _aligned(_PREAMBLE_SIZE + header_size)
+    mapping = np.memmap(source, dtype=np.uint8, mode="r")
+    arrays: dict[str, np.ndarray] = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = data_start + spec["offset"]
+        arrays[name] = mapping[start : start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+
+    entries = MappedFAQEntries(arrays.pop("entry_offsets"), arrays.pop("entry_blob"))
+    vocabulary = {token: term_id for term_id, token in enumerate(header["vocabulary"])}
+    return FAQIndex.from_arrays(
+        entries,
+        vocabulary,
+        arrays,
+        scorer=scorer,
+        version=header["version"],
+        normalizer=TokenNormalizer.from_spec(header.get("normalization")),
+    )
+
+
+def prepare_entries(
+    entries: Sequence[FAQEntry],
+    *,
+    dedupe_threshold: float = 0.0,
+    normalizer: TokenNormalizer = PLAIN_NORMALIZER,
+) -> list[FAQEntry]:
+    """Return ``entries`` without near-duplicate questions when ``dedupe_threshold > 0``."""
+    if dedupe_threshold <= 0.0:
+        return list(entries)
+    kept, _ = deduplicate_entries(entries, threshold=dedupe_threshold, normalizer=normalizer)
+    return kept
+
+
+def compile_faq_file(
+    source: str | Path,
+    destination: str | Path,
+    *,
+    dedupe_threshold: float = 0.0,
+    normalizer: TokenNormalizer = PLAIN_NORMALIZER,
+) -> Path:
+    """Compile a JSONL FAQ into the binary, memory-mappable index format."""
+    entries = prepare_entries(load_faq_jsonl(source), dedupe_threshold=dedupe_threshold, normalizer=normalizer)
+    return write_compiled_index(FAQIndex(entries, normalizer=normalizer), destination)
+
+
+def load_faq_index(
+    path: str | Path,
+    *,
+    scorer: str = SCORER_OVERLAP,
+    dedupe_threshold: float = 0.0,
+    normalizer: TokenNormalizer = PLAIN_NORMALIZER,
+) -> FAQIndex:
+    """Load a FAQ index from a compiled binary file or from a JSONL corpus.
+
+    Compiled files are used as-is: deduplication and normalization were applied by
+    :func:`compile_faq_file`, so ``dedupe_threshold`` and ``normalizer`` only affect JSONL.
+    """
+    if is_compiled_index(path):
+        return open_compiled_index(path, scorer=scorer)
+    entries = prepare_entries(load_faq_jsonl(path), dedupe_threshold=dedupe_threshold, normalizer=normalizer)
+    return FAQIndex(entries, scorer=scorer, normalizer=normalizer)
+
+
+def _modified_at(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class FAQIndexProvider:
+    """Serve the current :class:`FAQIndex`, rebuilding it in the background on file changes.
+
+    :meth:`current` never blocks on a rebuild: it checks the source ``mtime`` at most
+    once per ``check_interval`` seconds and, when it changed, starts a daemon thread
+    that loads the new index and swaps the reference once it is fully built. Until
+    then callers keep receiving the previous index. Without ``path`` the index is
+    static (embedded FAQ).
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], FAQIndex],
+        *,
+        path: str | Path | None = None,
+        check_interval: float = 5.0,
+        logger: BoundLogger | None = None,
+    ) -> None:
+        self._loader = loader
+        self._path = Path(path) if path is not None else None
+        self._check_interval = max(check_interval, 0.0)
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._reload_thread: threading.Thread | None = None
+        self._mtime = _modified_at(self._path) if self._path is not None else None
+        self._index = loader()
+        self._last_check = time.monotonic()
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    def current(self) -> FAQIndex:
+        """Return the active index, scheduling a background reload when the file changed."""
+        if self._path is not None and time.monotonic() - self._last_check >= self._check_interval:
+            self._maybe_schedule_reload()
+        return self._index
+
+    def _maybe_schedule_reload(self) -> None:
+        with self._lock:
+            self._last_check = time.monotonic()
+            if self._reload_thread is not None and self._reload_thread.is_alive():
+                return
+            mtime = _modified_at(self._path)  # type: ignore[arg-type]
+            if mtime is None or mtime == self._mtime:
+                return
+            self._reload_thread = threading.Thread(
+                target=self._reload,
+                args=(mtime,),
+                name="faq-index-reload",
+                daemon=True,
+            )
+            self._reload_thread.start()
+
+    def _reload(self, mtime: int) -> None:
+        started = time.perf_counter()
+        try:
+            index = self._loader()
+        except Exception as exc:  # noqa: BLE001 - keep serving the previous index
+            self._mtime = mtime
+            if self._logger is not None:
+                self._logger.warning("faq_reload_failed", path=str(self._path), error=str(exc))
+            return
+        previous = self._index.version
+        self._index = index
+        self._mtime = mtime
+        if self._logger is not None:
+            self._logger.info(
+                "faq_reloaded",
+                path=str(self._path),
+                previous_version=previous,
+                version=index.version,
+                entries=len(index),
+                elapsed_seconds=round(time.perf_counter() - started, 4),
+            )
+
+    def wait_for_reload(self, timeout: float | None = None) -> bool:
+        """Block until a running background reload finishes; return ``False`` on timeout."""
+        thread = self._reload_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+
+__all__ = [
+    "FAQIndexProvider",
+    "MappedFAQEntries",
+    "compile_faq_file",
+    "is_compiled_index",
+    "load_faq_index",
+    "load_faq_jsonl",
+    "open_compiled_index",
+    "prepare_entries",
+    "write_compiled_index",
+]
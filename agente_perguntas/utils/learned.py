@@ -0,0 +1,103 @@
+"""Persistent store for answers learned from human specialists."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from agente_perguntas.utils.prompts import FAQEntry, _normalize
+
+LEARNED_TAG = "aprendido"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS learned_answers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    question TEXT NOT NULL UNIQUE,
+    answer TEXT NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    learned_at TEXT NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class LearnedAnswer:
+    """Specialist answer captured from a resumed escalation."""
+
+    question: str
+    answer: str
+    notes: str
+    learned_at: str
+
+    @property
+    def provenance(self) -> str:
+        return f"especialista em {self.learned_at}"
+
+    def to_entry(self) -> FAQEntry:
+        """Return the answer as a FAQ entry tagged with its provenance."""
+        return FAQEntry(
+            question=self.question,
+            answer=self.answer,
+            tags=[LEARNED_TAG],
+            provenance=self.provenance,
+        )
+
+
+class LearnedAnswerStore:
+    """SQLite-backed store of specialist answers, keyed by the normalized question.
+
+    Recording the same question twice keeps the most recent answer. The connection is
+    shared between graph threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, question: str, answer: str, notes: str = "") -> LearnedAnswer:
+        """Insert or replace the answer for ``question`` and return the stored record."""
+        learned = LearnedAnswer(
+            question=_normalize(question),
+            answer=_normalize(answer),
+            notes=notes.strip(),
+            learned_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                INSERT INTO learned_answers (question, answer, notes, learned_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(question) DO UPDATE SET
+                    answer = excluded.answer,
+                    notes = excluded.notes,
+                    learned_at = excluded.learned_at
+                """,
+                (learned.question, learned.answer, learned.notes, learned.learned_at),
+            )
+        return learned
+
+    def load(self) -> list[LearnedAnswer]:
+        """Return every learned answer in insertion order."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT question, answer, notes, learned_at FROM learned_answers ORDER BY id"
+            ).fetchall()
+        return [LearnedAnswer(*row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+__all__ = ["LEARNED_TAG", "LearnedAnswer", "LearnedAnswerStore"]
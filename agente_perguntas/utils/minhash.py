@@ -0,0 +1,252 @@
+"""MinHash signatures and LSH banding for FAQ deduplication and candidate pruning."""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from agente_perguntas.utils.prompts import FAQEntry
+from agente_perguntas.utils.similarity import PLAIN_NORMALIZER, FAQIndex, TokenNormalizer
+
+CANDIDATES_EXACT = "exact"
+CANDIDATES_LSH = "lsh"
+CANDIDATE_STRATEGIES = (CANDIDATES_EXACT, CANDIDATES_LSH)
+
+DEFAULT_BANDS = 20
+DEFAULT_ROWS = 3
+DEFAULT_SEED = 1
+DEFAULT_DEDUPE_THRESHOLD = 0.9
+
+# Largest prime below 2**32: ``a * h + b`` stays below 2**64 for 32-bit token hashes.
+_PRIME = np.uint64(4_294_967_291)
+_EMPTY_SLOT = np.uint32(0xFFFFFFFF)
+_SIGNATURE_CELL_BUDGET = 1 << 22
+_MAX_BUCKET_COMPARISONS = 8
+
+
+def token_hash(token: str) -> int:
+    """Return a stable 32-bit hash for ``token`` (independent of ``PYTHONHASHSEED``)."""
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def _hash_tokens(tokens: Iterable[str]) -> np.ndarray:
+    return np.fromiter((token_hash(token) for token in tokens), dtype=np.uint64)
+
+
+class MinHasher:
+    """Computes ``num_perm`` MinHash values per token set with universal hashing.
+
+    Each permutation is ``(a * h + b) mod p``; the probability that two signatures
+    agree on a slot equals the Jaccard similarity of the token sets. Empty sets map
+    to a sentinel signature that is never indexed.
+    """
+
+    def __init__(self, num_perm: int, *, seed: int = DEFAULT_SEED) -> None:
+        if num_perm <= 0:
+            raise ValueError("num_perm deve ser positivo.")
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray:
+        """Return the ``uint32`` signature of a token set."""
+        hashes = _hash_tokens(tokens)
+        if not hashes.size:
+            return np.full(self.num_perm, _EMPTY_SLOT, dtype=np.uint32)
+        values = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME
+        return values.min(axis=1).astype(np.uint32)
+
+    def signatures(self, offsets: np.ndarray, hashes: np.ndarray) -> np.ndarray:
+        """Return one signature row per token set given as CSR ``(offsets, hashes)``.
+
+        Documents are processed in chunks so the permutation matrix never exceeds
+        ``_SIGNATURE_CELL_BUDGET`` cells.
+        """
+        document_count = len(offsets) - 1
+        result = np.full((document_count, self.num_perm), _EMPTY_SLOT, dtype=np.uint32)
+        token_budget = max(1, _SIGNATURE_CELL_BUDGET // self.num_perm)
+        start = 0
+        while start < document_count:
+            stop = int(np.searchsorted(offsets, offsets[start] + token_budget, side="right")) - 1
+            stop = min(max(stop, start + 1), document_count)
+            low, high = int(offsets[start]), int(offsets[stop])
+            lengths = np.diff(offsets[start : stop + 1])
+            filled = np.flatnonzero(lengths)
+            if filled.size:
+                chunk = hashes[low:high]
+                values = (self._a[:, None] * chunk[None, :] + self._b[:, None]) % _PRIME
+                minima = np.minimum.reduceat(values, offsets[start + filled] - low, axis=1)
+                result[start + filled] = minima.T.astype(np.uint32)
+            start = stop
+        return result
+
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures using sorted band keys and binary search.
+
+    Each of the ``bands`` groups of ``rows`` slots is folded into a 64-bit key; per
+    band, keys are kept sorted next to the document ids so a lookup is one
+    ``searchsorted`` per band. Two sets with Jaccard similarity ``s`` become
+    candidates with probability ``1 - (1 - s**rows) ** bands``.
+    """
+
+    def __init__(self, signatures: np.ndarray, *, bands: int = DEFAULT_BANDS, rows: int = DEFAULT_ROWS) -> None:
+        if signatures.ndim != 2 or signatures.shape[1] != bands * rows:
+            raise ValueError("As assinaturas devem ter bands * rows colunas.")
+        self.bands = bands
+        self.rows = rows
+        self._multipliers = np.random.default_rng(DEFAULT_SEED).integers(
+            1, np.iinfo(np.int64).max, size=rows, dtype=np.uint64
+        ) | np.uint64(1)
+        indexed = np.flatnonzero(signatures[:, 0] != _EMPTY_SLOT)
+        keys = self._band_keys(signatures[indexed])
+        order = np.argsort(keys, axis=0, kind="stable")
+        self._keys = np.take_along_axis(keys, order, axis=0).T.copy()
+        self._documents = indexed[order].T.copy()
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Fold each band of ``signatures`` (one row per set) into a ``uint64`` key."""
+        grouped = signatures.reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+        return (grouped * self._multipliers).sum(axis=2, dtype=np.uint64)
+
+    def query(self, signature: np.ndarray) -> np.ndarray:
+        """Return the sorted ids of documents sharing at least one band with ``signature``."""
+        if signature[0] == _EMPTY_SLOT or not self._documents.size:
+            return np.empty(0, dtype=np.int64)
+        keys = self._band_keys(signature[None, :])[0]
+        found = []
+        for band, key in enumerate(keys):
+            low = np.searchsorted(self._keys[band], key, side="left")
+            high = np.searchsorted(self._keys[band], key, side="right")
+            if high > low:
+                found.append(self._documents[band, low:high])
+        return np.unique(np.concatenate(found)) if found else np.empty(0, dtype=np.int64)
+
+    def buckets(self) -> Iterable[np.ndarray]:
+        """Yield the document ids of every bucket holding more than one document."""
+        for band_keys, documents in zip(self._keys, self._documents):
+            if not band_keys.size:
+                continue
+            boundaries = np.flatnonzero(band_keys[1:] != band_keys[:-1]) + 1
+            for group in np.split(documents, boundaries):
+                if group.size > 1:
+                    yield np.sort(group)
+
+
+class LSHCandidateGenerator:
+    """:class:`~agente_perguntas.utils.similarity.CandidateGenerator` backed by MinHash/LSH.
+
+    Built once per :class:`FAQIndex` from its term lists, so FAQ questions are never
+    re-tokenized. Returns ``None`` when no bucket matches, letting the index fall
+    back to the exact postings walk (escalations still get meaningful references).
+    """
+
+    def __init__(self, hasher: MinHasher, lsh: LSHIndex) -> None:
+        self._hasher = hasher
+        self._lsh = lsh
+
+    @classmethod
+    def from_index(
+        cls,
+        index: FAQIndex,
+        *,
+        bands: int = DEFAULT_BANDS,
+        rows: int = DEFAULT_ROWS,
+        seed: int = DEFAULT_SEED,
+    ) -> "LSHCandidateGenerator":
+        hasher = MinHasher(bands * rows, seed=seed)
+        vocabulary = sorted(index.vocabulary, key=index.vocabulary.__getitem__)
+        term_hashes = _hash_tokens(vocabulary)
+        offsets, terms = index.term_lists()
+        signatures = hasher.signatures(offsets, term_hashes[terms])
+        return cls(hasher, LSHIndex(signatures, bands=bands, rows=rows))
+
+    def candidates(self, tokens: frozenset[str]) -> np.ndarray | None:
+        found = self._lsh.query(self._hasher.signature(tokens))
+        return found if found.size else None
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    """Return the Jaccard similarity of two token sets."""
+    union = len(left | right)
+    return len(left & right) / union if union else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class DuplicateEntry:
+    """FAQ entry dropped at build time because it nearly repeats an earlier question."""
+
+    position: int
+    kept_position: int
+    similarity: float
+
+
+def deduplicate_entries(
+    entries: Sequence[FAQEntry],
+    *,
+    threshold: float = DEFAULT_DEDUPE_THRESHOLD,
+    bands: int = DEFAULT_BANDS,
+    rows: int = DEFAULT_ROWS,
+    seed: int = DEFAULT_SEED,
+    normalizer: TokenNormalizer = PLAIN_NORMALIZER,
+) -> tuple[list[FAQEntry], list[DuplicateEntry]]:
+    """Drop entries whose question has Jaccard similarity ``>= threshold`` with an earlier one.
+
+    LSH buckets propose pairs (each entry is compared with at most
+    ``_MAX_BUCKET_COMPARISONS`` earlier bucket members) and every pair is verified
+    with the exact Jaccard similarity, so only true near-duplicates are removed. The
+    first occurrence is kept. Returns the kept entries and the dropped ones.
+    """
+    token_sets = [normalizer.tokens(entry["question"]) for entry in entries]
+    lengths = np.fromiter(map(len, token_sets), dtype=np.int64, count=len(token_sets))
+    offsets = np.zeros(len(token_sets) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    hashes = _hash_tokens(token for tokens in token_sets for token in tokens)
+    hasher = MinHasher(bands * rows, seed=seed)
+    lsh = LSHIndex(hasher.signatures(offsets, hashes), bands=bands, rows=rows)
+
+    matches: dict[int, tuple[int, float]] = {}
+    for bucket in lsh.buckets():
+        members = bucket.tolist()
+        for offset, position in enumerate(members[1:], start=1):
+            if position in matches:
+                continue
+            for earlier in members[max(0, offset - _MAX_BUCKET_COMPARISONS) : offset]:
+                similarity = jaccard(token_sets[position], token_sets[earlier])
+                if similarity >= threshold:
+                    matches[position] = (earlier, similarity)
+                    break
+
+    duplicates: list[DuplicateEntry] = []
+    kept: list[FAQEntry] = []
+    for position, entry in enumerate(entries):
+        match = matches.get(position)
+        if match is None:
+            kept.append(entry)
+            continue
+        kept_position = match[0]
+        while kept_position in matches:
+            kept_position = matches[kept_position][0]
+        duplicates.append(DuplicateEntry(position=position, kept_position=kept_position, similarity=match[1]))
+    return kept, duplicates
+
+
+__all__ = [
+    "CANDIDATE_STRATEGIES",
+    "CANDIDATES_EXACT",
+    "CANDIDATES_LSH",
+    "DEFAULT_BANDS",
+    "DEFAULT_DEDUPE_THRESHOLD",
+    "DEFAULT_ROWS",
+    "DuplicateEntry",
+    "LSHCandidateGenerator",
+    "LSHIndex",
+    "MinHasher",
+    "deduplicate_entries",
+    "jaccard",
+    "token_hash",
+]
@@ -11,8 +11,10 @@ from typing_extensions import TypedDict
 
 from agente_perguntas.config import AppConfig
 from agente_perguntas.state import AgentState
+from agente_perguntas.utils.cache import AnswerCache
+from agente_perguntas.utils.learned import LearnedAnswerStore
 from agente_perguntas.utils.prompts import FAQEntry, get_faq_entries
-from agente_perguntas.utils.similarity import RankedFAQ, meets_threshold, rank_faq_by_similarity
+from agente_perguntas.utils.similarity import FAQIndex, RankedFAQ, meets_threshold
 
 ESCALATION_MESSAGE = (
     "Não encontrei a resposta no FAQ. Encaminharei sua dúvida para um especialista humano."
@@ -24,23 +26,43 @@ EMPTY_QUESTION_MESSAGE = "Não recebemos uma pergunta válida. Informe uma dúvi
 MessageLike = BaseMessage | dict[str, Any]
 
 
+class FAQReference(TypedDict):
+    """Ranked FAQ match shown to operators; ``position`` indexes the FAQ at ``faq_version``."""
+
+    position: int
+    question: str
+    score: float
+
+
 class HumanEscalationPayload(TypedDict):
-    """Payload delivered to HITL operators via LangGraph interrupts."""
+    """Payload delivered to HITL operators via LangGraph interrupts.
+
+    Only the top-k matches are included (the payload is stored in the checkpoint of
+    every pending escalation); ``faq_version`` identifies the FAQ they refer to.
+    """
 
     question: str
     best_match: str
     best_match_confidence: float
-    faq_reference: list[FAQEntry]
+    faq_version: str
+    faq_reference: list[FAQReference]
 
 
-def _build_payload(
-    question: str, best: RankedFAQ, faq_reference: list[FAQEntry]
-) -> HumanEscalationPayload:
+def _build_payload(question: str, ranked: Sequence[RankedFAQ], faq_version: str) -> HumanEscalationPayload:
+    best = ranked[0]
     return HumanEscalationPayload(
         question=question,
         best_match=best.entry["question"],
         best_match_confidence=round(best.score, 4),
-        faq_reference=faq_reference,
+        faq_version=faq_version,
+        faq_reference=[
+            FAQReference(
+                position=-1 if match.position is None else match.position,
+                question=match.entry["question"],
+                score=round(match.score, 4),
+            )
+            for match in ranked
+        ],
     )
 
 
@@ -76,14 +98,34 @@ def _assistant_response(content: str) -> list[AIMessage]:
     return [AIMessage(content=content)]
 
 
+def _match_notes(match: RankedFAQ) -> str:
+    notes = f"Correspondência: {match.entry['question']}"
+    provenance = match.entry.get("provenance")
+    return f"{notes} (resposta aprendida de {provenance})" if provenance else notes
+
+
+def _cache_stats(answer_cache: AnswerCache[AgentState] | None) -> dict[str, int]:
+    return answer_cache.stats() if answer_cache is not None else {}
+
+
 def evaluate_question(
     state: AgentState,
     *,
     settings: AppConfig,
     logger: BoundLogger,
     faq_entries: list[FAQEntry] | None = None,
+    faq_index: FAQIndex | None = None,
+    answer_cache: AnswerCache[AgentState] | None = None,
+    learned_store: LearnedAnswerStore | None = None,
 ) -> AgentState:
-    """Evaluate a question and either answer automatically or trigger HITL."""
+    """Evaluate a question and either answer automatically or trigger HITL.
+
+    ``faq_index`` should be built once per graph; when omitted, an index is built on
+    the fly from ``faq_entries`` (or the embedded FAQ). ``answer_cache`` short-circuits
+    ranking for questions whose token signature was already answered automatically
+    with the same FAQ version. With ``learned_store``, the specialist answer given when
+    resuming an escalation is persisted and merged into ``faq_index`` right away.
+    """
 
     messages: Sequence[MessageLike] = state.get("messages", [])
     question = _latest_question(messages)
@@ -97,38 +139,65 @@ def evaluate_question(
             "messages": _assistant_response(EMPTY_QUESTION_MESSAGE),
         }
 
-    entries = faq_entries or get_faq_entries()
-    ranked = rank_faq_by_similarity(question, entries)
+    index = faq_index if faq_index is not None else FAQIndex(faq_entries or get_faq_entries())
+    cache_key = index.signature(question) if answer_cache is not None else ""
+    if answer_cache is not None and cache_key:
+        cached = answer_cache.get(cache_key, index.version)
+        if cached is not None:
+            logger.info(
+                "answer_cache_hit",
+                question=question,
+                confidence=cached["confidence"],
+                faq_version=index.version,
+                **answer_cache.stats(),
+            )
+            return {**cached, "messages": _assistant_response(cached["answer"])}
+
+    ranked = index.rank(question, limit=max(settings.escalation_top_k, 1))
     if not ranked:
         raise ValueError("Nenhuma entrada de FAQ disponível para avaliação.")
     best = ranked[0]
 
     if meets_threshold(best.score, settings.confidence_threshold):
-        logger.info(
-            "auto_answer",
-            question=question,
-            answer=best.entry["answer"],
-            confidence=best.score,
-        )
         answer_text = best.entry["answer"]
-        return {
+        result: AgentState = {
             "answer": answer_text,
             "confidence": best.score,
             "status": "respondido automaticamente",
-            "notes": f"Correspondência: {best.entry['question']}",
-            "messages": _assistant_response(answer_text),
+            "notes": _match_notes(best),
         }
+        if answer_cache is not None and cache_key:
+            answer_cache.put(cache_key, index.version, result)
+        logger.info(
+            "auto_answer",
+            question=question,
+            answer=answer_text,
+            confidence=best.score,
+            **_cache_stats(answer_cache),
+        )
+        return {**result, "messages": _assistant_response(answer_text)}
 
-    payload = _build_payload(question, best, entries)
+    payload = _build_payload(question, ranked, index.version)
     logger.info(
         "escalate_required",
         question=question,
         best_match=payload["best_match"],
         confidence=best.score,
+        faq_version=index.version,
+        **_cache_stats(answer_cache),
     )
     human_payload = interrupt(payload)
     human_message = human_payload.get("message") or ESCALATION_MESSAGE
     human_notes = human_payload.get("notes") or DEFAULT_NOTES
+    if learned_store is not None and human_message != ESCALATION_MESSAGE:
+        learned = learned_store.record(question, human_message, human_notes)
+        position = index.add_entry(learned.to_entry())
+        logger.info(
+            "answer_learned",
+            question=learned.question,
+            position=position,
+            faq_version=index.version,
+        )
     return {
         "answer": human_message,
         "confidence": best.score,
@@ -154,4 +223,11 @@ def resume_with_human_response(
     return state.values  # type: ignore[return-value]
 
 
-__all__ = ["evaluate_question", "resume_with_human_response", "ESCALATION_MESSAGE", "DEFAULT_NOTES"]
+__all__ = [
+    "FAQReference",
+    "HumanEscalationPayload",
+    "evaluate_question",
+    "resume_with_human_response",
+    "ESCALATION_MESSAGE",
+    "DEFAULT_NOTES",
+]
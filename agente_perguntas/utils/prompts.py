@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from typing import List
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class FAQEntry(TypedDict):
@@ -12,6 +12,7 @@ class FAQEntry(TypedDict):
     question: str
     answer: str
     tags: list[str]
+    provenance: NotRequired[str]
 
 
 def _normalize(text: str) -> str:
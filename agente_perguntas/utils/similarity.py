@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import math
 import re
+import threading
+import unicodedata
 from dataclasses import dataclass
-from typing import List, Sequence
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Iterable, List, Protocol, Sequence
+
+import numpy as np
 
 from agente_perguntas.utils.prompts import FAQEntry
 
@@ -16,6 +26,128 @@ def _tokenize(text: str) -> set[str]:
     return {token.lower() for token in _TOKEN_PATTERN.findall(text)}
 
 
+NORMALIZE_ACCENTS = "accents"
+NORMALIZE_STEM = "stem"
+NORMALIZE_STOPWORDS = "stopwords"
+NORMALIZATION_STEPS = (NORMALIZE_ACCENTS, NORMALIZE_STEM, NORMALIZE_STOPWORDS)
+
+PORTUGUESE_STOPWORDS = frozenset(
+    """
+    a à ao aos as às o os um uma uns umas de do da dos das em no na nos nas num numa
+    por pelo pela pelos pelas para pra com e ou que se me te lhe eu tu ele ela eles elas
+    você vocês nós meu minha meus minhas seu sua seus suas teu tua nosso nossa isso isto
+    esse essa este esta aquele aquela é são foi ser está estou como qual quais onde
+    quando quero gostaria preciso posso
+    """.split()
+)
+
+# Plural endings (longest first) for the light stemmer, in folded and accented forms.
+_PLURAL_SUFFIXES = (
+    ("ões", "ão"),
+    ("oes", "ao"),
+    ("ães", "ão"),
+    ("aes", "ao"),
+    ("ais", "al"),
+    ("éis", "el"),
+    ("eis", "el"),
+    ("óis", "ol"),
+    ("ois", "ol"),
+    ("res", "r"),
+    ("zes", "z"),
+    ("ns", "m"),
+)
+_FINAL_VOWELS = ("a", "e", "o")
+
+
+def fold_accents(text: str) -> str:
+    """Remove diacritics (``"não"`` -> ``"nao"``, ``"ção"`` -> ``"cao"``)."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+@lru_cache(maxsize=65536)
+def stem_portuguese(token: str) -> str:
+    """Light Portuguese stemmer: strip plural endings, then a final ``a``/``e``/``o``.
+
+    Deliberately conservative (no verb conjugation rules) so it only merges forms
+    such as ``"pagamento"``/``"pagamentos"`` or ``"notas"``/``"nota"``.
+    """
+    if len(token) < 4:
+        return token
+    for suffix, replacement in _PLURAL_SUFFIXES:
+        if token.endswith(suffix):
+            token = token[: -len(suffix)] + replacement
+            break
+    else:
+        if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+            token = token[:-1]
+    if len(token) > 3 and token.endswith(_FINAL_VOWELS):
+        token = token[:-1]
+    return token
+
+
+@dataclass(frozen=True, slots=True)
+class TokenNormalizer:
+    """Configurable token pipeline: lowercase, then optional accent folding,
+    stopword removal and light stemming (in that order).
+
+    The default instance only lowercases, exactly like :func:`_tokenize`. Calling the
+    normalizer memoizes the result per input string; :meth:`tokens` skips the string
+    cache and is used for the FAQ side, which is normalized once at index build time.
+    """
+
+    fold_accents: bool = False
+    stem: bool = False
+    remove_stopwords: bool = False
+
+    @classmethod
+    def from_spec(cls, spec: str | None) -> "TokenNormalizer":
+        """Build a normalizer from a comma separated list of :data:`NORMALIZATION_STEPS`.
+
+        ``"pt"`` enables every step; unknown names are ignored.
+        """
+        steps = {step.strip().lower() for step in (spec or "").split(",")}
+        if "pt" in steps:
+            steps.update(NORMALIZATION_STEPS)
+        return cls(
+            fold_accents=NORMALIZE_ACCENTS in steps,
+            stem=NORMALIZE_STEM in steps,
+            remove_stopwords=NORMALIZE_STOPWORDS in steps,
+        )
+
+    @property
+    def spec(self) -> str:
+        """Canonical comma separated description (persisted with compiled indexes)."""
+        enabled = (self.fold_accents, self.stem, self.remove_stopwords)
+        return ",".join(step for step, flag in zip(NORMALIZATION_STEPS, enabled) if flag)
+
+    def tokens(self, text: str) -> frozenset[str]:
+        """Return the normalized token set of ``text`` (uncached)."""
+        raw = [token.lower() for token in _TOKEN_PATTERN.findall(text)]
+        if self.fold_accents:
+            raw = [fold_accents(token) for token in raw]
+        if self.remove_stopwords:
+            stopwords = _FOLDED_STOPWORDS if self.fold_accents else PORTUGUESE_STOPWORDS
+            # A question made only of stopwords keeps them rather than matching nothing.
+            raw = [token for token in raw if token not in stopwords] or raw
+        if self.stem:
+            raw = [stem_portuguese(token) for token in raw]
+        return frozenset(raw)
+
+    def __call__(self, text: str) -> frozenset[str]:
+        """Return the normalized token set of ``text``, memoized per string."""
+        return _cached_tokens(self, text)
+
+
+_FOLDED_STOPWORDS = frozenset(fold_accents(word) for word in PORTUGUESE_STOPWORDS)
+PLAIN_NORMALIZER = TokenNormalizer()
+
+
+@lru_cache(maxsize=4096)
+def _cached_tokens(normalizer: TokenNormalizer, text: str) -> frozenset[str]:
+    return normalizer.tokens(text)
+
+
 def score_similarity(user_question: str, candidate_question: str) -> float:
     """Compute the overlap ratio between the user question and a FAQ question."""
     user_tokens = _tokenize(user_question)
@@ -33,6 +165,7 @@ class RankedFAQ:
 
     entry: FAQEntry
     score: float
+    position: int | None = None
 
 
 def rank_faq_by_similarity(question: str, entries: Sequence[FAQEntry]) -> list[RankedFAQ]:
@@ -59,4 +192,545 @@ def top_match(question: str, entries: Sequence[FAQEntry]) -> RankedFAQ:
     return ranked[0] if ranked else RankedFAQ(entry=entries[0], score=0.0)
 
 
-__all__ = ["RankedFAQ", "rank_faq_by_similarity", "score_similarity", "meets_threshold", "top_match"]
+SCORER_OVERLAP = "overlap"
+SCORER_BM25 = "bm25"
+SCORERS = (SCORER_OVERLAP, SCORER_BM25)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def _bm25_idf(document_count: int, document_frequency: int) -> float:
+    """Return the (always positive) BM25 inverse document frequency."""
+    return math.log(1.0 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+def calibrate_score(raw_score: float, reference_score: float) -> float:
+    """Map a raw scorer value into ``[0, 1]`` relative to ``reference_score``.
+
+    ``reference_score`` is the best value attainable for the comparison (for BM25,
+    the score of a perfect match), so an identical question calibrates to ``1.0``
+    and the result can be compared against ``confidence_threshold`` directly.
+    """
+    if reference_score <= 0.0:
+        return 0.0
+    return max(0.0, min(1.0, raw_score / reference_score))
+
+
+def fingerprint_entries(entries: Iterable[FAQEntry]) -> str:
+    """Return a short, stable content hash identifying a FAQ version."""
+    digest = hashlib.sha1()
+    for entry in entries:
+        digest.update(entry["question"].encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(entry["answer"].encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()[:12]
+
+
+class CandidateGenerator(Protocol):
+    """Approximate pre-filter returning base entry positions worth scoring exactly."""
+
+    def candidates(self, tokens: frozenset[str]) -> np.ndarray | None:
+        """Return candidate positions for ``tokens`` or ``None`` to fall back to the inverted index."""
+        ...
+
+
+class FAQIndex:
+    """Inverted index over FAQ questions with token sets computed once at build time.
+
+    Postings are stored as CSR arrays (``offsets`` per term id into ``positions``) so
+    an index can be memory-mapped from disk (see :mod:`agente_perguntas.utils.faq_store`).
+    Only entries sharing at least one token with the question are visited and the top
+    results are selected with a bounded heap instead of a full sort.
+
+    Two scorers are available:
+
+    * ``"overlap"`` (default): the same ratio returned by :func:`score_similarity`.
+    * ``"bm25"``: BM25 with binary term frequency (tokens are sets), calibrated with
+      :func:`calibrate_score` against ``max(ideal question score, ideal entry score)``
+      so it stays an IDF-weighted analogue of the overlap ratio. IDF, length weights
+      and ideal entry scores are precomputed into compact ``float64`` arrays.
+
+    Questions and FAQ entries go through the same :class:`TokenNormalizer`; the FAQ
+    side is normalized once here and only the vocabulary is kept.
+
+    An optional :class:`CandidateGenerator` (e.g. MinHash/LSH, see
+    :mod:`agente_perguntas.utils.minhash`) can replace the postings walk: only the
+    positions it returns are rescored exactly, using a per-entry term list.
+    """
+
+    __slots__ = (
+        "entries",
+        "scorer",
+        "version",
+        "normalizer",
+        "_vocabulary",
+        "_offsets",
+        "_positions",
+        "_doc_sizes",
+        "_idf",
+        "_doc_weights",
+        "_doc_ideals",
+        "_average_size",
+        "_unknown_idf",
+        "_base_version",
+        "_overlay_entries",
+        "_overlay_sizes",
+        "_overlay_ideals",
+        "_overlay_postings",
+        "_overlay_by_question",
+        "_overlay_lock",
+        "_candidate_generator",
+        "_term_lists",
+    )
+
+    ARRAY_NAMES = ("offsets", "positions", "doc_sizes", "idf", "doc_weights", "doc_ideals")
+
+    def __init__(
+        self,
+        entries: Iterable[FAQEntry],
+        *,
+        scorer: str = SCORER_OVERLAP,
+        normalizer: TokenNormalizer = PLAIN_NORMALIZER,
+    ) -> None:
+        entries = list(entries)
+        vocabulary: dict[str, int] = {}
+        postings: list[list[int]] = []
+        sizes: list[int] = []
+        for position, entry in enumerate(entries):
+            tokens = normalizer.tokens(entry["question"])
+            sizes.append(len(tokens))
+            for token in tokens:
+                term_id = vocabulary.setdefault(token, len(vocabulary))
+                if term_id == len(postings):
+                    postings.append([])
+                postings[term_id].append(position)
+
+        offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, postings), dtype=np.int64, count=len(postings)), out=offsets[1:])
+        positions = np.fromiter(
+            (position for posting in postings for position in posting),
+            dtype=np.int64,
+            count=int(offsets[-1]),
+        )
+        doc_sizes = np.array(sizes, dtype=np.uint32)
+        arrays = {"offsets": offsets, "positions": positions, "doc_sizes": doc_sizes}
+        arrays.update(_derive_weights(offsets, positions, doc_sizes))
+        version = fingerprint_entries(entries)
+        if normalizer.spec:
+            version = f"{version}:{normalizer.spec}"
+        self._assign(entries, vocabulary, arrays, scorer=scorer, version=version, normalizer=normalizer)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        entries: Sequence[FAQEntry],
+        vocabulary: dict[str, int],
+        arrays: dict[str, np.ndarray],
+        *,
+        scorer: str = SCORER_OVERLAP,
+        version: str,
+        normalizer: TokenNormalizer = PLAIN_NORMALIZER,
+    ) -> "FAQIndex":
+        """Rebuild an index from precomputed (possibly memory-mapped) arrays.
+
+        ``normalizer`` must be the one the vocabulary was built with.
+        """
+        index = cls.__new__(cls)
+        index._assign(entries, vocabulary, arrays, scorer=scorer, version=version, normalizer=normalizer)
+        return index
+
+    def _assign(
+        self,
+        entries: Sequence[FAQEntry],
+        vocabulary: dict[str, int],
+        arrays: dict[str, np.ndarray],
+        *,
+        scorer: str,
+        version: str,
+        normalizer: TokenNormalizer,
+    ) -> None:
+        if scorer not in SCORERS:
+            raise ValueError(f"Scorer desconhecido: {scorer!r}. Use um de {', '.join(SCORERS)}.")
+        self.entries = entries
+        self.scorer = scorer
+        self.version = version
+        self.normalizer = normalizer
+        self._base_version = version
+        self._overlay_entries: list[FAQEntry] = []
+        self._overlay_sizes: list[int] = []
+        self._overlay_ideals: list[float] = []
+        self._overlay_postings: dict[str, list[int]] = {}
+        self._overlay_by_question: dict[str, int] = {}
+        self._overlay_lock = threading.Lock()
+        self._candidate_generator: CandidateGenerator | None = None
+        self._term_lists: tuple[np.ndarray, np.ndarray] | None = None
+        self._vocabulary = vocabulary
+        self._offsets = arrays["offsets"]
+        self._positions = arrays["positions"]
+        self._doc_sizes = arrays["doc_sizes"]
+        self._idf = arrays["idf"]
+        self._doc_weights = arrays["doc_weights"]
+        self._doc_ideals = arrays["doc_ideals"]
+        document_count = len(self._doc_sizes)
+        self._average_size = float(self._doc_sizes.mean()) if document_count else 0.0
+        self._unknown_idf = _bm25_idf(document_count, 1)
+
+    def __len__(self) -> int:
+        return len(self.entries) + len(self._overlay_entries)
+
+    def entry_at(self, position: int) -> FAQEntry:
+        """Return the entry at ``position`` (base entries first, then incremental additions)."""
+        base_size = len(self.entries)
+        return self.entries[position] if position < base_size else self._overlay_entries[position - base_size]
+
+    def add_entry(self, entry: FAQEntry) -> int:
+        """Merge ``entry`` into the live index without rebuilding the base arrays.
+
+        Added entries live in a small in-memory overlay scored with the base corpus
+        statistics (IDF and average length are refreshed on the next full build). Adding
+        a question that is already in the overlay replaces its answer. The index version
+        changes, so caches keyed by version are invalidated. Returns the entry position.
+        """
+        tokens = self.normalizer.tokens(entry["question"])
+        with self._overlay_lock:
+            local = self._overlay_by_question.get(entry["question"])
+            if local is not None:
+                self._overlay_entries[local] = entry
+            else:
+                local = len(self._overlay_entries)
+                self._overlay_entries.append(entry)
+                self._overlay_sizes.append(len(tokens))
+                self._overlay_ideals.append(
+                    self._length_weight(len(tokens)) * sum(self._token_idf(token) for token in tokens)
+                )
+                for token in tokens:
+                    self._overlay_postings.setdefault(token, []).append(local)
+                self._overlay_by_question[entry["question"]] = local
+            digest = fingerprint_entries(self._overlay_entries)
+            self.version = f"{self._base_version}+{digest[:6]}"
+        return len(self.entries) + local
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Return the index arrays keyed by :attr:`ARRAY_NAMES` (used for persistence)."""
+        return {name: getattr(self, f"_{name}") for name in self.ARRAY_NAMES}
+
+    @property
+    def vocabulary(self) -> dict[str, int]:
+        """Mapping of normalized token to term id."""
+        return self._vocabulary
+
+    @property
+    def candidate_generator(self) -> CandidateGenerator | None:
+        return self._candidate_generator
+
+    def set_candidate_generator(self, generator: CandidateGenerator | None) -> None:
+        """Use ``generator`` to pick the base entries scored by :meth:`rank` (``None`` restores exact ranking)."""
+        self._candidate_generator = generator
+
+    def term_lists(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the forward index ``(offsets, term_ids)``: term ids of each base entry, CSR encoded.
+
+        Derived from the postings on first use and cached, so memory-mapped indexes
+        only pay for it when a candidate generator needs it.
+        """
+        if self._term_lists is None:
+            document_count = len(self._doc_sizes)
+            term_of_posting = np.repeat(np.arange(len(self._offsets) - 1, dtype=np.int64), np.diff(self._offsets))
+            order = np.argsort(self._positions, kind="stable")
+            offsets = np.zeros(document_count + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self._positions, minlength=document_count), out=offsets[1:])
+            self._term_lists = (offsets, term_of_posting[order])
+        return self._term_lists
+
+    def signature(self, question: str) -> str:
+        """Return an order-insensitive key for ``question`` built from its normalized tokens."""
+        return " ".join(sorted(self.normalizer(question.strip())))
+
+    def _token_idf(self, token: str) -> float:
+        term_id = self._vocabulary.get(token)
+        return self._unknown_idf if term_id is None else float(self._idf[term_id])
+
+    def _length_weight(self, size: int) -> float:
+        """Return the BM25 term weight for a single matching token in a text of ``size`` tokens."""
+        if not self._average_size:
+            return 0.0
+        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * size / self._average_size)
+        return (BM25_K1 + 1.0) / (1.0 + norm)
+
+    def _query_ideal(self, tokens: frozenset[str]) -> float:
+        return self._length_weight(len(tokens)) * sum(self._token_idf(token) for token in tokens)
+
+    def _score_overlay(self, tokens: frozenset[str]) -> list[tuple[int, float]]:
+        """Return ``(position, score)`` pairs for overlay entries sharing a token."""
+        shared: dict[int, list[float]] = {}
+        for token in tokens:
+            for local in self._overlay_postings.get(token, ()):
+                match = shared.setdefault(local, [0, 0.0])
+                match[0] += 1
+                match[1] += self._token_idf(token)
+        base_size = len(self.entries)
+        scored: list[tuple[int, float]] = []
+        query_ideal = self._query_ideal(tokens) if self.scorer == SCORER_BM25 else 0.0
+        for local, (count, shared_idf) in sorted(shared.items()):
+            size = self._overlay_sizes[local]
+            if self.scorer == SCORER_BM25:
+                raw = self._length_weight(size) * shared_idf
+                score = calibrate_score(raw, max(query_ideal, self._overlay_ideals[local]))
+            else:
+                score = count / max(len(tokens), size)
+            scored.append((base_size + local, score))
+        return scored
+
+    def _score_positions(self, tokens: frozenset[str], positions: np.ndarray) -> np.ndarray:
+        """Score the base entries at ``positions`` exactly, reading their term lists."""
+        query_ids = np.fromiter(
+            (self._vocabulary[token] for token in tokens if token in self._vocabulary), dtype=np.int64
+        )
+        offsets, terms = self.term_lists()
+        starts = offsets[positions]
+        lengths = offsets[positions + 1] - starts
+        segment = np.repeat(np.arange(positions.size), lengths)
+        gather = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths - starts, lengths)
+        entry_terms = terms[gather]
+        hits = np.isin(entry_terms, query_ids)
+
+        if self.scorer == SCORER_BM25:
+            weights = np.where(hits, self._idf[entry_terms], 0.0)
+            shared_idf = np.bincount(segment, weights=weights, minlength=positions.size)
+            raw = self._doc_weights[positions] * shared_idf
+            reference = np.maximum(self._query_ideal(tokens), self._doc_ideals[positions])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.clip(np.where(reference > 0.0, raw / reference, 0.0), 0.0, 1.0)
+
+        shared = np.bincount(segment, weights=hits, minlength=positions.size)
+        return shared / np.maximum(len(tokens), self._doc_sizes[positions])
+
+    def _score_candidates(self, tokens: frozenset[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(positions, scores)`` for base entries sharing a token, in FAQ order."""
+        if self._candidate_generator is not None:
+            positions = self._candidate_generator.candidates(tokens)
+            if positions is not None and positions.size:
+                positions = np.unique(positions)
+                return positions, self._score_positions(tokens, positions)
+        term_ids = [self._vocabulary[token] for token in tokens if token in self._vocabulary]
+        if not term_ids:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        docs = np.concatenate([self._positions[self._offsets[term] : self._offsets[term + 1]] for term in term_ids])
+        candidates, inverse = np.unique(docs, return_inverse=True)
+
+        if self.scorer == SCORER_BM25:
+            lengths = self._offsets[np.add(term_ids, 1)] - self._offsets[term_ids]
+            shared_idf = np.bincount(inverse, weights=np.repeat(self._idf[term_ids], lengths))
+            query_ideal = self._query_ideal(tokens)
+            raw = self._doc_weights[candidates] * shared_idf
+            reference = np.maximum(query_ideal, self._doc_ideals[candidates])
+            return candidates, np.clip(raw / reference, 0.0, 1.0)
+
+        shared = np.bincount(inverse)
+        return candidates, shared / np.maximum(len(tokens), self._doc_sizes[candidates])
+
+    def rank(self, question: str, *, limit: int = 1) -> list[RankedFAQ]:
+        """Return up to ``limit`` entries (highest score first) for ``question``.
+
+        Ties keep FAQ order, matching :func:`rank_faq_by_similarity`. When fewer than
+        ``limit`` entries share a token with the question, the remaining slots are
+        filled with zero-score entries so callers always get a best match.
+        """
+        if limit <= 0 or not len(self):
+            return []
+        tokens = self.normalizer(question.strip())
+        best: list[tuple[int, float]] = []
+        if tokens:
+            candidates, scores = self._score_candidates(tokens)
+            scored = zip(candidates.tolist(), scores.tolist())
+            if self._overlay_entries:
+                scored = chain(scored, self._score_overlay(tokens))
+            best = heapq.nlargest(limit, scored, key=itemgetter(1))
+        ranked = [
+            RankedFAQ(entry=self.entry_at(position), score=score, position=position) for position, score in best
+        ]
+        if len(ranked) < limit:
+            seen = {position for position, _ in best}
+            for position in range(len(self)):
+                if len(ranked) >= limit:
+                    break
+                if position not in seen:
+                    ranked.append(RankedFAQ(entry=self.entry_at(position), score=0.0, position=position))
+        return ranked
+
+    def top_match(self, question: str) -> RankedFAQ:
+        """Return only the best match for ``question``."""
+        if not len(self):
+            raise ValueError("A lista de FAQ não pode estar vazia ao calcular similaridade.")
+        return self.rank(question, limit=1)[0]
+
+
+def _derive_weights(offsets: np.ndarray, positions: np.ndarray, doc_sizes: np.ndarray) -> dict[str, np.ndarray]:
+    """Compute the BM25 arrays (idf, per-entry weights and ideal scores) from the postings."""
+    document_count = len(doc_sizes)
+    document_frequency = np.diff(offsets).astype(np.float64)
+    idf = np.log1p((document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+    if document_count and doc_sizes.any():
+        relative = doc_sizes.astype(np.float64) / doc_sizes.mean()
+        doc_weights = (BM25_K1 + 1.0) / (1.0 + BM25_K1 * (1.0 - BM25_B + BM25_B * relative))
+    else:
+        doc_weights = np.zeros(document_count, dtype=np.float64)
+    term_of_posting = np.repeat(np.arange(idf.size), np.diff(offsets))
+    doc_ideals = doc_weights * np.bincount(positions, weights=idf[term_of_posting], minlength=document_count)
+    return {"idf": idf, "doc_weights": doc_weights, "doc_ideals": doc_ideals}
+
+
+@dataclass(slots=True)
+class BatchRanking:
+    """Top-k FAQ positions and scores for a batch of questions (one row per question)."""
+
+    indices: np.ndarray
+    scores: np.ndarray
+
+    def ranked(self, index: FAQIndex) -> list[list[RankedFAQ]]:
+        """Materialize the batch as :class:`RankedFAQ` lists using ``index`` entries (overlay included)."""
+        return [
+            [
+                RankedFAQ(entry=index.entry_at(int(position)), score=float(score), position=int(position))
+                for position, score in zip(row, row_scores)
+            ]
+            for row, row_scores in zip(self.indices, self.scores)
+        ]
+
+
+_BATCH_CELL_BUDGET = 1 << 24
+
+
+def _select_top(row: np.ndarray, limit: int) -> np.ndarray:
+    """Return the ``limit`` best positions of ``row`` ordered by score, ties by position."""
+    if limit >= row.size:
+        selected = np.arange(row.size)
+    else:
+        pivot = row[np.argpartition(-row, limit - 1)[:limit]].min()
+        above = np.flatnonzero(row > pivot)
+        tied = np.flatnonzero(row == pivot)[: limit - above.size]
+        selected = np.concatenate((above, tied))
+    return selected[np.lexsort((selected, -row[selected]))]
+
+
+def rank_batch(
+    questions: Sequence[str],
+    index: FAQIndex,
+    *,
+    limit: int = 1,
+) -> BatchRanking:
+    """Score every question against ``index`` with token-incidence matrix products.
+
+    Questions are encoded as a dense question x term matrix (binary for ``overlap``,
+    IDF-weighted for ``bm25``) restricted to the terms present in the batch, and
+    multiplied against the binary incidence matrix of the candidate FAQ entries.
+    Work is chunked so no intermediate matrix exceeds ``_BATCH_CELL_BUDGET`` cells.
+    Entries merged with :meth:`FAQIndex.add_entry` are scored per question like in
+    :meth:`FAQIndex.rank`. Scores match :meth:`FAQIndex.rank` and top-k positions come
+    from ``argpartition``.
+    """
+    document_count = len(index.entries)
+    with index._overlay_lock:
+        overlay_count = len(index._overlay_entries)
+    limit = min(max(limit, 0), document_count + overlay_count)
+    indices = np.zeros((len(questions), limit), dtype=np.int64)
+    scores = np.zeros((len(questions), limit), dtype=np.float64)
+    if not limit:
+        return BatchRanking(indices=indices, scores=scores)
+
+    offsets, positions = index._offsets, index._positions
+    doc_sizes = index._doc_sizes.astype(np.float64)
+    doc_weights = index._doc_weights
+    doc_ideals = index._doc_ideals
+    idf = index._idf
+    use_bm25 = index.scorer == SCORER_BM25
+    chunk_size = max(1, _BATCH_CELL_BUDGET // max(document_count, 1))
+
+    for chunk_start in range(0, len(questions), chunk_size):
+        chunk = [index.normalizer(question.strip()) for question in questions[chunk_start : chunk_start + chunk_size]]
+        local_terms: dict[int, int] = {}
+        for tokens in chunk:
+            for token in tokens:
+                term_id = index._vocabulary.get(token)
+                if term_id is not None:
+                    local_terms.setdefault(term_id, len(local_terms))
+
+        query_sizes = np.array([len(tokens) for tokens in chunk], dtype=np.float64)
+        query_matrix = np.zeros((len(chunk), len(local_terms)), dtype=np.float64)
+        query_ideals = np.zeros(len(chunk), dtype=np.float64)
+        for row, tokens in enumerate(chunk):
+            query_idf = 0.0
+            for token in tokens:
+                term_id = index._vocabulary.get(token)
+                if term_id is None:
+                    query_idf += index._unknown_idf
+                    continue
+                weight = idf[term_id] if use_bm25 else 1.0
+                query_matrix[row, local_terms[term_id]] = weight
+                query_idf += idf[term_id]
+            query_ideals[row] = index._length_weight(len(tokens)) * query_idf
+
+        chunk_scores = np.zeros((len(chunk), document_count + overlay_count), dtype=np.float64)
+        if local_terms:
+            term_ids = np.fromiter(local_terms, dtype=np.int64, count=len(local_terms))
+            lengths = offsets[term_ids + 1] - offsets[term_ids]
+            docs = np.concatenate([positions[offsets[term] : offsets[term + 1]] for term in term_ids])
+            columns = np.repeat(np.arange(term_ids.size), lengths)
+            order = np.argsort(docs, kind="stable")
+            docs, columns = docs[order], columns[order]
+            candidates = np.unique(docs)
+            block_size = max(1, _BATCH_CELL_BUDGET // term_ids.size)
+            for block_start in range(0, candidates.size, block_size):
+                block = candidates[block_start : block_start + block_size]
+                low, high = np.searchsorted(docs, (block[0], block[-1] + 1))
+                incidence = np.zeros((block.size, term_ids.size), dtype=np.float64)
+                incidence[np.searchsorted(block, docs[low:high]), columns[low:high]] = 1.0
+                shared = query_matrix @ incidence.T
+                if use_bm25:
+                    reference = np.maximum(query_ideals[:, None], doc_ideals[block][None, :])
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        block_scores = np.where(reference > 0.0, shared * doc_weights[block] / reference, 0.0)
+                    block_scores = np.clip(block_scores, 0.0, 1.0)
+                else:
+                    denominator = np.maximum(query_sizes[:, None], doc_sizes[block][None, :])
+                    block_scores = shared / denominator
+                chunk_scores[:, block] = block_scores
+
+        if overlay_count:
+            for row, tokens in enumerate(chunk):
+                for position, score in index._score_overlay(tokens):
+                    if position < document_count + overlay_count:
+                        chunk_scores[row, position] = score
+
+        for row, row_scores in enumerate(chunk_scores):
+            selected = _select_top(row_scores, limit)
+            indices[chunk_start + row] = selected
+            scores[chunk_start + row] = row_scores[selected]
+
+    return BatchRanking(indices=indices, scores=scores)
+
+
+__all__ = [
+    "NORMALIZATION_STEPS",
+    "PLAIN_NORMALIZER",
+    "PORTUGUESE_STOPWORDS",
+    "SCORERS",
+    "SCORER_BM25",
+    "SCORER_OVERLAP",
+    "BatchRanking",
+    "CandidateGenerator",
+    "FAQIndex",
+    "RankedFAQ",
+    "rank_batch",
+    "rank_faq_by_similarity",
+    "score_similarity",
+    "calibrate_score",
+    "fingerprint_entries",
+    "fold_accents",
+    "stem_portuguese",
+    "TokenNormalizer",
+    "meets_threshold",
+    "top_match",
+]
@@ -28,6 +28,11 @@ class AppConfig:
     timeout_seconds: int = int(os.getenv("AGENT_TIMEOUT_SECONDS", "30"))
     api_key: Optional[str] = os.getenv("GEMINI_API_KEY")
     default_thread_id: str = os.getenv("DEFAULT_THREAD_ID", "calculator-cli")
+    arithmetic_bypass: bool = os.getenv("AGENT_ARITHMETIC_BYPASS", "true").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+    }
 
     def create_llm(self) -> ChatGoogleGenerativeAI:
         """Instantiate the Gemini chat model using the current configuration."""
@@ -7,13 +7,14 @@ from functools import partial
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
 
-from agente_tool.config import config
+from agente_tool import config as config_module
 from agente_tool.state import GraphState
 from agente_tool.utils import (
     STATUS_ERROR,
     format_response,
     handle_tool_result,
     invoke_model,
+    parse_arithmetic,
     plan_tool_usage,
     validate_input,
 )
@@ -24,7 +25,11 @@ logger = get_logger(__name__)
 
 
 def _route_after_validation(state: GraphState) -> str:
-    return "format_response" if state.get("status") == STATUS_ERROR else "invoke_model"
+    return "format_response" if state.get("status") == STATUS_ERROR else "parse_arithmetic"
+
+
+def _route_after_parsing(state: GraphState) -> str:
+    return "format_response" if state.get("metadata", {}).get("arithmetic_bypass") else "invoke_model"
 
 
 def _route_after_invoke(state: GraphState) -> str:
@@ -44,11 +49,13 @@ def _route_after_tools(state: GraphState) -> str:
 def create_app():
     """Compile and return the agente_tool LangGraph workflow."""
 
+    config = config_module.config
     tools = [calculator]
     model = config.create_model_with_tools(tools)
 
     builder = StateGraph(GraphState)
     builder.add_node("validate_input", validate_input)
+    builder.add_node("parse_arithmetic", partial(parse_arithmetic, app_config=config))
     builder.add_node("invoke_model", partial(invoke_model, llm=model, app_config=config))
     builder.add_node("plan_tool_usage", plan_tool_usage)
     builder.add_node("tools", ToolNode(tools))
@@ -57,6 +64,7 @@ def create_app():
 
     builder.add_edge(START, "validate_input")
     builder.add_conditional_edges("validate_input", _route_after_validation)
+    builder.add_conditional_edges("parse_arithmetic", _route_after_parsing)
     builder.add_conditional_edges("invoke_model", _route_after_invoke)
     builder.add_conditional_edges("plan_tool_usage", _route_after_planning)
     builder.add_edge("tools", "handle_tool_result")
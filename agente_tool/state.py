@@ -33,6 +33,7 @@ class GraphState(TypedDict, total=False):
     tool_call: Optional[Dict[str, Any]]
     pending_tool_calls: Optional[List[Dict[str, Any]]]
     last_tool_run: Optional[Dict[str, Any]]
+    tool_runs: Optional[List[Dict[str, Any]]]
     duration_seconds: float
 
 
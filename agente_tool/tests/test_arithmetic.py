@@ -0,0 +1,116 @@
+"""Tests for the deterministic arithmetic pre-parser and its graph node."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from agente_tool.config import AppConfig
+from agente_tool.graph import _route_after_parsing
+from agente_tool.utils import STATUS_ERROR, STATUS_RESPONDED, arithmetic_bypass_stats, parse_arithmetic, validate_input
+from agente_tool.utils.arithmetic import format_result, translate_question
+
+
+@pytest.mark.parametrize(
+    ("question", "expression"),
+    [
+        ("quanto é 300 dividido por 4?", "300 / 4"),
+        ("Quanto é 20% de 150?", "(20 / 100 * 150)"),
+        ("quanto dá 150 mais 20%?", "(150) * (1 + 20 / 100)"),
+        ("200 menos 10 por cento", "(200) * (1 - 10 / 100)"),
+        ("qual o resultado de 2 elevado a 10", "2 ** 10"),
+        ("Calcule 7 vezes 8", "7 * 8"),
+        ("quanto é R$ 1.500 menos R$ 350?", "1500 - 350"),
+        ("10 menos 2,5", "10 - 2.5"),
+        ("quanto é 100 mais 10% de 50 mais 5?", "100 + (10 / 100 * 50) + 5"),
+        ("calcule (1500 - 350) * 1,20", "( 1500 - 350 ) * 1.20"),
+    ],
+)
+def test_translates_common_phrasings(question: str, expression: str) -> None:
+    assert translate_question(question) == expression
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Qual é a capital do Brasil?",
+        "quanto é 5?",
+        "dois mais dois",
+        "Eu tinha R$ 1.500, paguei uma conta de R$ 350 e recebi 20% do que sobrou. Com quanto fiquei?",
+        "quanto é 3 mais?",
+        "20% de",
+        "quanto é 100 mais 10% mais 5?",
+        "10% mais 100",
+        "100 vezes 10% menos 3",
+    ],
+)
+def test_leaves_ambiguous_questions_to_the_model(question: str) -> None:
+    assert translate_question(question) is None
+
+
+def test_format_result_uses_brazilian_notation() -> None:
+    assert format_result("75.0") == "75"
+    assert format_result("7.5") == "7,5"
+    assert format_result("Error: division by zero") == "Error: division by zero"
+
+
+def _validated(question: str) -> dict:
+    state = {"messages": [HumanMessage(content=question)], "metadata": {}}
+    return {**state, **validate_input(state)}
+
+
+def test_parse_arithmetic_answers_without_the_model(caplog) -> None:
+    caplog.set_level(logging.INFO)
+    before = arithmetic_bypass_stats()
+
+    update = parse_arithmetic(_validated("quanto é 300 dividido por 4?"), app_config=AppConfig(api_key="x"))
+
+    assert update["status"] == STATUS_RESPONDED
+    assert update["tool_call"] == update["last_tool_run"]
+    assert update["tool_call"]["name"] == "calculator"
+    assert update["tool_call"]["result"] == "75.0"
+    assert "**75**" in update["resposta"]
+    assert isinstance(update["messages"][0], AIMessage)
+    assert _route_after_parsing({**update}) == "format_response"
+    after = arithmetic_bypass_stats()
+    assert after["bypassed"] == before["bypassed"] + 1
+    assert any("sem o modelo" in record.message for record in caplog.records)
+
+
+def test_parse_arithmetic_routes_other_questions_to_the_model() -> None:
+    before = arithmetic_bypass_stats()
+
+    update = parse_arithmetic(_validated("Qual é a capital do Brasil?"), app_config=AppConfig(api_key="x"))
+
+    assert update["metadata"]["arithmetic_bypass"] is False
+    assert "status" not in update
+    assert _route_after_parsing(update) == "invoke_model"
+    after = arithmetic_bypass_stats()
+    assert (after["questions"], after["bypassed"]) == (before["questions"] + 1, before["bypassed"])
+
+
+def test_parse_arithmetic_reports_calculator_errors() -> None:
+    update = parse_arithmetic(_validated("quanto é 1 dividido por 0?"), app_config=AppConfig(api_key="x"))
+
+    assert update["status"] == STATUS_ERROR
+    assert update["tool_call"]["error"] == "Error: division by zero"
+    assert _route_after_parsing(update) == "format_response"
+
+
+def test_parse_arithmetic_reports_unprintable_results_as_errors() -> None:
+    question = "quanto é " + " mais ".join(["10 elevado a 4299"] * 10) + "?"
+
+    update = parse_arithmetic(_validated(question), app_config=AppConfig(api_key="x"))
+
+    assert update["status"] == STATUS_ERROR
+    assert "dígitos" in update["tool_call"]["error"]
+
+
+def test_bypass_can_be_disabled() -> None:
+    config = AppConfig(api_key="x", arithmetic_bypass=False)
+
+    update = parse_arithmetic(_validated("quanto é 300 dividido por 4?"), app_config=config)
+
+    assert update["metadata"]["arithmetic_bypass"] is False
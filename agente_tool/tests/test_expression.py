@@ -0,0 +1,105 @@
+"""Tests for the compiled arithmetic engine behind the calculator tool."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from agente_tool.utils import expression
+from agente_tool.utils.expression import ExpressionError, compile_expression, evaluate_expression
+from agente_tool.utils.tools import calculator
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "300 / 4",
+        "(1500 - 350) * 1.20",
+        "2 ** 10",
+        "2 ** -2",
+        "10 % 3",
+        "-7.5 % 2",
+        "-5 // 2",
+        "+3 - -2",
+        "abs(-3) + max(1, 2) * min(4, 5)",
+        "round(2.567, 2)",
+        "round(123456, -3)",
+        "pow(3, 4, 5)",
+        "int(7.9) + float(1)",
+        "1e308 * 10",
+        "10 ** 4299 - 1",
+    ],
+)
+def test_results_match_eval(source: str) -> None:
+    assert calculator.invoke({"expression": source}) == str(eval(source))  # noqa: S307
+
+
+@pytest.mark.parametrize(
+    ("source", "message"),
+    [
+        ("1 / 0", "division by zero"),
+        ("x + 1", "name 'x' is not defined"),
+        ("__import__('os')", "não suportado"),
+        ("'a' * 3", "não suportado"),
+        ("3 4", "invalid syntax"),
+    ],
+)
+def test_invalid_expressions_return_errors(source: str, message: str) -> None:
+    result = calculator.invoke({"expression": source})
+
+    assert result.startswith("Error:")
+    assert message in result
+
+
+@pytest.mark.parametrize("source", ["9 ** 9 ** 9", "10 ** 5000", "(10 ** 2000) * (10 ** 2000) * (10 ** 2000)"])
+def test_huge_integer_results_are_rejected_quickly(source: str) -> None:
+    started = time.perf_counter()
+    with pytest.raises(ExpressionError, match="dígitos"):
+        evaluate_expression(source)
+    assert time.perf_counter() - started < 0.5
+
+
+@pytest.mark.parametrize("source", ["round(5, -10 ** 8)", "round(5.5, 10 ** 8)"])
+def test_round_with_huge_ndigits_is_rejected_quickly(source: str) -> None:
+    started = time.perf_counter()
+    with pytest.raises(ExpressionError, match="round"):
+        evaluate_expression(source)
+    assert time.perf_counter() - started < 0.5
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["pow(3, 10 ** 4299, 10 ** 4299 + 7)", "pow(3, 10 ** 4000, 10 ** 4000 + 1) + pow(3, 10 ** 4000, 10 ** 4000 + 1)"],
+)
+def test_modular_pow_with_huge_operands_is_rejected_quickly(source: str) -> None:
+    started = time.perf_counter()
+    with pytest.raises(ExpressionError, match="pow modular"):
+        evaluate_expression(source)
+    assert time.perf_counter() - started < 0.5
+
+
+def test_sums_past_the_printable_limit_return_errors() -> None:
+    source = "+".join(["10 ** 4299"] * 10)
+
+    with pytest.raises(ExpressionError, match="dígitos"):
+        evaluate_expression(source)
+    assert calculator.invoke({"expression": source}).startswith("Error:")
+
+
+def test_oversized_expressions_are_rejected() -> None:
+    with pytest.raises(ExpressionError, match="caracteres"):
+        compile_expression("1 + " * 400 + "1")
+    with pytest.raises(ExpressionError, match="elementos"):
+        compile_expression(" + ".join(["1"] * 150))
+
+
+def test_compiled_expressions_are_cached_by_normalized_text() -> None:
+    expression._compile_normalized.cache_clear()
+
+    first = compile_expression("300 / 4")
+    second = compile_expression("  300   /\t4 ")
+
+    assert first is second
+    assert first() == 75.0
+    assert expression._compile_normalized.cache_info().hits == 1
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from langchain_core.messages import AIMessage, ToolMessage
+import threading
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langgraph.prebuilt import ToolNode
 
+from agente_tool.utils import tools
+
 
 class ToolAwareLLM:
     """LLM stub that issues a tool call and then formats the final answer."""
@@ -41,15 +46,74 @@ class ToolAwareLLM:
         return AIMessage(content=f"Para calcular 300 dividido por 4, obtemos {result}.")
 
 
-def test_graph_flow_uses_calculator(create_app, initial_state, thread_config):
-    app = create_app(llm=ToolAwareLLM())
+def test_graph_flow_uses_calculator(create_app, initial_state, thread_config, default_config, monkeypatch):
+    monkeypatch.setattr(default_config, "arithmetic_bypass", False)
+    llm = ToolAwareLLM()
+    app = create_app(llm=llm)
     config = {"configurable": {"thread_id": thread_config.thread_id}}
 
     result = app.invoke(initial_state, config=config)
 
     assert isinstance(app.nodes["tools"].node.steps[0], ToolNode)
+    assert llm._call_counter == 2
     assert result["status"] == "completed"
+    assert result["metadata"]["arithmetic_bypass"] is False
     assert result["tool_call"]["name"] == "calculator"
     assert result["tool_call"]["result"] == "75.0"
     assert result["last_tool_run"]["result"] == "75.0"
     assert "Resposta do agente:" in result["resposta"]
+
+
+class MultiStepLLM:
+    """LLM stub that requests two calculations at once, then answers from both results."""
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    def bind_tools(self, tools):
+        return self
+
+    def invoke(self, messages):  # type: ignore[override]
+        self.requests.append(list(messages))
+        if len(self.requests) == 1:
+            return AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": "calculator", "args": {"expression": "1500 - 350"}, "id": "call_a"},
+                    {"name": "calculator", "args": {"expression": "1150 * 1.2"}, "id": "call_b"},
+                ],
+            )
+        results = [message.content for message in messages if isinstance(message, ToolMessage)]
+        return AIMessage(content=f"Restaram {results[0]} e o montante final é {results[1]}.")
+
+
+def test_graph_runs_all_tool_calls_of_a_turn_concurrently(create_app, thread_config, monkeypatch):
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    evaluate = tools.evaluate_expression
+
+    def slow_evaluate(expression):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return evaluate(expression)
+
+    monkeypatch.setattr(tools, "evaluate_expression", slow_evaluate)
+    llm = MultiStepLLM()
+    app = create_app(llm=llm)
+    state = {
+        "messages": [HumanMessage(content="Eu tinha R$ 1.500, paguei R$ 350 e recebi 20% do que sobrou. Com quanto fiquei?")],
+        "metadata": {},
+    }
+
+    result = app.invoke(state, config={"configurable": {"thread_id": thread_config.thread_id}})
+
+    assert active["peak"] == 2
+    assert len(llm.requests) == 2
+    assert [run["result"] for run in result["tool_runs"]] == ["1150", "1380.0"]
+    assert result["last_tool_run"]["call_id"] == "call_b"
+    assert result["metadata"]["tool_calls_per_turn"] == [2]
+    assert "montante final é 1380.0" in result["resposta"]
@@ -21,6 +21,7 @@ from agente_tool.utils import (
     format_response,
     invoke_model,
     plan_tool_usage,
+    tool_call_stats,
     validate_input,
 )
 
@@ -139,6 +140,89 @@ def test_handle_tool_result_handles_error():
     assert update["tool_call"]["error"].startswith("Error:")
 
 
+def _multi_call_message(*expressions: str) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": "calculator", "args": {"expression": expression}, "id": f"call_{index}"}
+            for index, expression in enumerate(expressions)
+        ],
+    )
+
+
+def test_plan_tool_usage_keeps_every_call(initial_state):
+    validated = _apply_update(initial_state, validate_input(initial_state))
+    with_response = _apply_update(validated, {"messages": [_multi_call_message("1500 - 350", "1150 * 0.2")]})
+
+    update = plan_tool_usage(with_response)
+
+    assert update["tool_plan"]["call_id"] == "call_0"
+    assert [call["args"]["expression"] for call in update["pending_tool_calls"]] == ["1500 - 350", "1150 * 0.2"]
+
+
+def test_plan_tool_usage_rejects_unknown_tool_among_calls(initial_state):
+    message = _multi_call_message("2 + 2")
+    message.tool_calls.append({"name": "web_search", "args": {}, "id": "call_9", "type": "tool_call"})
+    validated = _apply_update(initial_state, validate_input(initial_state))
+
+    update = plan_tool_usage(_apply_update(validated, {"messages": [message]}))
+
+    assert update["status"] == STATUS_ERROR
+    assert update["selected_tool"] == "web_search"
+    assert update["pending_tool_calls"] == []
+
+
+def test_handle_tool_result_records_every_call_of_the_turn():
+    before = tool_call_stats()
+    state: GraphState = {
+        "metadata": {"tool_calls_per_turn": [1]},
+        "pending_tool_calls": [
+            {"name": "calculator", "args": {"expression": "1500 - 350"}, "call_id": "call_0"},
+            {"name": "calculator", "args": {"expression": "1150 * 0.2"}, "call_id": "call_1"},
+        ],
+        "messages": [
+            ToolMessage(tool_call_id="call_old", name="calculator", content="4"),
+            _multi_call_message("1500 - 350", "1150 * 0.2"),
+            ToolMessage(tool_call_id="call_0", name="calculator", content="1150"),
+            ToolMessage(tool_call_id="call_1", name="calculator", content="230.0"),
+        ],
+    }
+
+    update = handle_tool_result(state)
+
+    assert update["status"] == STATUS_VALIDATED
+    assert [(run["args"]["expression"], run["result"]) for run in update["tool_runs"]] == [
+        ("1500 - 350", "1150"),
+        ("1150 * 0.2", "230.0"),
+    ]
+    assert update["last_tool_run"] == update["tool_runs"][-1]
+    assert update["metadata"]["last_tool_expression"] == "1150 * 0.2"
+    assert update["metadata"]["tool_calls_per_turn"] == [1, 2]
+    after = tool_call_stats()
+    assert (after["turns"], after["calls"]) == (before["turns"] + 1, before["calls"] + 2)
+    assert after["max_calls_per_turn"] >= 2
+
+
+def test_handle_tool_result_fails_when_any_call_fails():
+    state: GraphState = {
+        "metadata": {},
+        "pending_tool_calls": [
+            {"name": "calculator", "args": {"expression": "1 / 0"}, "call_id": "call_0"},
+            {"name": "calculator", "args": {"expression": "2 + 2"}, "call_id": "call_1"},
+        ],
+        "messages": [
+            ToolMessage(tool_call_id="call_0", name="calculator", content="Error: division by zero"),
+            ToolMessage(tool_call_id="call_1", name="calculator", content="4"),
+        ],
+    }
+
+    update = handle_tool_result(state)
+
+    assert update["status"] == STATUS_ERROR
+    assert update["tool_call"]["args"]["expression"] == "1 / 0"
+    assert update["last_tool_run"]["result"] == "4"
+
+
 def test_handle_tool_result_without_tool_message():
     plan_state: GraphState = {
         "metadata": {},
@@ -8,11 +8,14 @@ from agente_tool.utils.nodes import (
     STATUS_ERROR,
     STATUS_RESPONDED,
     STATUS_VALIDATED,
+    arithmetic_bypass_stats,
     handle_tool_result,
     finalize_response,
     format_response,
     invoke_model,
+    parse_arithmetic,
     plan_tool_usage,
+    tool_call_stats,
     validate_input,
 )
 from agente_tool.utils.tools import calculator
@@ -22,11 +25,14 @@ __all__ = [
     "STATUS_ERROR",
     "STATUS_RESPONDED",
     "STATUS_VALIDATED",
+    "arithmetic_bypass_stats",
     "handle_tool_result",
     "finalize_response",
     "format_response",
     "get_logger",
     "invoke_model",
+    "parse_arithmetic",
     "plan_tool_usage",
+    "tool_call_stats",
     "validate_input",
 ]
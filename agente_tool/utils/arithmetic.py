@@ -0,0 +1,153 @@
+"""Deterministic translation of Portuguese arithmetic questions into calculator expressions.
+
+Only phrasings that can be translated without guessing are accepted: numbers (pt-BR
+``1.500,75`` or ``2.5``), the operators ``mais``, ``menos``, ``vezes``,
+``multiplicado por``, ``dividido por``, ``elevado a`` and their symbols, parentheses
+and percentages (``20% de 150`` anywhere, a bare ``N%`` only as the last operand, as in
+``150 mais 20%``). Anything else returns ``None`` so
+the question goes to the model.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import List, Optional, Tuple
+
+from agente_tool.utils.expression import ExpressionError, compile_expression
+
+_PREFIX = re.compile(
+    r"^(?:(?:por\s+favor|me\s+(?:diga|diz|fala))[\s,]+)?"
+    r"(?:quanto\s+(?:e|da|fica|vale)|qual\s+(?:e\s+)?(?:o\s+)?(?:resultado|valor)\s+(?:de|da|do)"
+    r"|calcule|calcula|calcular|resolva)\b[\s:,]*"
+)
+_SUFFIX = re.compile(r"[\s?!.]+$")
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:r\$\s*)?(?:\d{1,3}(?:\.\d{3})+(?:,\d+)?|\d+(?:[.,]\d+)?))"
+    r"|(?P<percent>%|por\s+cento\b)"
+    r"|(?P<of>de\b)"
+    r"|(?P<operator>\*\*|\^|elevado\s+(?:a|ao|na)\b|multiplicado\s+por\b|vezes\b|x|[*×]"
+    r"|dividido\s+por\b|[/÷]|mais\b|\+|menos\b|-)"
+    r"|(?P<paren>[()])"
+    r")"
+)
+_OPERATORS = {
+    "**": "**",
+    "^": "**",
+    "elevado a": "**",
+    "elevado ao": "**",
+    "elevado na": "**",
+    "multiplicado por": "*",
+    "vezes": "*",
+    "x": "*",
+    "*": "*",
+    "×": "*",
+    "dividido por": "/",
+    "/": "/",
+    "÷": "/",
+    "mais": "+",
+    "+": "+",
+    "menos": "-",
+    "-": "-",
+}
+
+Token = Tuple[str, str]
+
+
+def _normalize_question(question: str) -> str:
+    """Lowercase, drop accents, courtesy prefixes and trailing punctuation."""
+
+    text = unicodedata.normalize("NFKD", question.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = " ".join(text.split())
+    text = _PREFIX.sub("", text)
+    return _SUFFIX.sub("", text)
+
+
+def _python_number(raw: str) -> str:
+    """Convert a pt-BR number (``1.500,75``, ``2,5``) or a dotted decimal to a Python literal."""
+
+    digits = re.sub(r"^r\$\s*", "", raw)
+    if "," in digits:
+        return digits.replace(".", "").replace(",", ".")
+    if re.fullmatch(r"\d{1,3}(?:\.\d{3})+", digits):
+        return digits.replace(".", "")
+    return digits
+
+
+def _tokenize(text: str) -> Optional[List[Token]]:
+    tokens: List[Token] = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            return None
+        kind = match.lastgroup or ""
+        value = " ".join(match.group(kind).split())
+        if kind == "number":
+            value = _python_number(value)
+        elif kind == "operator":
+            value = _OPERATORS[value]
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+def _build_expression(tokens: List[Token]) -> Optional[str]:
+    """Assemble the expression, resolving percentages; ``None`` when ambiguous."""
+
+    parts: List[str] = []
+    index = 0
+    while index < len(tokens):
+        kind, value = tokens[index]
+        if kind == "number" and index + 1 < len(tokens) and tokens[index + 1][0] == "percent":
+            if index + 3 < len(tokens) and tokens[index + 2][0] == "of" and tokens[index + 3][0] == "number":
+                parts.append(f"({value} / 100 * {tokens[index + 3][1]})")
+                index += 4
+                continue
+            if index + 2 != len(tokens):
+                # A bare percentage mid-expression could mean a fraction or an increase.
+                return None
+            if len(parts) >= 2 and parts[-1] in ("+", "-"):
+                operator = parts.pop()
+                return f"({' '.join(parts)}) * (1 {operator} {value} / 100)"
+            parts.append(f"({value} / 100)")
+            index += 2
+            continue
+        if kind in ("percent", "of"):
+            return None
+        parts.append(value)
+        index += 1
+    return " ".join(parts)
+
+
+def translate_question(question: str) -> Optional[str]:
+    """Return a calculator expression for ``question`` or ``None`` when not confident."""
+
+    tokens = _tokenize(_normalize_question(question))
+    if not tokens or not any(kind in ("operator", "percent") for kind, _ in tokens):
+        return None
+    expression = _build_expression(tokens)
+    if expression is None:
+        return None
+    try:
+        compile_expression(expression)
+    except ExpressionError:
+        return None
+    return expression
+
+
+def format_result(result: str) -> str:
+    """Render a calculator result in pt-BR (``75.0`` → ``75``, ``0.5`` → ``0,5``)."""
+
+    try:
+        number = float(result)
+    except ValueError:
+        return result
+    if number.is_integer() and abs(number) < 1e15:
+        return str(int(number))
+    return result.replace(".", ",") if "e" not in result and "inf" not in result else result
+
+
+__all__ = ["format_result", "translate_question"]
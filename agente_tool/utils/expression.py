@@ -0,0 +1,189 @@
+"""Safe arithmetic expression engine backing the calculator tool.
+
+Expressions are parsed once with :mod:`ast`, validated against a small whitelist and
+compiled into a tree of closures. Compiled expressions are kept in an LRU cache keyed
+by the whitespace-normalized text, so repeated tool calls skip parsing entirely.
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+import operator
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Union
+
+Number = Union[int, float]
+Evaluator = Callable[[], Number]
+
+MAX_EXPRESSION_LENGTH = 1_000
+MAX_EXPRESSION_NODES = 200
+EXPRESSION_CACHE_SIZE = 512
+# Integer results wider than ``str`` can print are rejected before being computed.
+MAX_INTEGER_DIGITS = sys.get_int_max_str_digits() or 4_300
+# ``round`` beyond this many digits is a no-op for floats but costs ``10**ndigits`` for ints.
+MAX_ROUND_NDIGITS = 350
+# Three-argument ``pow`` costs grow with the exponent and modulus sizes, not the result's.
+MAX_MODULAR_DIGITS = 300
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is malformed, unsupported or too expensive."""
+
+
+def _integer_digits(value: Number) -> float:
+    """Approximate number of decimal digits of the integer part of ``value``."""
+
+    return math.log10(abs(value)) + 1 if value else 1.0
+
+
+def safe_power(base: Number, exponent: Number, modulus: int | None = None) -> Number:
+    """``pow`` that refuses integer results too large to print, at constant cost."""
+
+    if modulus is not None:
+        if any(
+            isinstance(value, int) and _integer_digits(value) > MAX_MODULAR_DIGITS
+            for value in (base, exponent, modulus)
+        ):
+            raise ExpressionError(f"pow modular aceita no máximo {MAX_MODULAR_DIGITS} dígitos.")
+        return pow(base, exponent, modulus)
+    if (
+        isinstance(base, int)
+        and isinstance(exponent, int)
+        and exponent > 0
+        and abs(base) > 1
+        and exponent * math.log10(abs(base)) >= MAX_INTEGER_DIGITS
+    ):
+        raise ExpressionError(f"Resultado excede {MAX_INTEGER_DIGITS} dígitos.")
+    return base**exponent
+
+
+def safe_round(number: Number, ndigits: int | None = None) -> Number:
+    """``round`` that refuses ``ndigits`` large enough to make integer rounding expensive."""
+
+    if ndigits is not None and isinstance(ndigits, int) and abs(ndigits) > MAX_ROUND_NDIGITS:
+        raise ExpressionError(f"round aceita no máximo {MAX_ROUND_NDIGITS} casas.")
+    return round(number, ndigits)
+
+
+def _safe_multiply(left: Number, right: Number) -> Number:
+    if (
+        isinstance(left, int)
+        and isinstance(right, int)
+        and _integer_digits(left) + _integer_digits(right) > MAX_INTEGER_DIGITS + 1
+    ):
+        raise ExpressionError(f"Resultado excede {MAX_INTEGER_DIGITS} dígitos.")
+    return left * right
+
+
+_BINARY_OPERATORS: Dict[type, Callable[[Number, Number], Number]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: _safe_multiply,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: safe_power,
+}
+_UNARY_OPERATORS: Dict[type, Callable[[Number], Number]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Builtins that ``eval`` exposed to the legacy calculator and that stay available.
+_FUNCTIONS: Dict[str, Callable[..., Number]] = {
+    "abs": abs,
+    "float": float,
+    "int": int,
+    "max": max,
+    "min": min,
+    "pow": safe_power,
+    "round": safe_round,
+}
+
+
+def _compile_node(node: ast.AST) -> Evaluator:
+    """Translate a validated AST node into a closure computing its value."""
+
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        return lambda: value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        apply_binary = _BINARY_OPERATORS[type(node.op)]
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda: apply_binary(left(), right())
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        apply_unary = _UNARY_OPERATORS[type(node.op)]
+        operand = _compile_node(node.operand)
+        return lambda: apply_unary(operand())
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and not node.keywords
+    ):
+        function = _FUNCTIONS[node.func.id]
+        arguments = tuple(_compile_node(argument) for argument in node.args)
+        return lambda: function(*(argument() for argument in arguments))
+    if isinstance(node, ast.Name):
+        raise ExpressionError(f"name '{node.id}' is not defined")
+    raise ExpressionError(f"Elemento não suportado na expressão: {type(node).__name__}.")
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """A parsed and validated expression, ready to be evaluated repeatedly."""
+
+    source: str
+    evaluate: Evaluator
+
+    def __call__(self) -> Number:
+        return self.evaluate()
+
+
+def normalize_expression(expression: str) -> str:
+    """Collapse whitespace runs so equivalent spellings share a cache entry."""
+
+    return " ".join(str(expression).split())
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized(source: str) -> CompiledExpression:
+    if len(source) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"Expressão maior que {MAX_EXPRESSION_LENGTH} caracteres.")
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as exc:
+        raise ExpressionError(str(exc)) from exc
+    if sum(1 for _ in ast.walk(tree)) > MAX_EXPRESSION_NODES:
+        raise ExpressionError(f"Expressão com mais de {MAX_EXPRESSION_NODES} elementos.")
+    return CompiledExpression(source=source, evaluate=_compile_node(tree.body))
+
+
+def compile_expression(expression: str) -> CompiledExpression:
+    """Return the compiled form of ``expression`` (cached by normalized text)."""
+
+    return _compile_normalized(normalize_expression(expression))
+
+
+def evaluate_expression(expression: str) -> Number:
+    """Compile (or reuse) and evaluate ``expression``."""
+
+    result = compile_expression(expression)()
+    if isinstance(result, int) and _integer_digits(result) > MAX_INTEGER_DIGITS:
+        raise ExpressionError(f"Resultado excede {MAX_INTEGER_DIGITS} dígitos.")
+    return result
+
+
+__all__ = [
+    "CompiledExpression",
+    "ExpressionError",
+    "MAX_EXPRESSION_LENGTH",
+    "compile_expression",
+    "evaluate_expression",
+    "normalize_expression",
+    "safe_power",
+    "safe_round",
+]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
@@ -16,7 +17,9 @@ from langchain_core.messages import (
 
 from agente_tool.config import AppConfig, ConfigurationError, config as default_config
 from agente_tool.state import GraphState, ToolPlan
+from agente_tool.utils.arithmetic import format_result, translate_question
 from agente_tool.utils.logging import get_logger
+from agente_tool.utils.tools import calculator
 
 logger = get_logger(__name__)
 
@@ -72,6 +75,15 @@ STATUS_ERROR = "error"
 
 _QUESTION_MIN_LENGTH = 5
 _TOOL_NAME = "calculator"
+_TOOL_ERROR_MESSAGE = (
+    "Não consegui processar essa expressão matemática. "
+    "Revise a operação e tente novamente."
+)
+
+_bypass_lock = threading.Lock()
+_bypass_counts = {"questions": 0, "bypassed": 0}
+_tool_turn_lock = threading.Lock()
+_tool_turn_counts = {"turns": 0, "calls": 0, "max_calls_per_turn": 0}
 
 
 def _clean_content(message: BaseMessage | Dict[str, Any]) -> str:
@@ -144,6 +156,88 @@ def validate_input(state: GraphState) -> Dict[str, Any]:
     }
 
 
+def arithmetic_bypass_stats() -> Dict[str, float]:
+    """Return how many questions reached ``parse_arithmetic`` and how many skipped the model."""
+
+    with _bypass_lock:
+        questions = _bypass_counts["questions"]
+        bypassed = _bypass_counts["bypassed"]
+    return {
+        "questions": questions,
+        "bypassed": bypassed,
+        "bypass_rate": bypassed / questions if questions else 0.0,
+    }
+
+
+def _record_bypass(bypassed: bool) -> float:
+    with _bypass_lock:
+        _bypass_counts["questions"] += 1
+        _bypass_counts["bypassed"] += int(bypassed)
+        return _bypass_counts["bypassed"] / _bypass_counts["questions"]
+
+
+def parse_arithmetic(
+    state: GraphState,
+    *,
+    app_config: AppConfig | None = None,
+) -> Dict[str, Any]:
+    """Answer plain arithmetic questions with the calculator, skipping the model when confident."""
+
+    app_config = app_config or default_config
+    metadata = dict(state.get("metadata", {}))
+    expression = (
+        translate_question(metadata.get("question", ""))
+        if app_config.arithmetic_bypass
+        else None
+    )
+    bypass_rate = _record_bypass(expression is not None)
+    metadata["arithmetic_bypass"] = expression is not None
+
+    if expression is None:
+        logger.info(
+            "Pergunta encaminhada ao modelo",
+            extra={"bypass_rate": round(bypass_rate, 4)},
+        )
+        return {"metadata": metadata}
+
+    result = str(calculator.invoke({"expression": expression}))
+    metadata["last_tool_result"] = result
+    metadata["last_tool_expression"] = expression
+    metadata["last_tool_name"] = _TOOL_NAME
+    metadata["last_tool_call_id"] = None
+    run_record = {
+        "name": _TOOL_NAME,
+        "args": {"expression": expression},
+        "result": result,
+        "call_id": None,
+    }
+    logger.info(
+        "Pergunta aritmética resolvida sem o modelo",
+        extra={"tool_args": run_record["args"], "result": result, "bypass_rate": round(bypass_rate, 4)},
+    )
+
+    update: Dict[str, Any] = {
+        "metadata": metadata,
+        "selected_tool": _TOOL_NAME,
+        "tool_plan": None,
+        "pending_tool_calls": [],
+        "tool_runs": [run_record],
+        "tool_call": run_record,
+        "last_tool_run": run_record,
+    }
+    if result.strip().lower().startswith("error"):
+        run_record["error"] = result
+        update["status"] = STATUS_ERROR
+        update["resposta"] = _TOOL_ERROR_MESSAGE
+        return update
+
+    answer = f"Calculando {expression}, o resultado é **{format_result(result)}**."
+    update["messages"] = [AIMessage(content=answer)]
+    update["status"] = STATUS_RESPONDED
+    update["resposta"] = answer
+    return update
+
+
 def plan_tool_usage(state: GraphState) -> Dict[str, Any]:
     """Inspect the latest model output and prepare a tool plan if requested."""
 
@@ -168,15 +262,14 @@ def plan_tool_usage(state: GraphState) -> Dict[str, Any]:
             "pending_tool_calls": [],
         }
 
-    call = tool_calls[0]
-    tool_name = call.get("name")
-    if tool_name != _TOOL_NAME:
+    unknown = sorted({str(call.get("name")) for call in tool_calls if call.get("name") != _TOOL_NAME})
+    if unknown:
         logger.warning(
             "Ferramenta desconhecida solicitada pelo modelo",
-            extra={"tool": tool_name},
+            extra={"tool": ", ".join(unknown)},
         )
         return {
-            "selected_tool": tool_name,
+            "selected_tool": unknown[0],
             "tool_plan": None,
             "pending_tool_calls": [],
             "status": STATUS_ERROR,
@@ -186,95 +279,140 @@ def plan_tool_usage(state: GraphState) -> Dict[str, Any]:
             ),
         }
 
-    plan: ToolPlan = {
-        "name": tool_name,
-        "args": call.get("args", {}),
-        "call_id": call.get("id"),
-    }
-
     pending_calls: List[Dict[str, Any]] = [
         {
-            "name": tool_name,
+            "name": _TOOL_NAME,
             "args": call.get("args", {}),
             "call_id": call.get("id"),
         }
         for call in tool_calls
     ]
+    plan: ToolPlan = {
+        "name": _TOOL_NAME,
+        "args": pending_calls[0]["args"],
+        "call_id": pending_calls[0]["call_id"],
+    }
 
     logger.info(
         "Plano de ferramenta detectado",
-        extra={"tool": tool_name, "tool_args": plan["args"]},
+        extra={
+            "tool": _TOOL_NAME,
+            "tool_args": [call["args"] for call in pending_calls],
+            "tool_calls": len(pending_calls),
+        },
     )
     return {
-        "selected_tool": tool_name,
+        "selected_tool": _TOOL_NAME,
         "tool_plan": plan,
         "pending_tool_calls": pending_calls,
     }
 
 
+def tool_call_stats() -> Dict[str, float]:
+    """Return how many tool turns ran, how many calls they carried and the per-turn average."""
+
+    with _tool_turn_lock:
+        turns = _tool_turn_counts["turns"]
+        calls = _tool_turn_counts["calls"]
+        widest = _tool_turn_counts["max_calls_per_turn"]
+    return {
+        "turns": turns,
+        "calls": calls,
+        "max_calls_per_turn": widest,
+        "calls_per_turn": calls / turns if turns else 0.0,
+    }
+
+
+def _record_tool_turn(calls: int) -> None:
+    with _tool_turn_lock:
+        _tool_turn_counts["turns"] += 1
+        _tool_turn_counts["calls"] += calls
+        _tool_turn_counts["max_calls_per_turn"] = max(_tool_turn_counts["max_calls_per_turn"], calls)
+
+
+def _current_tool_messages(messages: List[BaseMessage]) -> List[ToolMessage]:
+    """Return the ToolMessages produced by the latest ToolNode run, in call order."""
+
+    current: List[ToolMessage] = []
+    for message in reversed(messages):
+        if not isinstance(message, ToolMessage):
+            break
+        current.append(message)
+    return current[::-1]
+
+
 def handle_tool_result(state: GraphState) -> Dict[str, Any]:
-    """Process the latest ToolNode output and update the agent state accordingly."""
+    """Process every ToolMessage of the latest ToolNode run and update the agent state."""
 
     messages = state.get("messages") or []
-    tool_messages = [msg for msg in messages if isinstance(msg, ToolMessage)]
+    tool_messages = _current_tool_messages(messages)
     if not tool_messages:
         logger.error(
             "ToolNode executado, mas nenhuma mensagem de ferramenta foi encontrada."
         )
         return {
             "status": STATUS_ERROR,
-            "resposta": (
-                "Não consegui processar essa expressão matemática. "
-                "Revise a operação e tente novamente."
-            ),
+            "resposta": _TOOL_ERROR_MESSAGE,
         }
 
-    last_tool_message = tool_messages[-1]
-    content = _clean_content(last_tool_message)
     plan: Optional[ToolPlan] = state.get("tool_plan")
-    tool_name = last_tool_message.name or (plan or {}).get("name") or _TOOL_NAME
-    expression = (plan or {}).get("args", {}).get("expression")
-
-    metadata = dict(state.get("metadata", {}))
-    metadata["last_tool_result"] = content
-    metadata["last_tool_expression"] = expression
-    metadata["last_tool_name"] = tool_name
-    metadata["last_tool_call_id"] = getattr(last_tool_message, "tool_call_id", None)
-
-    run_record = {
-        "name": tool_name,
-        "args": (plan or {}).get("args", {}),
-        "result": content,
-        "call_id": getattr(last_tool_message, "tool_call_id", None),
+    planned_calls = {
+        call.get("call_id"): call
+        for call in [*(state.get("pending_tool_calls") or []), *([plan] if plan else [])]
     }
+    runs: List[Dict[str, Any]] = []
+    for tool_message in tool_messages:
+        call_id = getattr(tool_message, "tool_call_id", None)
+        planned = planned_calls.get(call_id) or (plan if len(tool_messages) == 1 else None) or {}
+        content = _clean_content(tool_message)
+        run_record: Dict[str, Any] = {
+            "name": tool_message.name or planned.get("name") or _TOOL_NAME,
+            "args": planned.get("args", {}),
+            "result": content,
+            "call_id": call_id,
+        }
+        if content.strip().lower().startswith("error"):
+            run_record["error"] = content
+        runs.append(run_record)
 
+    last_run = runs[-1]
+    metadata = dict(state.get("metadata", {}))
+    metadata["last_tool_result"] = last_run["result"]
+    metadata["last_tool_expression"] = last_run["args"].get("expression")
+    metadata["last_tool_name"] = last_run["name"]
+    metadata["last_tool_call_id"] = last_run["call_id"]
+    metadata["tool_calls_per_turn"] = [*metadata.get("tool_calls_per_turn", []), len(runs)]
+    _record_tool_turn(len(runs))
+
+    failed = [run for run in runs if "error" in run]
     update: Dict[str, Any] = {
         "metadata": metadata,
-        "selected_tool": tool_name,
+        "selected_tool": last_run["name"],
         "tool_plan": None,
         "pending_tool_calls": [],
-        "tool_call": run_record,
-        "last_tool_run": run_record,
+        "tool_runs": runs,
+        "tool_call": failed[0] if failed else last_run,
+        "last_tool_run": last_run,
     }
 
-    if content.strip().lower().startswith("error"):
+    if failed:
         logger.warning(
             "Ferramenta retornou erro controlado.",
-            extra={"tool": tool_name, "result": content},
+            extra={"tool": failed[0]["name"], "result": failed[0]["result"], "tool_calls": len(runs)},
         )
         update["status"] = STATUS_ERROR
-        update["resposta"] = (
-            "Não consegui processar essa expressão matemática. "
-            "Revise a operação e tente novamente."
-        )
-        update["tool_call"]["error"] = content
+        update["resposta"] = _TOOL_ERROR_MESSAGE
     else:
         logger.info(
             "Ferramenta executada com sucesso",
-            extra={"tool": tool_name, "result": content},
+            extra={
+                "tool": last_run["name"],
+                "result": [run["result"] for run in runs] if len(runs) > 1 else last_run["result"],
+                "tool_calls": len(runs),
+            },
         )
         update["status"] = STATUS_VALIDATED
-        update["resposta"] = content
+        update["resposta"] = "\n".join(run["result"] for run in runs)
 
     return update
 
@@ -466,10 +604,13 @@ __all__ = [
     "STATUS_ERROR",
     "STATUS_RESPONDED",
     "STATUS_VALIDATED",
+    "arithmetic_bypass_stats",
     "handle_tool_result",
     "finalize_response",
     "format_response",
     "invoke_model",
+    "parse_arithmetic",
     "plan_tool_usage",
+    "tool_call_stats",
     "validate_input",
 ]
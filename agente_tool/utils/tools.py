@@ -4,16 +4,17 @@ from __future__ import annotations
 
 from langchain.tools import tool
 
+from agente_tool.utils.expression import evaluate_expression
+
 
 @tool("calculator", description="Performs arithmetic calculations. Use this for any math problems.")
 def calculator(expression: str) -> str:
-    """Evaluate mathematical expressions using Python's eval, mirroring the legacy behavior."""
+    """Evaluate arithmetic expressions with the compiled engine (same results as the legacy eval)."""
 
     try:
-        result = eval(expression)
-    except Exception as exc:  # noqa: S307 - intencional para compatibilidade legada
+        return str(evaluate_expression(expression))
+    except Exception as exc:  # noqa: BLE001 - erros viram texto para o modelo
         return f"Error: {exc}"
-    return str(result)
 
 
 __all__ = ["calculator"]